@@ -1,6 +1,28 @@
-from fsm_tester.fsm_tester import FSMTester
-from fsm_tester.entities.fsm_protocol import FSMProtocol
-from fsm_tester.typing import DIALECTS
+__version__ = '0.1.0'
 
+from importlib import import_module
 
-__all__ = ['FSMTester', 'FSMProtocol', 'DIALECTS']
+
+# The public names are resolved on first access, so that `import fsm_tester`
+# does not pull the graph, console and FSM libraries in.
+_LAZY_ATTRIBUTES = {
+    'FSMTester': 'fsm_tester.fsm_tester',
+    'FSMProtocol': 'fsm_tester.entities.fsm_protocol',
+    'DIALECTS': 'fsm_tester.typing',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_ATTRIBUTES))
+
+
+# resolved by __getattr__
+__all__ = ['FSMTester', 'FSMProtocol', 'DIALECTS']  # noqa: F822
@@ -1,3 +1,4 @@
+import copy
 from abc import ABC, abstractmethod
 from fsm_tester.entities import (
     FSMProtocol,
@@ -5,8 +6,11 @@ from fsm_tester.entities import (
     FSMTransition,
     TestCase,
 )
-from typing import List, Union
-from networkx import MultiDiGraph, MultiGraph
+from fsm_tester.components.compact_graph import CompactGraph
+from typing import Any, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from networkx import MultiDiGraph, MultiGraph
 
 
 class BaseAdapter(ABC):
@@ -14,6 +18,7 @@ class BaseAdapter(ABC):
     def __init__(self, fsm: FSMProtocol):
         if not self.__assert_is_valid_fsm(fsm):
             raise ValueError("Invalid FSM provided.")
+        self.fsm_class = fsm
         self.fsm = fsm()
 
     def __assert_is_valid_fsm(self, fsm: FSMProtocol) -> bool:
@@ -65,9 +70,64 @@ class BaseAdapter(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def get_source_index(self) -> Dict[str, List[FSMTransition]]:
+        """Returns the transitions of the FSM grouped by source state. Wildcard
+        and list sources are expanded, so every transition in the index has a
+        single state name as source.
+
+        Returns:
+            Dict[str, List[FSMTransition]]: The transitions leaving each
+                state.
+        """
+        raise NotImplementedError
+
+    def get_transitions_from(self, source: str) -> List[FSMTransition]:
+        """Returns the transitions leaving the given state.
+
+        Args:
+            source (str): The source state.
+
+        Returns:
+            List[FSMTransition]: The transitions leaving `source`.
+        """
+        return self.get_source_index().get(source, list())
+
+    @abstractmethod
+    def get_transition_index(
+        self,
+    ) -> Dict[Tuple[str, Optional[str]], List[FSMTransition]]:
+        """Returns the transitions of the FSM grouped by (source, dest) pair,
+        built once from the source index. Internal transitions have None as
+        destination.
+
+        Returns:
+            Dict[Tuple[str, Optional[str]], List[FSMTransition]]: The
+                transitions between each pair of states, in declaration order.
+        """
+        raise NotImplementedError
+
+    def get_transitions_between(
+        self,
+        source: str,
+        dest: str,
+    ) -> List[FSMTransition]:
+        """Returns every transition from source to dest.
+
+        Args:
+            source (str): The source state of the transitions.
+            dest (str): The destination state of the transitions.
+
+        Returns:
+            List[FSMTransition]: The transitions from `source` to `dest`.
+        """
+        return self.get_transition_index().get((source, dest), list())
+
     @abstractmethod
     def get_transition(self, source: str, dest: str) -> FSMTransition:
-        """Returns the transition from source to dest.
+        """Returns the transition from source to dest. When several
+        transitions connect the two states, the first one declared is
+        returned.
 
         Args:
             source (str): The source state of the transition.
@@ -98,6 +158,28 @@ class BaseAdapter(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def get_guards(self) -> set:
+        """Returns the names of the guard methods of the FSM, the
+        `conditions` and `unless` of its transitions. Guards are part of
+        `get_methods`.
+
+        Returns:
+            set: The names of the guard methods.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_callbacks(self) -> Dict[str, set]:
+        """Returns the names of the model methods the FSM library calls
+        around a transition, by kind of callback: `prepare`, `before`,
+        `on_exit`, `on_enter` and `after`.
+
+        Returns:
+            Dict[str, set]: The callback names of each kind.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def mimic_attributes(self, callback: callable) -> set:
         """Reading the FSM implementation, returns the attributes that are not
@@ -114,14 +196,45 @@ class BaseAdapter(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def get_graph(self) -> Union[MultiGraph, MultiDiGraph]:
-        """Returns the graph representation of the FSM.
+    def get_graph(
+        self,
+        from_dot: bool = False,
+    ) -> Union['MultiGraph', 'MultiDiGraph']:
+        """Returns the graph representation of the FSM. By default the graph
+        is built in memory from the machine definition.
+
+        Args:
+            from_dot (bool): If True, build the graph by rendering the machine
+                to DOT source and parsing it back instead. Defaults to False.
 
         Returns:
             DiGraph: The graph representation of the FSM.
         """
         raise NotImplementedError
 
+    def get_compact_graph(self, from_dot: bool = False) -> CompactGraph:
+        """Returns the integer indexed (CSR) representation of the FSM graph,
+        used by the analysis suites. Adapters may override it to skip the
+        intermediate NetworkX graph.
+
+        Args:
+            from_dot (bool): Forwarded to `get_graph`. Defaults to False.
+
+        Returns:
+            CompactGraph: The compact graph representation of the FSM.
+        """
+        return CompactGraph.from_networkx(self.get_graph(from_dot=from_dot))
+
+    @abstractmethod
+    def get_trigger_functions(self) -> Dict[str, callable]:
+        """Returns the trigger functions of the FSM, resolved once, keyed by
+        trigger name.
+
+        Returns:
+            Dict[str, callable]: The function firing each trigger.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def get_transition_function(self, transition: FSMTransition) -> callable:
         """Returns the transition function for the given transition.
@@ -138,3 +251,58 @@ class BaseAdapter(ABC):
     def reset_fsm(self) -> None:
         """Resets the FSM to the initial state."""
         raise NotImplementedError
+
+    def create_fsm(self) -> Any:
+        """Builds a new instance of the FSM model, in its initial state.
+
+        Returns:
+            Any: The new FSM model.
+        """
+        return self.fsm_class()
+
+    def is_runtime_attribute(self, name: str, value: Any) -> bool:
+        """Tells whether an attribute of the FSM model belongs to the FSM
+        library rather than to the data of the model. Runtime attributes are
+        bound to their model instance, and are never copied between models.
+
+        Args:
+            name (str): The name of the attribute.
+            value (Any): The value of the attribute.
+
+        Returns:
+            bool: True for runtime attributes. Defaults to every callable.
+        """
+        return callable(value)
+
+    def snapshot_fsm(self) -> Any:
+        """Returns a snapshot of the FSM model, to be restored later with
+        `restore_fsm`. The default snapshot keeps the runtime attributes of
+        the model, and a deep copy of its data attributes, so that changes
+        made to mutable attributes after the snapshot do not leak into it.
+
+        Returns:
+            Any: The snapshot of the FSM model.
+        """
+        runtime = dict()
+        data = dict()
+        for name, value in vars(self.fsm).items():
+            if self.is_runtime_attribute(name, value):
+                runtime[name] = value
+            else:
+                data[name] = value
+        # attributes pointing back at the model keep pointing at it
+        return runtime, copy.deepcopy(data, {id(self.fsm): self.fsm})
+
+    def restore_fsm(self, snapshot: Any) -> None:
+        """Restores a snapshot taken with `snapshot_fsm` into the FSM model.
+        The data attributes are copied again, so the snapshot can be
+        restored any number of times.
+
+        Args:
+            snapshot (Any): The snapshot to restore.
+        """
+        runtime, data = snapshot
+        attributes = vars(self.fsm)
+        attributes.clear()
+        attributes.update(runtime)
+        attributes.update(copy.deepcopy(data, {id(self.fsm): self.fsm}))
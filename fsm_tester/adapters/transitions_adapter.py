@@ -5,10 +5,8 @@ from fsm_tester.adapters.base_adapter import (
     FSMTransition,
     TestCase,
 )
-import networkx as nx
-from tempfile import NamedTemporaryFile
-from transitions import State
-from typing import List
+from fsm_tester.components.compact_graph import CompactGraph
+from typing import Dict, List, Optional, Tuple
 
 
 class TransitionsAdapter(BaseAdapter):
@@ -16,6 +14,10 @@ class TransitionsAdapter(BaseAdapter):
     def __init__(self, fsm):
         super().__init__(fsm)
         self.__initial_state = self.fsm.machine.initial
+        self.__source_index = self.__build_source_index()
+        self.__transition_index = self.__build_transition_index()
+        self.__trigger_model = self.fsm
+        self.__trigger_functions = self.__build_trigger_functions()
 
     @property
     def initial_state(self) -> str:
@@ -29,30 +31,30 @@ class TransitionsAdapter(BaseAdapter):
 
     def get_test_cases(self):
         # documentation provided by base_adapter.py
-        transitions = self.fsm.transitions
+        # the source index has wildcard and list sources already expanded
         test_cases = []
-        for tr in transitions:
-            source = tr['source']
-            dest = tr['dest']
-            trigger = tr['trigger']
-            conditions = tr.get('conditions', None)
-            unless = tr.get('unless', None)
-
-            name = f"{source} -> {dest} by {trigger}"
-            test_case = TestCase(
-                name=name,
-                source=source,
-                dest=dest,
-                trigger=trigger,
-                condition=conditions,
-                unless=unless,
-            )
+        for source, fsm_transitions in self.get_source_index().items():
+            for tr in fsm_transitions:
+                dest = tr.destination
+                trigger = tr.name
+
+                name = f"{source} -> {dest} by {trigger}"
+                test_case = TestCase(
+                    name=name,
+                    source=source,
+                    dest=dest,
+                    trigger=trigger,
+                    condition=tr.conditions,
+                    unless=tr.unless,
+                )
 
-            test_cases.append(test_case)
+                test_cases.append(test_case)
         return test_cases
 
     def get_states(self) -> List[FSMState]:
         # documentation provided by base_adapter.py
+        from transitions import State  # noqa: PLC0415
+
         states = self.fsm.states
         fsm_states = []
         for state in states:
@@ -116,44 +118,111 @@ class TransitionsAdapter(BaseAdapter):
             fsm_transitions.append(fsm_transition)
         return fsm_transitions
 
+    def __build_source_index(self) -> Dict[str, List[FSMTransition]]:
+        """Normalize the declared transitions once, expanding wildcard and
+        list sources, into the transitions leaving each state.
+        """
+        states = self.__state_names()
+        source_index = {state: list() for state in states}
+        for fsm_transition in self.get_transitions():
+            for expanded in fsm_transition.expand(states):
+                source_index.setdefault(expanded.source, list()).append(
+                    expanded,
+                )
+        return source_index
+
+    def get_source_index(self) -> Dict[str, List[FSMTransition]]:
+        # documentation provided by base_adapter.py
+        return self.__source_index
+
+    def __build_transition_index(
+        self,
+    ) -> Dict[Tuple[str, Optional[str]], List[FSMTransition]]:
+        """Group the transitions of the source index by (source, dest)."""
+        transition_index = dict()
+        for source, fsm_transitions in self.__source_index.items():
+            for fsm_transition in fsm_transitions:
+                transition_index.setdefault(
+                    (source, fsm_transition.destination),
+                    list(),
+                ).append(fsm_transition)
+        return transition_index
+
+    def get_transition_index(
+        self,
+    ) -> Dict[Tuple[str, Optional[str]], List[FSMTransition]]:
+        # documentation provided by base_adapter.py
+        return self.__transition_index
+
     def get_transition(self, source: str, dest: str) -> FSMTransition:
         # documentation provided by base_adapter.py
-        transitions = self.fsm.transitions
-        for tr in transitions:
-            if tr['source'] == source and tr['dest'] == dest:
-                fsm_transition = self.create_fsm_transition(tr)
-                return fsm_transition
+        fsm_transitions = self.__transition_index.get((source, dest))
+        if fsm_transitions:
+            return fsm_transitions[0]
+
+    @staticmethod
+    def __callback_names(callbacks) -> List[str]:
+        """Normalize declared callbacks into the names of model methods.
+        pytransitions accepts a single name instead of a list, and callables
+        are not methods of the model."""
+        if callbacks is None:
+            return list()
+        if isinstance(callbacks, str) or callable(callbacks):
+            callbacks = [callbacks]
+        return [
+            callback for callback in callbacks if isinstance(callback, str)
+        ]
 
     def __get_state_methods(self):
         state_methods = set()
         for state in self.fsm.states:
-            on_enter = state.get('on_enter', None)
-            on_exit = state.get('on_exit', None)
-            if on_enter is not None:
-                for callback in on_enter:
-                    state_methods.add(callback)
-            if on_exit is not None:
-                for callback in on_exit:
-                    state_methods.add(callback)
+            if isinstance(state, str):
+                continue
+            state_methods.update(
+                self.__callback_names(state.get('on_enter', None)),
+            )
+            state_methods.update(
+                self.__callback_names(state.get('on_exit', None)),
+            )
         return state_methods
 
-    def __get_transition_methods(self):
-        transition_methods = set()
+    def get_guards(self) -> set:
+        # documentation provided by base_adapter.py
+        guards = set()
         for transition in self.fsm.transitions:
-            conditions = transition.get('conditions', None)
-            unless = transition.get('unless', None)
-            if conditions is not None:
-                for condition in conditions:
-                    transition_methods.add(condition)
-            if unless is not None:
-                for condition in unless:
-                    transition_methods.add(condition)
-        return transition_methods
+            guards.update(
+                self.__callback_names(transition.get('conditions', None)),
+            )
+            guards.update(
+                self.__callback_names(transition.get('unless', None)),
+            )
+        return guards
+
+    def get_callbacks(self) -> Dict[str, set]:
+        # documentation provided by base_adapter.py
+        machine = self.fsm.machine
+        callbacks = {
+            kind: set()
+            for kind in ['prepare', 'before', 'on_exit', 'on_enter', 'after']
+        }
+        for state in machine.states.values():
+            callbacks['on_enter'].update(
+                self.__callback_names(state.on_enter),
+            )
+            callbacks['on_exit'].update(self.__callback_names(state.on_exit))
+        for event in machine.events.values():
+            for transitions in event.transitions.values():
+                for transition in transitions:
+                    for kind in ['prepare', 'before', 'after']:
+                        callbacks[kind].update(
+                            self.__callback_names(getattr(transition, kind)),
+                        )
+        return callbacks
 
     def get_methods(self) -> set:
         # documentation provided by base_adapter.py
         state_methods = self.__get_state_methods()
-        transition_methods = self.__get_transition_methods()
+        transition_methods = self.get_guards()
         return state_methods.union(transition_methods)
 
     def __runtime_evaluators(self, runtime_methods: set):
@@ -194,28 +263,108 @@ class TransitionsAdapter(BaseAdapter):
                 stolen_methods.add(attribute)
         return stolen_methods
 
-    def get_graph(self):
-        # TODO: alter dotfile with conditions and logic
-        with NamedTemporaryFile(mode='wt', delete_on_close=False) as fp:
-            fp.write(self.fsm.get_graph().source)
-            fp.close()
+    def __state_names(self) -> List[str]:
+        return [state.name for state in self.get_states()]
+
+    def __graph_from_dot(self):
+        """Build the graph by rendering the machine to DOT source and parsing
+        it back with pydot. Slower than the native builder, kept as a fallback
+        for machines whose declared transitions are not a faithful picture of
+        the runtime graph.
+        """
+        import networkx as nx  # noqa: PLC0415
+        import pydot  # noqa: PLC0415
+
+        dot_graph, = pydot.graph_from_dot_data(self.fsm.get_graph().source)
+        return nx.drawing.nx_pydot.from_pydot(dot_graph)
 
-            graph = nx.drawing.nx_pydot.read_dot(fp.name)
+    def __iter_edges(self):
+        """Iterate over the transitions of the source index as
+        (source, dest, trigger) edges.
+        """
+        for source, fsm_transitions in self.__source_index.items():
+            for fsm_transition in fsm_transitions:
+                if fsm_transition.destination is None:
+                    # internal transitions do not change the state
+                    continue
+                yield source, fsm_transition.destination, fsm_transition.name
+
+    def __graph_from_transitions(self):
+        """Build the graph in memory from the declared `states` and
+        `transitions`, without going through Graphviz.
+        """
+        import networkx as nx  # noqa: PLC0415
+
+        graph = nx.MultiDiGraph()
+        graph.add_nodes_from(self.__state_names())
+        for source, dest, trigger in self.__iter_edges():
+            graph.add_edge(source, dest, label=trigger)
         return graph
 
+    def get_graph(self, from_dot: bool = False):
+        # documentation provided by base_adapter.py
+        if from_dot:
+            return self.__graph_from_dot()
+        return self.__graph_from_transitions()
+
+    def get_compact_graph(self, from_dot: bool = False) -> CompactGraph:
+        # documentation provided by base_adapter.py
+        if from_dot:
+            return CompactGraph.from_networkx(self.__graph_from_dot())
+        return CompactGraph(self.__state_names(), self.__iter_edges())
+
+    def __resolve_trigger(self, trigger: str) -> Optional[callable]:
+        """Look up the function firing `trigger` on the model."""
+        if hasattr(self.fsm, trigger):
+            return getattr(self.fsm, trigger)
+        if hasattr(self, 'model') and hasattr(self.model, trigger):
+            return getattr(self.model, trigger)
+        return None
+
+    def __build_trigger_functions(self) -> Dict[str, callable]:
+        """Resolve the trigger function of every declared transition."""
+        trigger_functions = dict()
+        for fsm_transitions in self.__source_index.values():
+            for fsm_transition in fsm_transitions:
+                trigger = fsm_transition.name
+                if trigger in trigger_functions:
+                    continue
+                t_func = self.__resolve_trigger(trigger)
+                if t_func is not None:
+                    trigger_functions[trigger] = t_func
+        return trigger_functions
+
+    def __bound_trigger_functions(self) -> Dict[str, callable]:
+        """The trigger functions are bound to the model they were resolved
+        on, so they are resolved again after the model is swapped."""
+        if self.__trigger_model is not self.fsm:
+            self.__trigger_model = self.fsm
+            self.__trigger_functions = self.__build_trigger_functions()
+        return self.__trigger_functions
+
+    def get_trigger_functions(self) -> Dict[str, callable]:
+        # documentation provided by base_adapter.py
+        return self.__bound_trigger_functions()
+
     def get_transition_function(self, transition: FSMTransition) -> callable:
         # documentation provided by base_adapter.py
-        # naive implementation
         trigger = transition.name
-        t_func = None
-        if hasattr(self.fsm, trigger):
-            t_func = getattr(self.fsm, trigger)
-        elif hasattr(self, 'model') and hasattr(self.model, trigger):
-            t_func = getattr(self.model, trigger)
+        t_func = self.__bound_trigger_functions().get(trigger)
         if t_func is None:
-            raise AttributeError(f"Transition function {trigger} not found")
+            t_func = self.__resolve_trigger(trigger)
+            if t_func is None:
+                raise AttributeError(
+                    f"Transition function {trigger} not found",
+                )
+            self.__trigger_functions[trigger] = t_func
         return t_func
 
+    def is_runtime_attribute(self, name: str, value) -> bool:
+        # documentation provided by base_adapter.py
+        from transitions import Machine  # noqa: PLC0415
+
+        return callable(value) or isinstance(value, Machine)
+
     def reset_fsm(self):
         # documentation provided by base_adapter.py
         self.fsm.state = self.initial_state
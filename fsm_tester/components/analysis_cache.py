@@ -0,0 +1,227 @@
+import hashlib
+import json
+import os
+import pickle
+import zlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+from fsm_tester import __version__
+
+
+CACHE_SUFFIX = '.fsmcache'
+
+# bumped whenever the layout of the cached results changes
+CACHE_FORMAT = 1
+
+
+@lru_cache(maxsize=None)
+def _package_version() -> str:
+    """The installed version of fsm_tester, or the version of the source tree
+    when it is not installed."""
+    # importlib.metadata is slow to import, and only needed with a cache
+    from importlib import metadata  # noqa: PLC0415
+
+    try:
+        return metadata.version('fsm_tester')
+    except metadata.PackageNotFoundError:
+        return __version__
+
+
+def _normalize(value: Any) -> Any:
+    """Turn a `states`/`transitions` declaration into plain JSON data, so it
+    can be hashed independently of object identities.
+
+    Args:
+        value (Any): The declaration to normalize.
+
+    Returns:
+        Any: A JSON serializable representation of the declaration.
+    """
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if hasattr(value, 'name') and isinstance(value.name, str):
+        # transitions.State objects and alike
+        return {
+            'name': value.name,
+            'on_enter': _normalize(getattr(value, 'on_enter', None)),
+            'on_exit': _normalize(getattr(value, 'on_exit', None)),
+        }
+    return getattr(value, '__qualname__', type(value).__qualname__)
+
+
+def machine_key(
+    states: Any,
+    transitions: Any,
+    initial_state: str,
+) -> str:
+    """Compute a stable key for a machine definition. The key changes whenever
+    the declared states or transitions, the initial state, the cache format
+    or the installed fsm_tester version change.
+
+    Args:
+        states (Any): The `states` declaration of the FSM Module.
+        transitions (Any): The `transitions` declaration of the FSM Module.
+        initial_state (str): The initial state of the machine.
+
+    Returns:
+        str: A hex digest identifying the machine definition.
+    """
+    spec = {
+        'format': CACHE_FORMAT,
+        'version': _package_version(),
+        'initial': initial_state,
+        'states': _normalize(states),
+        'transitions': _normalize(transitions),
+    }
+    payload = json.dumps(spec, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class MachineAnalyses:
+    """Memoized analysis results for a single machine definition. When bound
+    to an `AnalysisCache`, computed results are persisted to disk by `flush`
+    and reused by later runs; otherwise results are only kept in memory.
+    """
+
+    def __init__(
+        self,
+        cache: Optional['AnalysisCache'] = None,
+        key: Optional[str] = None,
+        entries: Optional[Dict[str, Any]] = None,
+    ):
+        self.cache = cache
+        self.key = key
+        self.entries = entries if entries is not None else dict()
+        self.dirty = False
+
+    def get_or_compute(self, name: str, compute: Callable[[], Any]) -> Any:
+        """Return the analysis result stored under `name`, computing and
+        storing it first if needed. New results are only written to disk by
+        the next `flush`.
+
+        Args:
+            name (str): The name of the analysis result.
+            compute (Callable[[], Any]): Computes the result on a cache miss.
+
+        Returns:
+            Any: The analysis result.
+        """
+        if name not in self.entries:
+            self.entries[name] = compute()
+            self.dirty = True
+        return self.entries[name]
+
+    def flush(self) -> None:
+        """Persist the current results, if bound to an `AnalysisCache` and
+        any result was computed since the last flush."""
+        if self.cache is not None and self.dirty:
+            self.cache.store(self.key, self.entries)
+        self.dirty = False
+
+
+class AnalysisCache:
+    """Content-addressed on-disk cache for graphs and analysis results. Every
+    machine definition is stored in one zlib compressed pickle named after its
+    `machine_key`. Least recently used entries are evicted once the cache
+    grows beyond `max_entries` files or `max_bytes` bytes.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        max_entries: int = 256,
+        max_bytes: int = 64 * 1024 * 1024,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f'{key}{CACHE_SUFFIX}'
+
+    def load(self, key: str) -> Dict[str, Any]:
+        """Load the results stored for `key`. Entries that cannot be read or
+        unpickled, for instance because they were written with an older
+        layout of the cached classes, are treated as missing and deleted.
+
+        Args:
+            key (str): The machine key.
+
+        Returns:
+            Dict[str, Any]: The stored results, empty on a cache miss.
+        """
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return dict()
+        try:
+            entries = pickle.loads(zlib.decompress(data))
+        except Exception:
+            path.unlink(missing_ok=True)
+            return dict()
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entries
+
+    def store(self, key: str, entries: Dict[str, Any]) -> None:
+        """Atomically write the results for `key`, then evict old entries.
+
+        Args:
+            key (str): The machine key.
+            entries (Dict[str, Any]): The results to store.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_suffix(f'{CACHE_SUFFIX}.{os.getpid()}.tmp')
+        data = zlib.compress(
+            pickle.dumps(entries, protocol=pickle.HIGHEST_PROTOCOL),
+        )
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove least recently used entries until the cache is within its
+        entry count and size limits."""
+        files = list()
+        for path in self.cache_dir.glob(f'*{CACHE_SUFFIX}'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        files.sort()
+        total_bytes = sum(size for _, size, _ in files)
+        while files and (
+            len(files) > self.max_entries or total_bytes > self.max_bytes
+        ):
+            _, size, path = files.pop(0)
+            path.unlink(missing_ok=True)
+            total_bytes -= size
+
+    def analyses(
+        self,
+        states: Any,
+        transitions: Any,
+        initial_state: str,
+    ) -> MachineAnalyses:
+        """Open the cached results for a machine definition.
+
+        Args:
+            states (Any): The `states` declaration of the FSM Module.
+            transitions (Any): The `transitions` declaration of the FSM Module.
+            initial_state (str): The initial state of the machine.
+
+        Returns:
+            MachineAnalyses: The results bound to this cache.
+        """
+        key = machine_key(states, transitions, initial_state)
+        return MachineAnalyses(cache=self, key=key, entries=self.load(key))
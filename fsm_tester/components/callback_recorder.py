@@ -0,0 +1,97 @@
+import time
+from typing import Any, Callable, Dict, Union
+from fsm_tester.components.guard_forcer import constant_stub
+from fsm_tester.entities import CallbackReport
+from fsm_tester.typing import Adapter, CALLBACK_KINDS, CALLBACK_POLICIES
+
+
+CALLBACK_KINDS_ORDER = ('prepare', 'before', 'on_exit', 'on_enter', 'after')
+
+
+class CallbackRecorder:
+    """Applies a callback policy to the models of the tests. The callbacks
+    the FSM library calls around a transition are run untouched (`run`),
+    replaced by a stub doing nothing (`skip`), or wrapped to record the
+    duration of every call into `report` (`timed`).
+
+    The policy is given for every kind of callback at once, or by kind. A
+    method registered as callbacks of several kinds is timed if any of its
+    kinds is timed, and skipped only if all of them are skipped.
+
+    Like guards, callbacks are patched on the model instance, so both the
+    triggers of the library and the compiled executor go through them.
+    """
+
+    def __init__(
+        self,
+        adapter: Adapter,
+        policy: Union[
+            CALLBACK_POLICIES,
+            Dict[CALLBACK_KINDS, CALLBACK_POLICIES],
+        ] = 'run',
+    ):
+        """
+        Args:
+            adapter (Adapter): The adapter for the FSM.
+            policy (Union[CALLBACK_POLICIES, Dict[CALLBACK_KINDS,
+                CALLBACK_POLICIES]]): The policy of every callback, or of
+                each kind of callback, kinds left out being run. Defaults to
+                `run`.
+        """
+        if isinstance(policy, str):
+            policy = {kind: policy for kind in CALLBACK_KINDS_ORDER}
+        kinds_of: Dict[str, set] = dict()
+        for kind, names in adapter.get_callbacks().items():
+            for name in names:
+                kinds_of.setdefault(name, set()).add(
+                    policy.get(kind, 'run'),
+                )
+        self.policies: Dict[str, CALLBACK_POLICIES] = dict()
+        for name, policies in kinds_of.items():
+            if 'timed' in policies:
+                self.policies[name] = 'timed'
+            elif policies == {'skip'}:
+                self.policies[name] = 'skip'
+        self.report = CallbackReport()
+
+    def _timed(self, name: str, original: Callable) -> Callable:
+        """Wrap a bound callback to record the duration of its calls."""
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self.report.record(name, time.perf_counter() - start)
+
+        timed.__name__ = timed.__qualname__ = name
+        timed.callback_recorder = self
+        return timed
+
+    def instrument(self, model: Any) -> None:
+        """Apply the policy to the callbacks of `model`. Callbacks already
+        wrapped by this recorder are left alone.
+
+        Args:
+            model (Any): The model.
+        """
+        instance_attributes = vars(model)
+        for name, policy in self.policies.items():
+            current = instance_attributes.get(name)
+            if getattr(current, 'callback_recorder', None) is self:
+                continue
+            if policy == 'skip':
+                instance_attributes[name] = constant_stub(name, None)
+                continue
+            original = getattr(model, name, None)
+            if original is not None:
+                instance_attributes[name] = self._timed(name, original)
+
+    def start_report(self) -> CallbackReport:
+        """Record the next calls into a new report.
+
+        Returns:
+            CallbackReport: The new report.
+        """
+        self.report = CallbackReport()
+        return self.report
@@ -0,0 +1,539 @@
+import time
+from array import array
+from collections import deque
+from typing import Iterable, Iterator, List, Optional, Tuple
+from fsm_tester.components.networkx_compat import NetworkXCompat
+
+
+class CompactGraph(NetworkXCompat):
+    """Integer indexed graph in compressed sparse row (CSR) form. State names
+    are interned to integers, and the adjacency is stored as flat offset and
+    target arrays, both forward (successors) and reverse (predecessors).
+
+    The traversals used by the analysis suites run directly over the arrays.
+    `to_networkx` returns a read-only NetworkX view over the same arrays.
+    """
+
+    __slots__ = (
+        'names',
+        'indices',
+        'fwd_offsets',
+        'fwd_targets',
+        'labels',
+        'rev_offsets',
+        'rev_sources',
+    )
+
+    def __init__(
+        self,
+        names: List[str],
+        edges: Iterable[Tuple[str, str, Optional[str]]],
+    ):
+        self.names = list(names)
+        self.indices = {name: idx for idx, name in enumerate(self.names)}
+        buckets = [list() for _ in self.names]
+        for source, dest, label in edges:
+            for state in (source, dest):
+                if state not in self.indices:
+                    self.indices[state] = len(self.names)
+                    self.names.append(state)
+                    buckets.append(list())
+            buckets[self.indices[source]].append(
+                (self.indices[dest], label),
+            )
+
+        self.fwd_offsets = array('l', [0])
+        self.fwd_targets = array('l')
+        self.labels = list()
+        in_degree = [0] * len(self.names)
+        for bucket in buckets:
+            for target, label in bucket:
+                self.fwd_targets.append(target)
+                self.labels.append(label)
+                in_degree[target] += 1
+            self.fwd_offsets.append(len(self.fwd_targets))
+
+        self.rev_offsets = array('l', [0])
+        for degree in in_degree:
+            self.rev_offsets.append(self.rev_offsets[-1] + degree)
+        self.rev_sources = array('l', [0]) * len(self.fwd_targets)
+        cursor = array('l', self.rev_offsets[:-1])
+        for source in range(len(self.names)):
+            for pos in range(
+                self.fwd_offsets[source],
+                self.fwd_offsets[source + 1],
+            ):
+                target = self.fwd_targets[pos]
+                self.rev_sources[cursor[target]] = source
+                cursor[target] += 1
+
+    def __getstate__(self):
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.indices
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def successor_ids(self, node: int) -> array:
+        return self.fwd_targets[
+            self.fwd_offsets[node] : self.fwd_offsets[node + 1]
+        ]
+
+    def predecessor_ids(self, node: int) -> array:
+        return self.rev_sources[
+            self.rev_offsets[node] : self.rev_offsets[node + 1]
+        ]
+
+    def _bfs(
+        self,
+        source: int,
+        offsets: array,
+        targets: array,
+    ) -> array:
+        """Breadth first search over the given adjacency arrays.
+
+        Returns:
+            array: The BFS parent of every node. The source is its own parent
+                and unreached nodes have parent -1.
+        """
+        parents = array('l', [-1]) * len(self.names)
+        parents[source] = source
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            for pos in range(offsets[node], offsets[node + 1]):
+                target = targets[pos]
+                if parents[target] == -1:
+                    parents[target] = node
+                    queue.append(target)
+        return parents
+
+    def _distances(
+        self,
+        start: int,
+        offsets: array,
+        targets: array,
+    ) -> array:
+        """Breadth first distances over the given adjacency arrays, -1 for
+        unreached nodes."""
+        distances = array('l', [-1]) * len(self.names)
+        distances[start] = 0
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            for pos in range(offsets[node], offsets[node + 1]):
+                target = targets[pos]
+                if distances[target] == -1:
+                    distances[target] = distances[node] + 1
+                    queue.append(target)
+        return distances
+
+    def bfs_distances(self, source: str) -> array:
+        """Return the number of edges on a shortest path from `source` to
+        every node, -1 for unreachable nodes."""
+        return self._distances(
+            self.indices[source],
+            self.fwd_offsets,
+            self.fwd_targets,
+        )
+
+    def bfs_tree(self, source: str) -> array:
+        """Return the BFS parents of every node, searching forward from
+        `source`."""
+        return self._bfs(
+            self.indices[source],
+            self.fwd_offsets,
+            self.fwd_targets,
+        )
+
+    def reverse_bfs_tree(self, target: str) -> array:
+        """Return the BFS parents of every node, searching backwards from
+        `target`. The parent of a node is its next hop towards `target`."""
+        return self._bfs(
+            self.indices[target],
+            self.rev_offsets,
+            self.rev_sources,
+        )
+
+    def tree_path(
+        self,
+        parents: array,
+        node: str,
+        reverse: bool = False,
+    ) -> Optional[List[str]]:
+        """Read the path between the root of a BFS tree and `node`.
+
+        Args:
+            parents (array): A tree returned by `bfs_tree` or
+                `reverse_bfs_tree`.
+            node (str): The node at the other end of the path.
+            reverse (bool): True if `parents` is a reverse tree, in which case
+                the path goes from `node` to the root.
+
+        Returns:
+            Optional[List[str]]: The path, or None if `node` is not in the
+                tree.
+        """
+        current = self.indices[node]
+        if parents[current] == -1:
+            return None
+        path = [current]
+        while parents[current] != current:
+            current = parents[current]
+            path.append(current)
+        if not reverse:
+            path.reverse()
+        return [self.names[idx] for idx in path]
+
+    def _distinct_successors(self) -> List[List[int]]:
+        return [
+            list(dict.fromkeys(self.successor_ids(node)))
+            for node in range(len(self.names))
+        ]
+
+    def all_simple_paths(
+        self,
+        source: str,
+        target: str,
+        cutoff: Optional[int] = None,
+        deadline: Optional[float] = None,
+    ) -> Iterator[List[str]]:
+        """Iterate over every simple path from `source` to `target`. Nodes
+        that cannot reach `target`, or only in more edges than `cutoff`
+        allows, are never expanded.
+
+        Args:
+            source (str): The node every path starts from.
+            target (str): The node every path ends in.
+            cutoff (Optional[int]): Only yield paths with at most this many
+                edges. Defaults to no limit.
+            deadline (Optional[float]): A `time.monotonic` instant after
+                which the search stops, whether or not every path was
+                yielded. Defaults to no deadline.
+
+        Yields:
+            List[str]: The states of each path.
+        """
+        successors = self._distinct_successors()
+        source_id = self.indices[source]
+        target_id = self.indices[target]
+        # the edges from every node to the target, -1 if it cannot reach it
+        to_target = self._distances(
+            target_id,
+            self.rev_offsets,
+            self.rev_sources,
+        )
+        if source_id == target_id or to_target[source_id] == -1:
+            # no simple path leads back to the source, or to an unreachable
+            # target
+            return
+        path = [source_id]
+        on_path = bytearray(len(self.names))
+        on_path[source_id] = 1
+        stack = [iter(successors[source_id])]
+        while stack:
+            if deadline is not None and time.monotonic() >= deadline:
+                return
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+                on_path[path.pop()] = 0
+                continue
+            if on_path[child]:
+                continue
+            if child == target_id:
+                if cutoff is None or len(path) <= cutoff:
+                    yield [self.names[idx] for idx in path] + [target]
+                continue
+            if to_target[child] == -1 or (
+                cutoff is not None and len(path) + to_target[child] > cutoff
+            ):
+                # the target cannot be reached from the child within cutoff
+                continue
+            path.append(child)
+            on_path[child] = 1
+            stack.append(iter(successors[child]))
+
+    def divergent_paths(
+        self,
+        source: str,
+        target: str,
+        parents: Optional[array] = None,
+        deadline: Optional[float] = None,
+    ) -> List[Tuple[Optional[Tuple[str, str]], List[str]]]:
+        """Build one simple path from `source` to `target` per first
+        divergence edge. The canonical path is the shortest one along the BFS
+        tree of `source`; every other path follows the tree up to some node,
+        leaves it through a non tree edge, the first divergence edge, and
+        then takes a shortest path to `target`. Candidates that would revisit
+        a node are skipped.
+
+        Args:
+            source (str): The node every path starts from.
+            target (str): The node every path ends in.
+            parents (Optional[array]): The `bfs_tree` of `source`, so that
+                callers building paths to many targets search it once.
+                Built if None.
+            deadline (Optional[float]): A `time.monotonic` instant after
+                which no more divergence edges are explored; the canonical
+                path is always returned. Defaults to no deadline.
+
+        Returns:
+            List[Tuple[Optional[Tuple[str, str]], List[str]]]: The first
+                divergence edge of each path, None for the canonical path,
+                and the path itself. Empty if `target` is unreachable.
+        """
+        if parents is None:
+            parents = self.bfs_tree(source)
+        canonical = self.tree_path(parents, target)
+        if canonical is None:
+            return list()
+        strata = [(None, canonical)]
+        if deadline is not None and time.monotonic() >= deadline:
+            return strata
+        to_target = self.reverse_bfs_tree(target)
+        target_id = self.indices[target]
+        successors = self._distinct_successors()
+        for node in range(len(self.names)):
+            if parents[node] == -1 or node == target_id:
+                continue
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            for child in successors[node]:
+                if parents[child] == node or to_target[child] == -1:
+                    continue
+                prefix = self.tree_path(parents, self.names[node])
+                suffix = self.tree_path(
+                    to_target,
+                    self.names[child],
+                    reverse=True,
+                )
+                path = prefix + suffix
+                if len(set(path)) != len(path):
+                    continue
+                strata.append(((self.names[node], self.names[child]), path))
+        return strata
+
+    def edge_cover_paths(self, source: str) -> List[List[str]]:
+        """Plan a small set of paths from `source` that together traverse every
+        reachable edge, and so visit every reachable node, at least once.
+
+        Every path starts with a BFS tree prefix leading to an edge not yet
+        covered. It is then greedily extended along uncovered edges, a
+        Chinese postman style heuristic, and paths that are a prefix of
+        another planned path are dropped. Parallel edges between the same
+        pair of nodes are covered once. Paths may revisit nodes.
+
+        Args:
+            source (str): The node every path starts from.
+
+        Returns:
+            List[List[str]]: The planned paths, each with at least one edge.
+        """
+        parents = self.bfs_tree(source)
+        successors = self._distinct_successors()
+        next_uncovered = [0] * len(self.names)
+
+        def pop_uncovered(node: int) -> Optional[int]:
+            targets = successors[node]
+            while next_uncovered[node] < len(targets):
+                target = targets[next_uncovered[node]]
+                next_uncovered[node] += 1
+                if (node, target) not in covered:
+                    return target
+            return None
+
+        covered = set()
+        paths = list()
+        for node in range(len(self.names)):
+            if parents[node] == -1:
+                continue
+            while True:
+                target = pop_uncovered(node)
+                if target is None:
+                    break
+                path = self.tree_path(parents, self.names[node])
+                path = [self.indices[name] for name in path]
+                tail = target
+                while tail is not None:
+                    covered.add((path[-1], tail))
+                    path.append(tail)
+                    tail = pop_uncovered(tail)
+                paths.append(path)
+
+        planned = sorted(paths)
+        return [
+            [self.names[idx] for idx in path]
+            for current, path in enumerate(planned)
+            if not (
+                current + 1 < len(planned)
+                and planned[current + 1][: len(path)] == path
+            )
+        ]
+
+    def simple_cycles(
+        self,
+        max_length: Optional[int] = None,
+    ) -> Iterator[List[str]]:
+        """Iterate over every elementary cycle of the graph. Each cycle is
+        reported once, starting at its node with the lowest index.
+
+        Args:
+            max_length (Optional[int]): Only yield cycles with at most this
+                many states. Defaults to no limit.
+
+        Yields:
+            List[str]: The states of each cycle.
+        """
+        successors = self._distinct_successors()
+        for start in range(len(self.names)):
+            # only nodes that can get back to `start` without going through a
+            # lower index node may be part of a cycle rooted at `start`
+            can_return = bytearray(len(self.names))
+            can_return[start] = 1
+            queue = deque([start])
+            while queue:
+                node = queue.popleft()
+                for source in self.predecessor_ids(node):
+                    if source > start and not can_return[source]:
+                        can_return[source] = 1
+                        queue.append(source)
+            path = [start]
+            on_path = bytearray(len(self.names))
+            on_path[start] = 1
+            stack = [iter(successors[start])]
+            while stack:
+                child = next(stack[-1], None)
+                if child is None:
+                    stack.pop()
+                    on_path[path.pop()] = 0
+                    continue
+                if child == start:
+                    if max_length is None or len(path) <= max_length:
+                        yield [self.names[idx] for idx in path]
+                    continue
+                if child < start or on_path[child] or not can_return[child]:
+                    continue
+                if max_length is not None and len(path) >= max_length:
+                    continue
+                path.append(child)
+                on_path[child] = 1
+                stack.append(iter(successors[child]))
+
+    def strongly_connected_components(self) -> List[List[int]]:
+        """Find the strongly connected components with an iterative version of
+        Tarjan's algorithm.
+
+        Returns:
+            List[List[int]]: The node ids of each component. Components are
+                listed in reverse topological order of the condensation DAG:
+                every component comes after the components it can reach.
+        """
+        node_count = len(self.names)
+        index = array('l', [-1]) * node_count
+        lowlink = array('l', [0]) * node_count
+        on_stack = bytearray(node_count)
+        stack = list()
+        components = list()
+        counter = 0
+        for root in range(node_count):
+            if index[root] != -1:
+                continue
+            work = [(root, self.fwd_offsets[root])]
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            while work:
+                node, pos = work[-1]
+                if pos < self.fwd_offsets[node + 1]:
+                    work[-1] = (node, pos + 1)
+                    child = self.fwd_targets[pos]
+                    if index[child] == -1:
+                        index[child] = lowlink[child] = counter
+                        counter += 1
+                        stack.append(child)
+                        on_stack[child] = 1
+                        work.append((child, self.fwd_offsets[child]))
+                    elif on_stack[child]:
+                        lowlink[node] = min(lowlink[node], index[child])
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = list()
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+        return components
+
+    def condensation(self) -> Tuple[List[List[int]], array]:
+        """Return the strongly connected components and, for every node, the
+        position of its component in that list.
+
+        Returns:
+            Tuple[List[List[int]], array]: The components, in reverse
+                topological order, and the component of each node.
+        """
+        components = self.strongly_connected_components()
+        membership = array('l', [0]) * len(self.names)
+        for component_id, component in enumerate(components):
+            for node in component:
+                membership[node] = component_id
+        return components, membership
+
+    def is_cyclic_component(self, component: List[int]) -> bool:
+        """Return True if the component contains at least one cycle, that is,
+        it has more than one node or its only node has a self loop."""
+        if len(component) > 1:
+            return True
+        node = component[0]
+        return node in self.successor_ids(node)
+
+    def shortest_cycle_through(
+        self,
+        node: int,
+        allowed: Iterable[int],
+    ) -> Optional[List[str]]:
+        """Return a shortest cycle through `node` that only visits `allowed`
+        nodes, as a list of states starting at `node`.
+
+        Args:
+            node (int): The node the cycle goes through.
+            allowed (Iterable[int]): The nodes the cycle may visit, usually
+                the strongly connected component of `node`.
+
+        Returns:
+            Optional[List[str]]: The cycle, or None if there is none.
+        """
+        allowed = set(allowed)
+        parents = {node: node}
+        queue = deque([node])
+        while queue:
+            current = queue.popleft()
+            for child in self.successor_ids(current):
+                if child == node:
+                    cycle = [current]
+                    while cycle[-1] != node:
+                        cycle.append(parents[cycle[-1]])
+                    cycle.reverse()
+                    return [self.names[idx] for idx in cycle]
+                if child in allowed and child not in parents:
+                    parents[child] = current
+                    queue.append(child)
+        return None
@@ -0,0 +1,152 @@
+import random
+from operator import methodcaller
+from typing import Callable, Dict, Iterable, List, NamedTuple, Tuple, Union
+from fsm_tester.typing import Adapter, COMPILED_CALLBACKS
+
+
+# the order in which pytransitions runs the callbacks of a transition
+CALLBACK_ORDER = ('before', 'on_exit', 'on_enter', 'after')
+
+
+class CompiledStep(NamedTuple):
+    """A transition compiled down to the callbacks to run around a direct
+    state change. Callbacks take the model as their only argument, so the
+    table does not depend on a model instance."""
+
+    name: str
+    dest: str
+    pre_callbacks: Tuple[Callable, ...]
+    post_callbacks: Tuple[Callable, ...]
+
+
+class CompiledExecutor:
+    """Executes transitions without going through the trigger machinery of
+    the FSM library. The declared transitions are compiled once into a
+    (source, dest) table. Executing a step runs the selected callbacks and
+    writes the destination straight into the state attribute of the model.
+    Guards are not evaluated, since the suites force them anyway.
+
+    Compiled steps only model the callbacks they were asked to run, so a
+    seeded sample of steps should be sent through the real trigger instead,
+    to cross-check the table against the library.
+    """
+
+    def __init__(
+        self,
+        adapter: Adapter,
+        callbacks: Iterable[COMPILED_CALLBACKS] = (),
+        cross_check_ratio: float = 0.0,
+        seed: int = 0,
+    ):
+        """
+        Args:
+            adapter (Adapter): The adapter for the FSM.
+            callbacks (Iterable[COMPILED_CALLBACKS]): The callbacks run by
+                compiled steps, in the order pytransitions runs them.
+                Defaults to none.
+            cross_check_ratio (float): The fraction of steps that should be
+                cross-checked through the real trigger.
+            seed (int): The seed of the cross-check sampling.
+        """
+        callbacks = set(callbacks)
+        self.adapter = adapter
+        self.callbacks = [
+            callback for callback in CALLBACK_ORDER if callback in callbacks
+        ]
+        self.cross_check_ratio = cross_check_ratio
+        self.seed = seed
+        self._rng = random.Random(seed)
+        self.table = self._compile()
+        self.compiled_steps = 0
+        self.cross_checks = 0
+
+    @staticmethod
+    def _resolve(
+        callbacks: Union[None, str, Callable, Iterable[Union[str, Callable]]],
+    ) -> List[Callable]:
+        """Resolve callbacks declared by name or as callables into functions
+        of the model."""
+        if callbacks is None:
+            return list()
+        if isinstance(callbacks, str) or callable(callbacks):
+            callbacks = [callbacks]
+        return [
+            methodcaller(callback)
+            if isinstance(callback, str)
+            # like pytransitions, callables are called without the model
+            else lambda model, callback=callback: callback()
+            for callback in callbacks
+        ]
+
+    def _compile(self) -> Dict[Tuple[str, str], CompiledStep]:
+        """Compile the first transition declared between every pair of
+        states, skipping internal transitions."""
+        states = {state.name: state for state in self.adapter.get_states()}
+        table = dict()
+        for (
+            source,
+            dest,
+        ), transitions in self.adapter.get_transition_index().items():
+            if dest is None:
+                continue
+            transition = transitions[0]
+            declared = {
+                'before': transition.before,
+                'on_exit': getattr(states.get(source), 'on_exit', None),
+                'on_enter': getattr(states.get(dest), 'on_enter', None),
+                'after': transition.after,
+            }
+            pre_callbacks = list()
+            post_callbacks = list()
+            for callback in self.callbacks:
+                resolved = self._resolve(declared[callback])
+                if callback in {'before', 'on_exit'}:
+                    pre_callbacks.extend(resolved)
+                else:
+                    post_callbacks.extend(resolved)
+            table[(source, dest)] = CompiledStep(
+                name=transition.name,
+                dest=dest,
+                pre_callbacks=tuple(pre_callbacks),
+                post_callbacks=tuple(post_callbacks),
+            )
+        return table
+
+    def reseed(self, seed: Union[int, str]) -> None:
+        """Restart the cross-check sampling from `seed`."""
+        self._rng = random.Random(seed)
+
+    def should_cross_check(self) -> bool:
+        """Draw whether the next step goes through the real trigger."""
+        if (
+            self.cross_check_ratio > 0.0
+            and self._rng.random() < self.cross_check_ratio
+        ):
+            self.cross_checks += 1
+            return True
+        return False
+
+    def execute(self, source: str, dest: str) -> str:
+        """Execute the compiled transition from source to dest.
+
+        Args:
+            source (str): The source state of the transition.
+            dest (str): The destination state of the transition.
+
+        Raises:
+            KeyError: If no transition goes from source to dest.
+
+        Returns:
+            str: The name of the transition that was executed.
+        """
+        step = self.table.get((source, dest))
+        if step is None:
+            raise KeyError(f'No transition from {source} to {dest}.')
+        model = self.adapter.fsm
+        for callback in step.pre_callbacks:
+            callback(model)
+        setattr(model, self.adapter.state_attr, step.dest)
+        for callback in step.post_callbacks:
+            callback(model)
+        self.compiled_steps += 1
+        return step.name
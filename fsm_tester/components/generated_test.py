@@ -0,0 +1,46 @@
+from unittest import TestCase
+from unittest.util import strclass
+from typing import Callable
+
+
+class GeneratedTest(TestCase):
+    """A test generated by a suite. Instead of adding a method per test to
+    a class, every instance holds its name and the function it runs, so the
+    tests are released with the suite that holds them.
+    """
+
+    # built by the suites, not collected by pytest
+    __test__ = False
+
+    def __init__(self, name: str, function: Callable[[], None]):
+        """
+        Args:
+            name (str): The name of the test.
+            function (Callable[[], None]): Runs the test, raising an
+                AssertionError when it fails.
+        """
+        super().__init__()
+        self.name = name
+        self.function = function
+        # the description printed by the runners, not the runTest docstring
+        self._testMethodDoc = None
+
+    def runTest(self):
+        self.function()
+
+    def id(self):
+        return f'{strclass(self.__class__)}.{self.name}'
+
+    def __str__(self):
+        return f'{self.name} ({self.id()})'
+
+    def __repr__(self):
+        return f'<{strclass(self.__class__)} name={self.name}>'
+
+    def __eq__(self, other):
+        if type(self) is not type(other):
+            return NotImplemented
+        return self.name == other.name and self.function == other.function
+
+    def __hash__(self):
+        return hash((type(self), self.name))
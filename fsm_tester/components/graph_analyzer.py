@@ -1,22 +1,52 @@
-import networkx as nx
-
+from fsm_tester.components.analysis_cache import MachineAnalyses
+from fsm_tester.components.compact_graph import CompactGraph
+from fsm_tester.components.generated_test import GeneratedTest
 from fsm_tester.entities import FSMTransition
-from networkx import MultiDiGraph, MultiGraph
-from unittest import TestSuite, TestCase
-from typing import Union, List
+from unittest import TestSuite
+from typing import Dict, Union, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from networkx import MultiDiGraph, MultiGraph
 
 
 class GraphAnalyzer:
 
     def __init__(
         self,
-        graph: Union[MultiDiGraph, MultiGraph],
+        graph: Union[CompactGraph, 'MultiDiGraph', 'MultiGraph'],
         initial_state: str,
         final_state: str,
+        analyses: Optional[MachineAnalyses] = None,
     ):
-        self.graph = graph
+        self.graph = CompactGraph.from_networkx(graph)
         self.initial_state = initial_state
         self.final_state = final_state
+        if analyses is None:
+            analyses = MachineAnalyses()
+        self.analyses = analyses
+
+    def _reachable_states(self) -> set:
+        """Return the set of states reachable from the initial state, found
+        with a single forward BFS shared by every test case."""
+        return self.analyses.get_or_compute(
+            'reachable',
+            lambda: self.graph.descendants(self.initial_state),
+        )
+
+    def _coreachable_states(self) -> Optional[set]:
+        """Return the set of states that can reach the final state, found with
+        a single reverse BFS shared by every test case.
+
+        Returns:
+            Optional[set]: The co-reachable states, or None if the final state
+                is not part of the FSM.
+        """
+        if self.final_state not in self.graph:
+            return None
+        return self.analyses.get_or_compute(
+            f'coreachable:{self.final_state}',
+            lambda: self.graph.ancestors(self.final_state),
+        )
 
     def unreachable_states_suite(self) -> TestSuite:
         """Generate test cases to check if there are unreachable states in the
@@ -38,13 +68,11 @@ class GraphAnalyzer:
                 callable: The test function.
             """
             def assert_function(*args, **kwargs):
-                assert nx.has_path(
-                        self.graph,
-                        source=self.initial_state,
-                        target=state,
-                    ), f'{state} is unreachable.'
+                assert state in reachable, f'{state} is unreachable.'
             return assert_function
 
+        reachable = self._reachable_states()
+
         testsuite = TestSuite()
         setattr(
             testsuite,
@@ -59,17 +87,7 @@ class GraphAnalyzer:
         for state in self.graph.nodes:
             testcase_name = f'test_unreachable_{state}'
             _callable = test_unreachable(state)
-            _callable.__name__ = testcase_name
-            setattr(
-                TestCase,
-                testcase_name,
-                _callable,
-            )
-            testcase = TestCase(
-                testcase_name,
-            )
-            testcase._class_cleanups = list()
-            testsuite.addTest(testcase)
+            testsuite.addTest(GeneratedTest(testcase_name, _callable))
         return testsuite
 
     def sink_states_suite(self) -> TestSuite:
@@ -93,20 +111,17 @@ class GraphAnalyzer:
             """
             def assert_function(*args, **kwargs):
                 is_endstate = state == self.final_state
-                successors = list(self.graph.successors(state))
-                has_successors = len(successors) > 0
-                escape_path = list()
-                for s_state in successors:
-                    has_escape = nx.has_path(
-                        self.graph,
-                        source=state,
-                        target=self.final_state,
-                    )
-                    if not has_escape:
-                        escape_path.append(s_state)
+                has_successors = self.graph.out_degree(state) > 0
+                has_escape = True
+                if has_successors:
+                    assert coreachable is not None, f'{self.final_state} is not a state of the FSM.'  # noqa
+                    has_escape = state in coreachable
+                escape_path = has_successors and not has_escape
                 assert not is_endstate or not has_successors or escape_path, f'{state} is a sink state.'  # noqa
             return assert_function
 
+        coreachable = self._coreachable_states()
+
         testsuite = TestSuite()
         setattr(
             testsuite,
@@ -121,60 +136,66 @@ class GraphAnalyzer:
         for state in self.graph.nodes:
             testcase_name = f'test_sink_{state}'
             _callable = test_sink(state)
-            _callable.__name__ = testcase_name
-            setattr(
-                TestCase,
-                testcase_name,
-                _callable,
-            )
-            testcase = TestCase(
-                testcase_name,
-            )
-            testcase._class_cleanups = list()
-            testsuite.addTest(testcase)
+            testsuite.addTest(GeneratedTest(testcase_name, _callable))
         return testsuite
 
+    @staticmethod
+    def guard_signature(transition: FSMTransition) -> tuple:
+        """Return a canonical, hashable signature of the callbacks that decide
+        whether a transition is taken: its conditions, unless, before, and
+        after definitions. Two transitions from the same source with the same
+        signature cannot be told apart, and are nondeterministic.
+
+        The trigger is left out on purpose: the suite flags a state whose
+        transitions share their callbacks even when distinct triggers fire
+        them, as two unguarded transitions leaving the same state do. Within
+        a signature, transitions are then bucketed by trigger and
+        destination, so that the same transition declared twice, as an
+        explicit source overlapping a `'*'` source does, is not mistaken for
+        a conflict with itself.
+        NOTE: This function might be better suited to be a method of the
+        `Adapter` class.
+
+        Args:
+            transition (FSMTransition): The transition to sign.
+
+        Returns:
+            tuple: The guard signature of the transition.
+        """
+        def canonical(callbacks) -> frozenset:
+            if callbacks is None:
+                return frozenset()
+            if isinstance(callbacks, str) or callable(callbacks):
+                return frozenset([callbacks])
+            return frozenset(callbacks)
+
+        return (
+            canonical(transition.conditions),
+            canonical(transition.unless),
+            canonical(transition.before),
+            canonical(transition.after),
+        )
+
     def nondeterministic_transition_suite(
         self,
-        transitions: List[FSMTransition],
+        transitions: Union[
+            List[FSMTransition],
+            Dict[str, List[FSMTransition]],
+        ],
     ) -> TestSuite:
         """Generate test cases to check if there are nondeterministic
         transitions in the FSM.
 
         Args:
-            transitions (List[FSMTransition]): The list of transitions in the
-                FSM. Expected to be acquired from the FSMAdapter.
+            transitions (Union[List, Dict]): The transitions in the FSM
+                (FSMTransition objects), either as a list or already grouped
+                by source state. Expected to be acquired from the
+                FSMAdapter, preferably through `get_source_index`.
 
         Returns:
             TestSuite: A test suite containing test cases for each state in the
                 FSM.
         """
-        def nondeterministic(
-            transition1: FSMTransition,
-            transition2: FSMTransition,
-        ) -> bool:
-            """Check if two transitions are nondeterministic, by comparing
-            their set of conditions, unless, before, and after definitions.
-            NOTE: This function might be better suited to be a method of the
-            `Adapter` class.
-
-            Args:
-                transition1 (FSMTransition): The first transition to compare.
-                transition2 (FSMTransition): The second transition to compare.
-
-            Returns:
-                bool: True if the transitions are nondeterministic, False
-                    otherwise.
-            """
-            if (
-                transition1.conditions == transition2.conditions
-                and transition1.unless == transition2.unless
-                and transition1.before == transition2.before
-                and transition1.after == transition2.after
-            ):
-                return True
-            return False
-
         def test_nondeterministic(
             state: str,
         ) -> callable:
@@ -191,23 +212,36 @@ class GraphAnalyzer:
             Returns:
                 callable: The test function.
             """
-            src_transitions = [
-                t for t in transitions if t.source == state
+            nondet_tr = [
+                tr
+                for bucket in buckets.get(state, dict()).values()
+                if len(bucket) > 1
+                for tr in bucket.values()
             ]
-            nondet_tr = list()
-            for tr in src_transitions:
-                subset = [tr2 for tr2 in src_transitions if tr2 != tr]
-                for tr2 in subset:
-                    if nondeterministic(tr, tr2):
-                        if tr not in nondet_tr:
-                            nondet_tr.append(tr)
-                        if tr2 not in nondet_tr:
-                            nondet_tr.append(tr2)
 
             def assert_function(*args, **kwargs):
-                assert len(nondet_tr) == 0
+                assert len(nondet_tr) == 0, f'{state} has nondeterministic transitions: {nondet_tr}'  # noqa
             return assert_function
 
+        # transitions are grouped by source, then bucketed by guard signature:
+        # every bucket holding more than one transition is a conflict
+        if isinstance(transitions, dict):
+            source_index = transitions
+        else:
+            source_index = dict()
+            for tr in transitions:
+                for expanded in tr.expand(self.graph.nodes):
+                    source_index.setdefault(expanded.source, list()).append(
+                        expanded,
+                    )
+        buckets = dict()
+        for tr in (tr for trs in source_index.values() for tr in trs):
+            bucket = buckets.setdefault(tr.source, dict()).setdefault(
+                self.guard_signature(tr),
+                dict(),
+            )
+            bucket.setdefault((tr.name, tr.destination), tr)
+
         testsuite = TestSuite()
         setattr(
             testsuite,
@@ -222,15 +256,5 @@ class GraphAnalyzer:
         for state in self.graph.nodes:
             testcase_name = f'test_nondeterministic_{state}'
             _callable = test_nondeterministic(state)
-            _callable.__name__ = testcase_name
-            setattr(
-                TestCase,
-                testcase_name,
-                _callable,
-            )
-            testcase = TestCase(
-                testcase_name,
-            )
-            testcase._class_cleanups = list()
-            testsuite.addTest(testcase)
+            testsuite.addTest(GeneratedTest(testcase_name, _callable))
         return testsuite
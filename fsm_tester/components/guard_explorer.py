@@ -0,0 +1,272 @@
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+from fsm_tester.typing import Adapter
+
+
+# a partial truth assignment of the guards, as sorted (guard, value) pairs
+Assignment = Tuple[Tuple[str, bool], ...]
+
+
+class GuardEdge(NamedTuple):
+    """A transition between two states, with the alternative partial
+    assignments under which pytransitions takes it."""
+
+    trigger: str
+    dest: str
+    requirements: Tuple[Assignment, ...]
+
+
+class GuardExploration(NamedTuple):
+    """The result of `GuardExplorer.explore`. `reachable` maps every state
+    reached to the minimal assignments it was reached under. `complete` is
+    False if the assignment budget ran out before the exploration ended, or
+    while the requirements of a transition were computed."""
+
+    reachable: Dict[str, List[Assignment]]
+    explored: int
+    complete: bool
+
+
+def _literals(guards: Any, value: bool) -> List[Optional[Tuple[str, bool]]]:
+    """The (guard, value) literals a transition requires. Guards given as
+    callables cannot be assigned, and stand as None."""
+    if guards is None:
+        return list()
+    if isinstance(guards, str) or callable(guards):
+        # pytransitions accepts a single callback instead of a list
+        guards = [guards]
+    return [
+        (guard, value) if isinstance(guard, str) else None for guard in guards
+    ]
+
+
+def _merge(
+    assignment: Dict[str, bool],
+    literals: Tuple[Tuple[str, bool], ...],
+) -> Optional[Dict[str, bool]]:
+    """Extend an assignment with literals, None if they contradict it."""
+    merged = dict(assignment)
+    for guard, value in literals:
+        if merged.setdefault(guard, value) != value:
+            return None
+    return merged
+
+
+def _freeze(assignment: Dict[str, bool]) -> Assignment:
+    return tuple(sorted(assignment.items()))
+
+
+def _minimal(assignments: Iterable[Assignment]) -> List[Assignment]:
+    """Drop the assignments extending another one, keeping the order."""
+    assignments = list(dict.fromkeys(assignments))
+    frozen = [frozenset(assignment) for assignment in assignments]
+    return [
+        assignment
+        for assignment, literals in zip(assignments, frozen)
+        if not any(other < literals for other in frozen)
+    ]
+
+
+class GuardExplorer:
+    """Explores the machine under consistent truth assignments of its
+    guards, the names reported by `get_guards`, so that a guard holds the
+    same value on every edge of a path. Forcing every edge open, as the
+    execution suite does, ignores that `is_bad_component` cannot be both
+    true on the way to `DiscardComponent` and false on the way to
+    `PlaceComponent`.
+
+    Assignments are only extended with the guards the edges taken so far
+    depend on, and a combination contradicting itself is pruned as soon as
+    it appears, instead of enumerating the product of every guard value. A
+    transition is taken under an assignment when its conditions hold, its
+    unless do not, and no transition of the same trigger declared before it
+    would fire instead. Guards given as callables are left free.
+
+    The pairs of state and assignment already explored are memoized, and
+    a pair whose assignment extends one already explored at the same state
+    is skipped, since everything it reaches was already reached.
+    """
+
+    def __init__(
+        self,
+        adapter: Adapter,
+        max_assignments: Optional[int] = None,
+    ):
+        """
+        Args:
+            adapter (Adapter): The adapter for the FSM.
+            max_assignments (Optional[int]): The most pairs of state and
+                assignment explored, and the most assignments kept per
+                transition. Defaults to no limit.
+        """
+        self.adapter = adapter
+        self.max_assignments = max_assignments
+        self.truncated = False
+        self.edges = self._compile()
+
+    def _compile(self) -> Dict[str, Tuple[GuardEdge, ...]]:
+        """Compute the requirements of every transition of the source
+        index, dropping the transitions no assignment can take."""
+        edges = dict()
+        for source, transitions in self.adapter.get_source_index().items():
+            source_edges = list()
+            for idx, transition in enumerate(transitions):
+                required = [
+                    literal
+                    for literal in (
+                        _literals(transition.conditions, True)
+                        + _literals(transition.unless, False)
+                    )
+                    if literal is not None
+                ]
+                # one literal of every earlier transition of the trigger
+                # must fail, or that transition fires instead
+                preempting = list()
+                for earlier in transitions[:idx]:
+                    if earlier.name != transition.name:
+                        continue
+                    negated = [
+                        None
+                        if literal is None
+                        else (literal[0], not literal[1])
+                        for literal in (
+                            _literals(earlier.conditions, True)
+                            + _literals(earlier.unless, False)
+                        )
+                    ]
+                    preempting.append(negated)
+                requirements = self._requirements(required, preempting)
+                if requirements:
+                    source_edges.append(
+                        GuardEdge(
+                            trigger=transition.name,
+                            dest=transition.destination or source,
+                            requirements=requirements,
+                        ),
+                    )
+            edges[source] = tuple(source_edges)
+        return edges
+
+    def _requirements(
+        self,
+        required: List[Tuple[str, bool]],
+        preempting: List[List[Optional[Tuple[str, bool]]]],
+    ) -> Tuple[Assignment, ...]:
+        """Compute the minimal assignments under which a transition is
+        taken. The negated literals of the earlier transitions of its
+        trigger are folded in one transition at a time, and contradicting
+        or redundant assignments are pruned after each one, so that many
+        transitions sharing a trigger do not enumerate the product of their
+        literals. Past `max_assignments`, the extra assignments are dropped
+        and the explorer is marked as `truncated`.
+
+        Args:
+            required (List[Tuple[str, bool]]): The literals of the
+                transition itself.
+            preempting (List[List[Optional[Tuple[str, bool]]]]): The negated
+                literals of every earlier transition of the trigger, one of
+                which must hold.
+
+        Returns:
+            Tuple[Assignment, ...]: The assignments, empty if no assignment
+                takes the transition.
+        """
+        merged = _merge(dict(), tuple(required))
+        if merged is None:
+            return ()
+        assignments = [_freeze(merged)]
+        for negated in preempting:
+            extended = list()
+            for assignment in assignments:
+                for literal in negated:
+                    if literal is None:
+                        # a callable guard may fail on its own
+                        extended.append(assignment)
+                        continue
+                    merged = _merge(dict(assignment), (literal,))
+                    if merged is not None:
+                        extended.append(_freeze(merged))
+            assignments = _minimal(extended)
+            if (
+                self.max_assignments is not None
+                and len(assignments) > self.max_assignments
+            ):
+                assignments = assignments[: self.max_assignments]
+                self.truncated = True
+        return tuple(assignments)
+
+    def explore(self) -> GuardExploration:
+        """Explore the states reachable from the initial state, and the
+        minimal assignments each is reachable under.
+
+        Returns:
+            GuardExploration: The states reached, the number of pairs of
+                state and assignment explored, and whether the exploration
+                ended within the budget.
+        """
+        reachable: Dict[str, List[Assignment]] = dict()
+        explored = 0
+        stack: List[Tuple[str, Assignment]] = [
+            (self.adapter.initial_state, ()),
+        ]
+        while stack:
+            state, assignment = stack.pop()
+            frozen = frozenset(assignment)
+            if any(
+                frozenset(other) <= frozen
+                for other in reachable.get(state, ())
+            ):
+                continue
+            if (
+                self.max_assignments is not None
+                and explored >= self.max_assignments
+            ):
+                return GuardExploration(reachable, explored, False)
+            known = reachable.setdefault(state, list())
+            # a weaker assignment makes the stronger ones redundant
+            known[:] = [
+                other for other in known if not frozen <= frozenset(other)
+            ]
+            known.append(assignment)
+            explored += 1
+            for edge in self.edges.get(state, ()):
+                for requirement in edge.requirements:
+                    merged = _merge(dict(assignment), requirement)
+                    if merged is not None:
+                        stack.append((edge.dest, _freeze(merged)))
+        return GuardExploration(reachable, explored, not self.truncated)
+
+    def path_assignment(self, path: List[str]) -> Optional[Dict[str, bool]]:
+        """Find an assignment under which the machine follows `path`.
+
+        Args:
+            path (List[str]): The states of the path, from its first state.
+
+        Returns:
+            Optional[Dict[str, bool]]: The values of the guards the path
+                depends on, None if no consistent assignment takes it.
+        """
+        seen = set()
+        stack: List[Tuple[int, Assignment]] = [(0, ())]
+        while stack:
+            position, assignment = stack.pop()
+            if position == len(path) - 1:
+                return dict(assignment)
+            if (position, assignment) in seen:
+                continue
+            seen.add((position, assignment))
+            for edge in self.edges.get(path[position], ()):
+                if edge.dest != path[position + 1]:
+                    continue
+                for requirement in edge.requirements:
+                    merged = _merge(dict(assignment), requirement)
+                    if merged is not None:
+                        stack.append((position + 1, _freeze(merged)))
+        return None
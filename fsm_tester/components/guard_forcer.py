@@ -0,0 +1,109 @@
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Optional, Union
+
+
+_MISSING = object()
+
+
+@lru_cache(maxsize=None)
+def constant_stub(name: str, value: Any) -> Callable[..., Any]:
+    """Return a callable named `name` that ignores its arguments and always
+    returns `value`. Stubs are created once per (name, value) pair.
+
+    Args:
+        name (str): The name of the guard the stub stands for.
+        value (Any): The value returned by the stub. Must be hashable.
+
+    Returns:
+        Callable[..., Any]: The stub.
+    """
+
+    def stub(*args, **kwargs):
+        return value
+
+    stub.__name__ = stub.__qualname__ = name
+    return stub
+
+
+class GuardForcer:
+    """Forces the guards of a model to constant values. Forced guards are
+    replaced on the model instance by a `constant_stub`. A guard already
+    forced to the requested value is left alone, so along a path every guard
+    is patched at most once per value it takes.
+
+    The original attributes are recorded the first time each guard is
+    forced, and put back by `restore`. Model snapshots taken while guards
+    are forced may hold stubs. `restore` still puts back every guard the
+    forcer ever touched, so it also cleans up after a restored snapshot.
+    """
+
+    def __init__(self, model: Any):
+        """
+        Args:
+            model (Any): The model whose guards are forced.
+        """
+        self.model = model
+        self._originals: Dict[str, Any] = dict()
+        self._forced: Dict[str, Any] = dict()
+
+    def rebind(self, model: Any) -> None:
+        """Restore the guards of the current model, and force the guards of
+        `model` from now on.
+
+        Args:
+            model (Any): The new model.
+        """
+        if model is self.model:
+            return
+        self.restore()
+        self.model = model
+        self._originals.clear()
+
+    def force(self, guard: Union[str, Callable], value: Any) -> None:
+        """Make `guard` return `value` until the next `restore`.
+
+        Args:
+            guard (Union[str, Callable]): The name of the guard on the
+                model. Guards given as callables cannot be patched on the
+                model, and are left untouched.
+            value (Any): The value the guard should return.
+        """
+        if not isinstance(guard, str):
+            return
+        if guard in self._forced and self._forced[guard] == value:
+            return
+        if guard not in self._originals:
+            self._originals[guard] = vars(self.model).get(guard, _MISSING)
+        setattr(self.model, guard, constant_stub(guard, value))
+        self._forced[guard] = value
+
+    def force_all(
+        self,
+        guards: Optional[Union[str, Iterable[Union[str, Callable]]]],
+        value: Any,
+    ) -> None:
+        """Force every guard of `guards` to `value`.
+
+        Args:
+            guards (Optional[Union[str, Iterable[Union[str, Callable]]]]):
+                The guards, as declared on a transition. A single name is
+                accepted as well as None, meaning no guards.
+            value (Any): The value the guards should return.
+        """
+        if guards is None:
+            return
+        if isinstance(guards, str):
+            # pytransitions accepts a single callback name instead of a list
+            guards = [guards]
+        for guard in guards:
+            self.force(guard, value)
+
+    def restore(self) -> None:
+        """Put back the original attribute of every guard forced so far."""
+        instance_attributes = vars(self.model)
+        for guard, original in self._originals.items():
+            if original is _MISSING:
+                instance_attributes.pop(guard, None)
+            else:
+                instance_attributes[guard] = original
+        self._forced.clear()
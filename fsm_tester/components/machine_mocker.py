@@ -1,8 +1,41 @@
-import networkx as nx
-from unittest import TestSuite, TestCase
-from unittest.mock import MagicMock
-from fsm_tester.typing import Adapter
-from typing import List, Iterable
+import random
+import time
+from array import array
+from unittest import TestSuite
+from fsm_tester.components.analysis_cache import MachineAnalyses
+from fsm_tester.components.callback_recorder import CallbackRecorder
+from fsm_tester.components.compact_graph import CompactGraph
+from fsm_tester.components.generated_test import GeneratedTest
+from fsm_tester.components.compiled_executor import CompiledExecutor
+from fsm_tester.components.guard_explorer import (
+    GuardExplorer,
+    GuardExploration,
+)
+from fsm_tester.components.guard_forcer import GuardForcer, constant_stub
+from fsm_tester.components.model_pool import ModelPool
+from fsm_tester.components.path_executor import PrefixSharingExecutor
+from fsm_tester.components.random_walker import RandomWalker
+from fsm_tester.entities import CoverageReport, FuzzReport, MockerOptions
+from fsm_tester.typing import (
+    Adapter,
+    DEADLOCK_MODES,
+    FUZZ_GUARDS,
+    PATH_STRATEGIES,
+)
+from typing import (
+    Any,
+    Dict,
+    List,
+    Iterable,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+)
+
+if TYPE_CHECKING:
+    from networkx import MultiDiGraph
 
 
 class MachineMocker:
@@ -11,15 +44,54 @@ class MachineMocker:
         self,
         adapter: Adapter,
         final_state: str,
-        expected_loops: int = 0,
+        options: Optional[MockerOptions] = None,
+        *,
+        graph: Optional[Union[CompactGraph, 'MultiDiGraph']] = None,
+        analyses: Optional[MachineAnalyses] = None,
     ):
+        options = options or MockerOptions()
         self.adapter = adapter
         self.transitions = self.adapter.get_transitions()
-        self.graph = self.adapter.get_graph()
+        if graph is None:
+            graph = self.adapter.get_compact_graph()
+        self.graph = CompactGraph.from_networkx(graph)
         self.final_state = final_state
-        self.expected_loops = expected_loops
+        self.options = options
+        self.expected_loops = options.expected_loops
+        self.deadlock_mode = options.deadlock_mode
+        self.path_strategy = options.path_strategy
+        self.share_prefixes = options.share_prefixes
+        self.snapshot_hook = options.snapshot_hook
+        self.restore_hook = options.restore_hook
+        self.path_budget = options.path_budget
+        if analyses is None:
+            analyses = MachineAnalyses()
+        self.analyses = analyses
+        self.guard_forcer = GuardForcer(self.adapter.fsm)
+        self.model_pool = ModelPool(
+            adapter=self.adapter,
+            strategy=options.model_strategy,
+            reset_hook=options.reset_hook,
+        )
+        self.compiled_executor = None
+        if options.execution_mode == 'compiled':
+            self.compiled_executor = CompiledExecutor(
+                adapter=self.adapter,
+                callbacks=options.compiled_callbacks,
+                cross_check_ratio=options.cross_check_ratio,
+                seed=options.cross_check_seed,
+            )
+        self.execution_mode = options.execution_mode
+        self._walkers: Dict[str, RandomWalker] = dict()
         callback = lambda attr_name, attr_value: setattr(self, attr_name, attr_value)  # noqa
         self.adapter.mimic_attributes(callback)
+        # after the model pool recorded the attributes of the model, so that
+        # cloned models drop the callbacks wrapped for another instance
+        self.callback_recorder = CallbackRecorder(
+            adapter=self.adapter,
+            policy=options.callback_policy,
+        )
+        self.callback_recorder.instrument(self.adapter.fsm)
 
     @staticmethod
     def mock_ensemble(
@@ -29,7 +101,8 @@ class MachineMocker:
     ) -> None:
         """Given a set of callables that needed to be mocked, and a callback
         function that will be called to inject the mock objects, this method
-        will create the mock objects and inject them into the callback.
+        will inject a constant stub returning `expected_return_value` for
+        each of them into the callback.
 
         Args:
             callback (callable): A function that will be called to inject the
@@ -37,22 +110,46 @@ class MachineMocker:
             callable_ensemble (Iterable[str]): A set of callables that need to
                 be mocked.
         """
+        if isinstance(callable_ensemble, str):
+            # pytransitions accepts a single callback name instead of a list
+            callable_ensemble = [callable_ensemble]
         callable_ensemble = list(callable_ensemble)
         for callable_ in callable_ensemble:
-            mock = MagicMock(return_value=expected_return_value)
-            callback(callable_, mock)
+            callback(
+                callable_,
+                constant_stub(callable_, expected_return_value),
+            )
+
+    def reset_model(self) -> Any:
+        """Bring the FSM back to its initial state with a clean model from
+        `model_pool`, installed as `adapter.fsm`, with the callback policy
+        applied.
+
+        Returns:
+            Any: The clean model.
+        """
+        model = self.model_pool.fresh()
+        self.callback_recorder.instrument(model)
+        return model
 
     def execute_transition(
         self,
         source: str,
         dest: str,
     ) -> str:
-        """Execute a transition from source to dest. This function
-        shall execute each of the `before` functions in the transition
-        definition, then mock the `conditions` and `unless` functions
-        to allow the transition to happen, execute the transition
-        and then execute each of the `after` functions in the
-        transition definition.
+        """Execute a transition from source to dest. This function forces
+        the `conditions` and `unless` functions to allow the transition to
+        happen, and fires its trigger. The `prepare`, `before`, `on_exit`,
+        `on_enter` and `after` callbacks are run by the FSM library, as the
+        `callback_recorder` policy dictates.
+
+        Guards stay forced after the transition, so the next transitions of a
+        path only patch the guards whose value changes. Call
+        `guard_forcer.restore` once the path is done.
+
+        In `compiled` execution mode the transition is looked up in the
+        precompiled table and applied directly, except for a seeded sample
+        of transitions that are cross-checked through the real trigger.
 
         Args:
             source (str): The source state of the transition.
@@ -62,45 +159,202 @@ class MachineMocker:
         Returns:
             str: The name of the transition function that was executed.
         """
+        if self.guard_forcer.model is not self.adapter.fsm:
+            self.guard_forcer.rebind(self.adapter.fsm)
+        if (
+            self.compiled_executor is not None
+            and not self.compiled_executor.should_cross_check()
+        ):
+            return self.compiled_executor.execute(source, dest)
         transition = self.adapter.get_transition(source, dest)
         transition_function_ref = self.adapter.get_transition_function(
             transition=transition,
         )
 
-        def callback(condition, mock):
-            setattr(self.adapter.fsm, condition, mock)
-
-        # for before in transition.before:
-        #     func = getattr(
-        #         self,
-        #         before,
-        #     )
-        #     func()
-        if transition.conditions is not None:
-            self.mock_ensemble(
-                callback=callback,
-                callable_ensemble=transition.conditions,
-                expected_return_value=True,
-            )
-        if transition.unless is not None:
-            self.mock_ensemble(
-                callback=callback,
-                callable_ensemble=transition.unless,
-                expected_return_value=False,
-            )
+        self.guard_forcer.force_all(transition.conditions, True)
+        self.guard_forcer.force_all(transition.unless, False)
         transition_function_ref()
-        # for after in transition.after:
-        #     func = getattr(
-        #         self,
-        #         after,
-        #     )
-        #     func()
         return transition.name
 
-    def unreachable_states_suite(self) -> TestSuite:
+    def check_path(
+        self,
+        path: List[str],
+        executor: Optional[PrefixSharingExecutor] = None,
+    ) -> None:
+        """Assert that the given path is reachable. This method will bring
+        the FSM to the start of the path (resetting it, or restoring the
+        snapshot of a shared prefix through `executor`), then execute each of
+        the remaining transitions in the path, asserting that the state
+        attribute of the machine is the expected state after each transition.
+
+        Args:
+            path (List[str]): The path to check for reachability.
+            executor (Optional[PrefixSharingExecutor]): Shares the executed
+                prefixes between paths. Defaults to resetting the FSM and
+                replaying the whole path.
+        """
+        traceback = list()
+
+        def step(source: str, dest: str) -> str:
+            # execute transition
+            t_name = self.execute_transition(
+                source=source,
+                dest=dest,
+            )
+            traceback.append(t_name)
+            errormsg = f'''Machine should have been in state {dest},
+                        but is in state {getattr(self.adapter.fsm, self.adapter.state_attr)}
+                        after executing {t_name}. \n Path: {path} \n Traceback: {traceback}'''  # noqa
+            assert getattr(
+                self.adapter.fsm,
+                self.adapter.state_attr,
+            ) == dest, errormsg
+            return t_name
+
+        try:
+            if executor is not None:
+                executor.run(path, step)
+                return
+            self.reset_model()
+            for i in range(len(path) - 1):
+                step(path[i], path[i + 1])
+        finally:
+            self.guard_forcer.restore()
+
+    def _execute_path(self, path: List[str]) -> None:
+        """Execute a path. This method will execute each of the transitions
+        in the path, from the initial state to the final state, asserting
+        that the state attribute of the machine is the expected state after
+        each transition.
+
+        Args:
+            path (List[str]): A List of strings that represent the name of
+                the states in the path that should be executed by the
+                machine.
+        """
+        for i in range(len(path) - 1):
+            source = path[i]
+            dest = path[i + 1]
+            self.execute_transition(
+                source=source,
+                dest=dest,
+            )
+        assert getattr(
+            self.adapter.fsm,
+            self.adapter.state_attr,
+        ) == path[-1], f'Machine should have been in state {path[-1]}, but is in state {getattr(self.adapter.fsm, self.adapter.state_attr)}'  # noqa
+
+    def _loop_trees(self) -> Tuple[Any, Optional[Any]]:
+        """Build the BFS tree from the initial state and the reverse BFS tree
+        towards the final state, shared by every loop test. The trees are
+        memoized in `self.analyses`.
+
+        Returns:
+            Tuple[Any, Optional[Any]]: The BFS parents leading from the
+                initial state to each state, and the next hop from each state
+                towards the final state, None if the final state is not part
+                of the graph.
+        """
+        def compute():
+            escape_tree = None
+            if self.final_state in self.graph:
+                escape_tree = self.graph.reverse_bfs_tree(self.final_state)
+            return (
+                self.graph.bfs_tree(self.adapter.initial_state),
+                escape_tree,
+            )
+        return self.analyses.get_or_compute(
+            f'loop_trees:{self.final_state}',
+            compute,
+        )
+
+    def check_loop(self, loop: List[str]) -> None:
+        """Assert that the given loop is not a dead lock. This method will
+        first read a shortest path from the initial state to the first state
+        of the loop, then execute the path. After executing the path, the
+        method will execute the loop N times, asserting that the machine is
+        not in the loop after each execution, and leave it through a
+        shortest escape path to the final state. Both paths are read from
+        the trees of `_loop_trees`.
+
+        Args:
+            loop (List[str]): A List of strings that represent the name of
+                the states in the loop that should be executed by the
+                machine.
+        """
+        self.reset_model()
+        to_loop_tree, escape_tree = self._loop_trees()
+        path_to_loop = self.graph.tree_path(to_loop_tree, loop[0])
+        assert path_to_loop is not None, (
+            f'Loop {loop} is unreachable from the initial state'
+        )
+        escape_path = None
+        if escape_tree is not None:
+            escape_path = self.graph.tree_path(
+                escape_tree,
+                loop[0],
+                reverse=True,
+            )
+        if escape_path is None or len(escape_path) == 0:
+            assert False, f'Deadlock Detected in loop {loop}'
+        try:
+            self._execute_path(path_to_loop)
+            for exec_n in range(self.expected_loops):
+                if exec_n > self.expected_loops:
+                    assert False, f'Deadlock Detected in loop {loop}'
+                self._execute_path(loop)
+                self.execute_transition(
+                    source=loop[-1],
+                    dest=loop[0],
+                )
+                if exec_n == self.expected_loops - 1:
+                    self._execute_path(escape_path)
+        finally:
+            self.guard_forcer.restore()
+        assert getattr(
+            self.adapter.fsm,
+            self.adapter.state_attr,
+        ) not in loop, f'Machine should not be in loop {loop}, but is in state {getattr(self.adapter.fsm, self.adapter.state_attr)}, part of the following loop:\n {loop}'  # noqa
+
+    def check_inescapable_loop(self, states: List[str]) -> None:
+        """Report a looping component with no path to the final state.
+
+        Args:
+            states (List[str]): The states of the component.
+        """
+        assert False, f'Deadlock Detected in loop {states}, no state of the loop can reach {self.final_state}'  # noqa
+
+    def unreachable_states_suite(
+        self,
+        strategy: Optional[PATH_STRATEGIES] = None,
+    ) -> TestSuite:
         """Generate test cases to check if there are unreachable states in the
-        FSM. This method will generate a test function for each state in the
-        FSM, checking if the state is reachable from the initial state.
+        FSM. This method will generate a test function for each planned path,
+        checking that the machine follows it from the initial state.
+
+        With the `coverage` strategy, a small set of paths that traverses
+        every reachable state and transition at least once is planned. With
+        the `exhaustive` strategy every simple path to every state is
+        executed, which grows combinatorially with the size of the FSM.
+
+        When `share_prefixes` is set, the tests are ordered so that paths
+        sharing a prefix run one after the other, and each path continues
+        from a snapshot of the model where it diverges from the previous one
+        instead of replaying the whole prefix.
+
+        The `exhaustive` strategy honours the mocker `path_budget`: states
+        with more paths than allowed, or left once the time budget runs out,
+        get a seeded random sample of paths instead, one per first divergence
+        edge. The state and transition coverage achieved is attached to the
+        suite as `coverage`.
+
+        Args:
+            strategy (Optional[PATH_STRATEGIES]): The path generation
+                strategy. Defaults to the strategy the mocker was created
+                with.
+
+        Raises:
+            ValueError: For strategies not recognized.
 
         Returns:
             TestSuite: A test suite containing test cases for each state in the
@@ -109,10 +363,7 @@ class MachineMocker:
 
         def test_path(path: List[str]) -> callable:
             """Generate a test function that will check if the given path is
-            reachable. This function will execute each of the transitions in
-            the path, from the initial state to the final state, asserting
-            that the state attribute of the machine is the expected state
-            after each transition.
+            reachable, with `check_path`.
 
             Args:
                 path (List[str]): The path to check for reachability.
@@ -122,29 +373,7 @@ class MachineMocker:
             """
 
             def assert_function(*args, **kwargs):
-                """Assert that the given path is reachable. This function will
-                reset the FSM, then execute each of the transitions in the
-                path, asserting that the state attribute of the machine is the
-                expected state after each transition.
-                """
-                self.adapter.reset_fsm()
-                traceback = list()
-                for i in range(len(path) - 1):
-                    source = path[i]
-                    dest = path[i + 1]
-                    # execute transition
-                    t_name = self.execute_transition(
-                        source=source,
-                        dest=dest,
-                    )
-                    traceback.append(t_name)
-                    errormsg = f'''Machine should have been in state {dest},
-                                but is in state {getattr(self.adapter.fsm, self.adapter.state_attr)}
-                                after executing {t_name}. \n Traceback: {traceback}'''  # noqa
-                    assert getattr(
-                        self.adapter.fsm,
-                        self.adapter.state_attr,
-                    ) == dest, errormsg
+                self.check_path(path, executor=executor)
 
             return assert_function
 
@@ -157,126 +386,440 @@ class MachineMocker:
         setattr(
             testsuite,
             'suite_name',
-            'unreachable_states_suite',
+            'machine_execution_suite',
         )
-        for state in self.graph.nodes:
-            paths = list(nx.all_simple_paths(
-                self.graph,
-                self.adapter.initial_state,
-                state,
-            ))
-            for idx, path in enumerate([path for path in paths
-                                        if len(path) > 1]):
-                testcase_name = f'test_transition_{idx}_to_{state}'
-                _callable = test_path(path)
-                _callable.__name__ = testcase_name
-                setattr(
-                    TestCase,
-                    testcase_name,
-                    _callable,
-                )
-                testcase = TestCase(
-                    testcase_name,
-                )
-                testcase._class_cleanups = list()
-                testsuite.addTest(testcase)
+        setattr(testsuite, 'callback_recorder', self.callback_recorder)
+        strategy = strategy or self.path_strategy
+        sampled_states = list()
+        if strategy == 'coverage':
+            planned_paths = self._find_coverage_paths()
+        elif strategy == 'exhaustive' and self.path_budget.is_bounded:
+            planned_paths, sampled_states = self._find_budgeted_paths()
+        elif strategy == 'exhaustive':
+            planned_paths = self._find_paths()
+        else:
+            raise ValueError(f'Path strategy {strategy} not recognized.')
+        planned_tests = [
+            (path, f'test_transition_{idx}_to_{state}')
+            for state, paths in planned_paths.items()
+            for idx, path in enumerate(paths)
+        ]
+        executor = None
+        if self.share_prefixes:
+            executor = PrefixSharingExecutor(
+                adapter=self.adapter,
+                paths=[path for path, _ in planned_tests],
+                snapshot_hook=self.snapshot_hook,
+                restore_hook=self.restore_hook,
+                reset=self.reset_model,
+            )
+            planned_tests.sort(key=lambda planned: planned[0])
+        setattr(testsuite, 'executor', executor)
+        setattr(
+            testsuite,
+            'specs',
+            [
+                (testcase_name, 'path', path)
+                for path, testcase_name in planned_tests
+            ],
+        )
+        reachable = self.graph.descendants(self.adapter.initial_state)
+        setattr(
+            testsuite,
+            'coverage',
+            self._coverage_report(
+                paths=[path for path, _ in planned_tests],
+                states=reachable,
+                transitions={
+                    (source, dest)
+                    for source, dest, _ in self.graph.edges()
+                    if source in reachable
+                },
+                sampled_states=sampled_states,
+            ),
+        )
+        for path, testcase_name in planned_tests:
+            _callable = test_path(path)
+            testsuite.addTest(GeneratedTest(testcase_name, _callable))
         return testsuite
 
-    def _find_loops(self) -> List[List[str]]:
-        """Find all loops in the FSM. This method will use the networkx
-        library to find all simple cycles in the FSM.
+    def _find_paths(self) -> Dict[str, List[List[str]]]:
+        """Find every simple path from the initial state to each state of the
+        FSM. The path plan is memoized in `self.analyses`.
 
         Returns:
-            List[List[str]]: A list of all loops in the FSM.
+            Dict[str, List[List[str]]]: The paths leading to each state.
         """
-        return list(nx.simple_cycles(self.graph))
+        def compute():
+            return {
+                state: [
+                    path for path in self.graph.all_simple_paths(
+                        self.adapter.initial_state,
+                        state,
+                    ) if len(path) > 1
+                ]
+                for state in self.graph.nodes
+            }
+        return self.analyses.get_or_compute('paths', compute)
 
-    def _find_path(self, source: str, dest: str) -> List[str]:
-        """Find a path from source to dest. This method will use the networkx
-        library to find a simple path from source to dest.
+    def _sample_paths(
+        self,
+        state: str,
+        count: Optional[int],
+        rng: random.Random,
+        found: Iterable[List[str]] = (),
+        parents: Optional[array] = None,
+        deadline: Optional[float] = None,
+    ) -> List[List[str]]:
+        """Sample paths from the initial state to `state`, stratified by
+        their first divergence edge from the shortest path. The shortest path
+        not already found is always part of the sample.
 
         Args:
-            source (str): The source state of the path.
-            dest (str): The destination state of the path.
+            state (str): The state the paths lead to.
+            count (Optional[int]): The number of paths to return, every
+                stratum if None.
+            rng (random.Random): The source of randomness.
+            found (Iterable[List[str]]): Paths already enumerated, kept
+                first and topped up with sampled paths up to `count`.
+            parents (Optional[array]): The BFS tree of the initial state,
+                shared by the samples of every state. Built if None.
+            deadline (Optional[float]): A `time.monotonic` instant after
+                which only the shortest path is added. Defaults to no
+                deadline.
+
+        Returns:
+            List[List[str]]: The found and sampled paths, each with at least
+                one edge.
+        """
+        found = list(found)
+        known = {tuple(path) for path in found}
+        max_length = self.path_budget.max_path_length
+        strata = [
+            path for _, path in self.graph.divergent_paths(
+                self.adapter.initial_state,
+                state,
+                parents=parents,
+                deadline=deadline,
+            )
+            if len(path) > 1
+            and (max_length is None or len(path) - 1 <= max_length)
+            and tuple(path) not in known
+        ]
+        if count is not None:
+            count -= len(found)
+        if count is None or len(strata) <= count:
+            return found + strata
+        if count < 1:
+            return found
+        canonical, *rest = strata
+        picked = sorted(rng.sample(range(len(rest)), count - 1))
+        return found + [canonical] + [rest[idx] for idx in picked]
+
+    def _find_budgeted_paths(
+        self,
+    ) -> Tuple[Dict[str, List[List[str]]], List[str]]:
+        """Find the simple paths from the initial state to each state of the
+        FSM within the mocker `path_budget`. Paths are enumerated until a
+        state exceeds `max_paths_per_state`, after which its paths are
+        sampled with `_sample_paths` instead. When the `time_budget` runs
+        out, the enumeration stops, even between two paths; the paths found
+        so far are kept, topped up with the shortest path, and every
+        remaining state only gets its shortest path. Paths longer than
+        `max_path_length` are never generated.
+
+        Sampling is seeded per state, so plans only depend on the budget and
+        the machine, except for where the time budget runs out. Plans
+        without a time budget are memoized in `self.analyses`.
 
         Returns:
-            List[str]: The path from source to dest.
+            Tuple[Dict[str, List[List[str]]], List[str]]: The paths leading
+                to each state, and the states whose paths were sampled.
         """
-        return nx.shortest_path(
-            self.graph,
-            source=source,
-            target=dest,
+        budget = self.path_budget
+
+        def compute():
+            deadline = None
+            if budget.time_budget is not None:
+                deadline = time.monotonic() + budget.time_budget
+            paths_by_state = dict()
+            sampled_states = list()
+            parents = self.graph.bfs_tree(self.adapter.initial_state)
+            for state in self.graph.nodes:
+                paths = list()
+                over_budget = False
+                for path in self.graph.all_simple_paths(
+                    self.adapter.initial_state,
+                    state,
+                    cutoff=budget.max_path_length,
+                    deadline=deadline,
+                ):
+                    if len(path) <= 1:
+                        continue
+                    if (
+                        budget.max_paths_per_state is not None
+                        and len(paths) >= budget.max_paths_per_state
+                    ):
+                        over_budget = True
+                        break
+                    paths.append(path)
+                out_of_time = (
+                    not over_budget
+                    and deadline is not None
+                    and time.monotonic() >= deadline
+                )
+                if over_budget or out_of_time:
+                    paths = self._sample_paths(
+                        state,
+                        count=budget.max_paths_per_state,
+                        rng=random.Random(f'{budget.seed}:{state}'),
+                        found=paths if out_of_time else (),
+                        parents=parents,
+                        deadline=deadline,
+                    )
+                    sampled_states.append(state)
+                paths_by_state[state] = paths
+            return paths_by_state, sampled_states
+
+        if budget.time_budget is not None:
+            return compute()
+        return self.analyses.get_or_compute(
+            f'paths:max_paths={budget.max_paths_per_state},'
+            f'max_length={budget.max_path_length},seed={budget.seed}',
+            compute,
         )
 
-    def _find_escape_path(self, source: str) -> List[str]:
-        """Find an escape path from a loop. This method will find a path from
-        the given destination state to the final state of the FSM. It tries to
-        find a path to the final state, if it fails, it will find the shortest
-        path from the destination state to the final state.
+    @staticmethod
+    def _coverage_report(
+        paths: Iterable[List[str]],
+        states: Set[str],
+        transitions: Set[Tuple[str, str]],
+        sampled_states: Iterable[str] = (),
+        closed: bool = False,
+    ) -> CoverageReport:
+        """Measure the states and transitions exercised by a set of paths.
 
         Args:
-            dest (str): The destination state of the loop.
+            paths (Iterable[List[str]]): The executed paths.
+            states (Set[str]): The states that could have been covered.
+            transitions (Set[Tuple[str, str]]): The (source, destination)
+                pairs that could have been covered.
+            sampled_states (Iterable[str]): The states whose paths or loops
+                were sampled.
+            closed (bool): True if the paths are loops, which also take the
+                transition from their last state back to the first.
 
         Returns:
-            List[str]: The escape path from the loop.
+            CoverageReport: The achieved coverage.
         """
-        # TODO: Try to find scape paths from each state in the loop
-        try:
-            paths = nx.shortest_path(
-                self.graph,
-                source=source,
-            )
-            recover_path = None
-            if self.final_state in paths.keys():
-                recover_path = paths[self.final_state]
-            else:
-                shortest_path = min(paths.values(), key=len)
-                for path in paths.values():
-                    if len(path) == shortest_path:
-                        recover_path = path
-            return recover_path
-        except nx.exception.NodeNotFound:
-            return list()
+        covered_states = set()
+        covered_transitions = set()
+        for path in paths:
+            covered_states.update(path)
+            covered_transitions.update(zip(path, path[1:]))
+            if closed:
+                covered_transitions.add((path[-1], path[0]))
+        return CoverageReport(
+            states_covered=len(covered_states & states),
+            states_total=len(states),
+            transitions_covered=len(covered_transitions & transitions),
+            transitions_total=len(transitions),
+            sampled_states=list(sampled_states),
+        )
+
+    def _find_coverage_paths(self) -> Dict[str, List[List[str]]]:
+        """Plan a small set of paths from the initial state that covers every
+        reachable state and transition of the FSM. The path plan is memoized
+        in `self.analyses`.
+
+        Returns:
+            Dict[str, List[List[str]]]: The planned paths, grouped by the
+                state they end in.
+        """
+        def compute():
+            paths_by_state = {state: list() for state in self.graph.nodes}
+            for path in self.graph.edge_cover_paths(
+                self.adapter.initial_state,
+            ):
+                paths_by_state[path[-1]].append(path)
+            return paths_by_state
+        return self.analyses.get_or_compute('paths:coverage', compute)
+
+    def _find_loops(self) -> List[List[str]]:
+        """Find all loops in the FSM, that is, every simple cycle of the
+        graph. The result is memoized in `self.analyses`.
+
+        Returns:
+            List[List[str]]: A list of all loops in the FSM.
+        """
+        return self.analyses.get_or_compute(
+            'loops',
+            lambda: list(self.graph.simple_cycles()),
+        )
+
+    def _find_budgeted_loops(self) -> Tuple[List[List[str]], List[str]]:
+        """Find the loops of the FSM within the mocker `path_budget`. Loops
+        longer than `max_path_length` states are skipped, and each state
+        starts at most `max_paths_per_state` loops, kept by seeded reservoir
+        sampling. Once the `time_budget` runs out, the enumeration stops and
+        every looping component not covered yet gets a witness loop through
+        a randomly picked state. Results without a time budget are memoized
+        in `self.analyses`.
+
+        Returns:
+            Tuple[List[List[str]], List[str]]: The loops, and the states
+                whose loops were sampled.
+        """
+        budget = self.path_budget
+
+        def compute():
+            rng = random.Random(budget.seed)
+            deadline = None
+            if budget.time_budget is not None:
+                deadline = time.monotonic() + budget.time_budget
+            loops_by_state = dict()
+            seen = dict()
+            sampled_states = list()
+            timed_out = False
+            for loop in self.graph.simple_cycles(
+                max_length=budget.max_path_length,
+            ):
+                if deadline is not None and time.monotonic() >= deadline:
+                    timed_out = True
+                    break
+                state = loop[0]
+                kept = loops_by_state.setdefault(state, list())
+                seen[state] = seen.get(state, 0) + 1
+                if (
+                    budget.max_paths_per_state is None
+                    or len(kept) < budget.max_paths_per_state
+                ):
+                    kept.append(loop)
+                    continue
+                if state not in sampled_states:
+                    sampled_states.append(state)
+                slot = rng.randrange(seen[state])
+                if slot < len(kept):
+                    kept[slot] = loop
+            loops = [loop for kept in loops_by_state.values() for loop in kept]
+            if timed_out:
+                covered = {state for loop in loops for state in loop}
+                components, _ = self.graph.condensation()
+                for component in components:
+                    names = [self.graph.names[node] for node in component]
+                    if (
+                        not self.graph.is_cyclic_component(component)
+                        or covered.intersection(names)
+                    ):
+                        continue
+                    loop = self.graph.shortest_cycle_through(
+                        rng.choice(component),
+                        component,
+                    )
+                    if loop is None or (
+                        budget.max_path_length is not None
+                        and len(loop) > budget.max_path_length
+                    ):
+                        continue
+                    loops.append(loop)
+                    sampled_states.extend(names)
+            return loops, sampled_states
 
-    def dead_lock_suite(self) -> TestSuite:
+        if budget.time_budget is not None:
+            return compute()
+        return self.analyses.get_or_compute(
+            f'loops:max_loops={budget.max_paths_per_state},'
+            f'max_length={budget.max_path_length},seed={budget.seed}',
+            compute,
+        )
+
+    def _find_deadlock_components(self) -> List[Dict[str, Any]]:
+        """Find the strongly connected components of the FSM that contain a
+        loop, and whether each of them can reach the final state. The check
+        runs over the condensation DAG, so it takes linear time however many
+        simple cycles the components hold. The result is memoized in
+        `self.analyses`.
+
+        Returns:
+            List[Dict[str, Any]]: For each looping component, its `states`,
+                a `witness` loop through the component state closest to the
+                initial state, and whether it is `escapable`.
+        """
+        def compute():
+            components, membership = self.graph.condensation()
+            final = self.graph.indices.get(self.final_state)
+            distances = self.graph.bfs_distances(self.adapter.initial_state)
+            reaches_final = bytearray(len(components))
+            deadlock_components = list()
+            # components come in reverse topological order, so every
+            # component reachable from the current one is already resolved
+            for component_id, component in enumerate(components):
+                if final is not None and membership[final] == component_id:
+                    reaches_final[component_id] = 1
+                else:
+                    reaches_final[component_id] = any(
+                        reaches_final[membership[target]]
+                        for node in component
+                        for target in self.graph.successor_ids(node)
+                        if membership[target] != component_id
+                    )
+                if not self.graph.is_cyclic_component(component):
+                    continue
+                entry = min(
+                    component,
+                    key=lambda node: (
+                        distances[node] == -1,
+                        distances[node],
+                        node,
+                    ),
+                )
+                deadlock_components.append({
+                    'states': [self.graph.names[node] for node in component],
+                    'witness': self.graph.shortest_cycle_through(
+                        entry,
+                        component,
+                    ),
+                    'escapable': bool(reaches_final[component_id]),
+                })
+            deadlock_components.reverse()
+            return deadlock_components
+        return self.analyses.get_or_compute(
+            f'deadlock_components:{self.final_state}',
+            compute,
+        )
+
+    def dead_lock_suite(
+        self,
+        mode: Optional[DEADLOCK_MODES] = None,
+    ) -> TestSuite:
         """Generate test cases to check if there are dead lock states in the
         FSM. This method will first identify if there are any loops in the FSM,
         them check if the machine is able to escape the loop.
 
+        In `scc` mode, loops are grouped by strongly connected component: a
+        component that cannot reach the final state is reported as a dead
+        lock, and one witness loop per remaining component is executed. In
+        `cycles` mode, every simple cycle is executed, which may take
+        exponential time on densely looped machines, unless bounded by the
+        mocker `path_budget`. The state and transition coverage of the
+        executed loops, over the looping components, is attached to the
+        suite as `coverage`.
+
+        Args:
+            mode (Optional[DEADLOCK_MODES]): The deadlock analysis mode.
+                Defaults to the mode the mocker was created with.
+
+        Raises:
+            ValueError: For modes not recognized.
+
         Returns:
             TestSuite: A test suite containing test cases for each loop in the
                 FSM.
         """
 
-        def execute_path(path: List[str]) -> None:
-            """Execute a path. This method will execute each of the transitions
-            in the path, from the initial state to the final state, asserting
-            that the state attribute of the machine is the expected state after
-            each transition.
-
-            Args:
-                path (List[str]): A List of strings that represent the name of
-                    the states in the path that should be executed by the
-                    machine.
-            """
-            for i in range(len(path) - 1):
-                source = path[i]
-                dest = path[i + 1]
-                self.execute_transition(
-                    source=source,
-                    dest=dest,
-                )
-            assert getattr(
-                self.adapter.fsm,
-                self.adapter.state_attr,
-            ) == path[-1], f'Machine should have been in state {path[-1]}, but is in state {getattr(self.adapter.fsm, self.adapter.state_attr)}'  # noqa
-
         def _test_deadlock(loop: List[str]) -> callable:
             """Generate a test function that will check if the given loop is a
-            dead lock. This function will first find a path from the initial
-            state to the first state of the loop, then execute the path. After
-            executing the path, the function will execute the loop N times,
-            asserting that the machine is not in the loop after each execution.
+            dead lock, with `check_loop`.
 
             Args:
                 loop (List[str]): A List of strings that represent the name of
@@ -287,41 +830,56 @@ class MachineMocker:
                 callable: The test function.
             """
             def assert_function(*args, **kwargs):
-                """Assert that the given loop is not a dead lock. This function
-                will first find a path from the initial state to the first
-                state of the loop, then execute the path. After executing the
-                path, the function will execute the loop N times, asserting
-                that the machine is not in the loop after each execution.
-                """
-                self.adapter.reset_fsm()
-                path_to_loop = self._find_path(
-                    source=self.adapter.initial_state,
-                    dest=loop[0],
-                )
-                escape_path = self._find_escape_path(
-                    loop[-0],
-                )
-                if escape_path is None or len(escape_path) == 0:
-                    assert False, f'Deadlock Detected in loop {loop}'
-                execute_path(path_to_loop)
-                for exec_n in range(self.expected_loops):
-                    if exec_n > self.expected_loops:
-                        assert False, f'Deadlock Detected in loop {loop}'
-                    execute_path(loop)
-                    self.execute_transition(
-                        source=loop[-1],
-                        dest=loop[0],
-                    )
-                    if exec_n == self.expected_loops - 1:
-                        execute_path(escape_path)
-                assert getattr(
-                    self.adapter.fsm,
-                    self.adapter.state_attr,
-                ) not in loop, f'Machine should not be in loop {loop}, but is in state {getattr(self.adapter.fsm, self.adapter.state_attr)}, part of the following loop:\n {loop}'  # noqa
+                self.check_loop(loop)
 
             return assert_function
 
-        loops = self._find_loops()
+        def _test_deadlock_component(states: List[str]) -> callable:
+            """Generate a test function that reports a looping component
+            with no path to the final state, with `check_inescapable_loop`.
+
+            Args:
+                states (List[str]): The states of the component.
+
+            Returns:
+                callable: The test function.
+            """
+            def assert_function(*args, **kwargs):
+                self.check_inescapable_loop(states)
+            return assert_function
+
+        mode = mode or self.deadlock_mode
+        sampled_states = list()
+        if mode == 'scc':
+            generated_tests = list()
+            executed_loops = list()
+            for component in self._find_deadlock_components():
+                if component['escapable']:
+                    loop = component['witness']
+                    generated_tests.append(
+                        (loop, 'loop', _test_deadlock(loop)),
+                    )
+                    executed_loops.append(loop)
+                else:
+                    states = component['states']
+                    generated_tests.append(
+                        (
+                            states,
+                            'inescapable_loop',
+                            _test_deadlock_component(states),
+                        ),
+                    )
+        elif mode == 'cycles':
+            if self.path_budget.is_bounded:
+                executed_loops, sampled_states = self._find_budgeted_loops()
+            else:
+                executed_loops = self._find_loops()
+            generated_tests = [
+                (loop, 'loop', _test_deadlock(loop))
+                for loop in executed_loops
+            ]
+        else:
+            raise ValueError(f'Deadlock mode {mode} not recognized.')
         testsuite = TestSuite()
         setattr(
             testsuite,
@@ -333,17 +891,242 @@ class MachineMocker:
             'suite_name',
             'dead_lock_suite',
         )
-        for loop in loops:
+        setattr(testsuite, 'callback_recorder', self.callback_recorder)
+        components, membership = self.graph.condensation()
+        looping = {
+            node for component in components
+            if self.graph.is_cyclic_component(component)
+            for node in component
+        }
+        setattr(
+            testsuite,
+            'coverage',
+            self._coverage_report(
+                paths=executed_loops,
+                states={self.graph.names[node] for node in looping},
+                transitions={
+                    (self.graph.names[source], self.graph.names[target])
+                    for source in looping
+                    for target in self.graph.successor_ids(source)
+                    if membership[source] == membership[target]
+                },
+                sampled_states=sampled_states,
+                closed=True,
+            ),
+        )
+        setattr(
+            testsuite,
+            'specs',
+            [
+                (f'test_deadlock_{loop}', kind, loop)
+                for loop, kind, _ in generated_tests
+            ],
+        )
+        for loop, _, _callable in generated_tests:
             testcase_name = f'test_deadlock_{loop}'
-            _callable = _test_deadlock(loop)
-            setattr(
-                TestCase,
-                testcase_name,
-                _callable,
-            )
-            testcase = TestCase(
-                testcase_name,
+            testsuite.addTest(GeneratedTest(testcase_name, _callable))
+        return testsuite
+
+    def guard_explorer(
+        self,
+        max_assignments: Optional[int] = None,
+    ) -> GuardExplorer:
+        """Build a `GuardExplorer` over the adapter of the mocker.
+
+        Args:
+            max_assignments (Optional[int]): The most pairs of state and
+                assignment explored. Defaults to no limit.
+
+        Returns:
+            GuardExplorer: The explorer.
+        """
+        return GuardExplorer(
+            adapter=self.adapter,
+            max_assignments=max_assignments,
+        )
+
+    def explore_guards(
+        self,
+        max_assignments: Optional[int] = None,
+    ) -> GuardExploration:
+        """Explore the states reachable under consistent truth assignments
+        of the guards, with `GuardExplorer.explore`. The exploration is
+        memoized in `self.analyses`.
+
+        Args:
+            max_assignments (Optional[int]): The most pairs of state and
+                assignment explored, and the most assignments kept per
+                transition. Defaults to no limit.
+
+        Returns:
+            GuardExploration: The states reached and the minimal
+                assignments each is reachable under.
+        """
+        return self.analyses.get_or_compute(
+            f'guard_assignments:max_assignments={max_assignments}',
+            lambda: self.guard_explorer(max_assignments).explore(),
+        )
+
+    def infeasible_states(
+        self,
+        max_assignments: Optional[int] = None,
+    ) -> List[str]:
+        """List the states reachable in the graph that no consistent truth
+        assignment of the guards reaches. States the budget did not let the
+        exploration rule out are not listed.
+
+        Args:
+            max_assignments (Optional[int]): The most pairs of state and
+                assignment explored. Defaults to no limit.
+
+        Returns:
+            List[str]: The infeasible states.
+        """
+        exploration = self.explore_guards(max_assignments)
+        if not exploration.complete:
+            return list()
+        return sorted(
+            state
+            for state in self.graph.descendants(self.adapter.initial_state)
+            if state not in exploration.reachable
+        )
+
+    def _walker(self, guards: FUZZ_GUARDS) -> RandomWalker:
+        """The random walker of a guard mode, built on first use."""
+        if guards not in self._walkers:
+            self._walkers[guards] = RandomWalker(
+                adapter=self.adapter,
+                guard_forcer=self.guard_forcer,
+                reset=self.reset_model,
+                guards=guards,
+                compiled_executor=self.compiled_executor,
             )
-            testcase._class_cleanups = list()
-            testsuite.addTest(testcase)
+        return self._walkers[guards]
+
+    def random_walk(
+        self,
+        seed: int,
+        walk_length: int,
+        guards: FUZZ_GUARDS = 'real',
+    ) -> int:
+        """Walk the machine from its initial state, firing random triggers
+        leaving the current state. Replays a walk reported by `fuzz_suite`
+        from its seed.
+
+        Args:
+            seed (int): The seed of the walk.
+            walk_length (int): The maximum number of triggers fired.
+            guards (FUZZ_GUARDS): Whether the triggers evaluate the real
+                guards, or guards forced to random values. Defaults to
+                `real`.
+
+        Raises:
+            AssertionError: If the machine ends up in a state the fired
+                trigger cannot lead to.
+
+        Returns:
+            int: The number of triggers fired.
+        """
+        return self._walker(guards).walk(seed, walk_length)
+
+    def fuzz_suite(
+        self,
+        walks: int = 100,
+        walk_length: int = 100,
+        seed: int = 0,
+        guards: FUZZ_GUARDS = 'real',
+        batch_size: int = 50,
+    ) -> TestSuite:
+        """Generate test cases running seeded random walks over the machine,
+        with `random_walk`. Each test case runs a batch of walks, and fails
+        with the seed, triggers and error of every failed walk of its batch.
+        Callback exceptions are reported as walk failures, as well as
+        triggers leaving the machine in a state they cannot lead to.
+
+        The seed of every walk is drawn from `seed`. The walks, fired
+        transitions, elapsed time and failed seeds of the suite are gathered
+        in a `FuzzReport`, attached to the suite as `fuzz_report` and filled
+        as the batches run.
+
+        Args:
+            walks (int): The number of walks. Defaults to 100.
+            walk_length (int): The maximum number of triggers fired per
+                walk. Defaults to 100.
+            seed (int): The seed the walk seeds are drawn from. Defaults to
+                0.
+            guards (FUZZ_GUARDS): Whether the triggers evaluate the real
+                guards, or guards forced to random values. Defaults to
+                `real`.
+            batch_size (int): The number of walks per test case. Defaults to
+                50.
+
+        Raises:
+            ValueError: For guard modes not recognized.
+
+        Returns:
+            TestSuite: A test suite containing a test case per batch of
+                walks.
+        """
+        walker = self._walker(guards)
+        rng = random.Random(seed)
+        walk_seeds = [rng.getrandbits(32) for _ in range(walks)]
+        report = FuzzReport()
+
+        def test_batch(seeds: List[int]) -> callable:
+            """Generate a test function running the walks of a batch.
+
+            Args:
+                seeds (List[int]): The seeds of the walks.
+
+            Returns:
+                callable: The test function.
+            """
+
+            def assert_function(*args, **kwargs):
+                failures = list()
+                start = time.perf_counter()
+                for walk_seed in seeds:
+                    try:
+                        report.transitions += walker.walk(
+                            walk_seed,
+                            walk_length,
+                        )
+                    except Exception as error:
+                        report.transitions += len(walker.trace)
+                        failures.append(
+                            (
+                                walk_seed,
+                                f'{type(error).__name__}: {error}\n'
+                                f'Triggers: {walker.trace}\n'
+                                f'Replay: random_walk({walk_seed}, '
+                                f'{walk_length}, {guards!r})',
+                            ),
+                        )
+                report.seconds += time.perf_counter() - start
+                report.walks += len(seeds)
+                report.failures.extend(failures)
+                assert not failures, '\n'.join(
+                    f'Walk {walk_seed} failed: {message}'
+                    for walk_seed, message in failures
+                )
+
+            return assert_function
+
+        testsuite = TestSuite()
+        setattr(
+            testsuite,
+            'fail_msg',
+            'Random Walk Failures Detected',
+        )
+        setattr(
+            testsuite,
+            'suite_name',
+            'fuzz_suite',
+        )
+        setattr(testsuite, 'callback_recorder', self.callback_recorder)
+        setattr(testsuite, 'fuzz_report', report)
+        for batch, start in enumerate(range(0, walks, batch_size)):
+            testcase_name = f'test_fuzz_batch_{batch}'
+            _callable = test_batch(walk_seeds[start:start + batch_size])
+            testsuite.addTest(GeneratedTest(testcase_name, _callable))
         return testsuite
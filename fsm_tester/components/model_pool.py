@@ -0,0 +1,118 @@
+import copy
+from typing import Any, Callable, Dict, List, Optional
+from fsm_tester.typing import Adapter, MODEL_STRATEGIES
+
+
+class ModelPool:
+    """Hands the generated tests a clean model instance. Every test starts
+    with `fresh`, which recycles the model of the previous test and installs
+    a clean one as `adapter.fsm`:
+
+    - `reset` keeps one shared instance and only resets its state, calling
+      `reset_hook` if given. Attributes other than the state leak between
+      tests unless the hook resets them.
+    - `factory` builds a new instance for every test from the machine
+      class. Used instances are recycled through `reset_hook` if given, and
+      dropped otherwise.
+    - `clone` records the data attributes of the model when the pool is
+      created, and recycles instances by restoring a deep copy of them,
+      without building a new machine. New instances are only deep copied
+      when the pool runs out of idle ones.
+
+    The pool is not thread safe.
+    """
+
+    def __init__(
+        self,
+        adapter: Adapter,
+        strategy: MODEL_STRATEGIES = 'reset',
+        reset_hook: Optional[Callable[[Any], None]] = None,
+    ):
+        """
+        Args:
+            adapter (Adapter): The adapter for the FSM.
+            strategy (MODEL_STRATEGIES): How clean instances are obtained.
+                Defaults to `reset`.
+            reset_hook (Optional[Callable[[Any], None]]): Takes a used model
+                and resets the attributes its tests may have changed.
+        """
+        self.adapter = adapter
+        self.strategy = strategy
+        self.reset_hook = reset_hook
+        self._idle: List[Any] = list()
+        self._origin = adapter.fsm
+        self._pristine: Dict[str, Any] = dict()
+        self._pristine_keys = set(vars(adapter.fsm))
+        if strategy == 'clone':
+            self._pristine = copy.deepcopy(
+                {
+                    name: value
+                    for name, value in vars(adapter.fsm).items()
+                    if not adapter.is_runtime_attribute(name, value)
+                },
+                # keep references back at the model, `_clean` rebinds them
+                {id(self._origin): self._origin},
+            )
+        self.instances_created = 0
+
+    def _clean(self, model: Any) -> None:
+        """Restore the recorded data attributes of a cloned model, and drop
+        the attributes added since the pool was created."""
+        attributes = vars(model)
+        for name in list(attributes):
+            if name not in self._pristine_keys:
+                del attributes[name]
+        # attributes pointing back at the origin model now point at `model`
+        attributes.update(
+            copy.deepcopy(self._pristine, {id(self._origin): model}),
+        )
+
+    def acquire(self) -> Any:
+        """Take a clean model from the pool, building one if none is idle.
+
+        Returns:
+            Any: The model.
+        """
+        if self.strategy == 'reset':
+            return self.adapter.fsm
+        if self._idle:
+            return self._idle.pop()
+        self.instances_created += 1
+        if self.strategy == 'factory':
+            return self.adapter.create_fsm()
+        model = copy.deepcopy(self._origin)
+        self._clean(model)
+        return model
+
+    def release(self, model: Any) -> None:
+        """Give a used model back to the pool, to be recycled.
+
+        Args:
+            model (Any): The model.
+        """
+        if self.strategy == 'reset':
+            return
+        if self.strategy == 'clone':
+            self._clean(model)
+        elif self.reset_hook is None:
+            # a factory instance can only be recycled through the hook
+            return
+        if self.reset_hook is not None:
+            self.reset_hook(model)
+        self._idle.append(model)
+
+    def fresh(self) -> Any:
+        """Recycle the current model of the adapter, and install a clean one
+        in its initial state.
+
+        Returns:
+            Any: The clean model.
+        """
+        if self.strategy == 'reset':
+            if self.reset_hook is not None:
+                self.reset_hook(self.adapter.fsm)
+        else:
+            self.release(self.adapter.fsm)
+            self.adapter.fsm = self.acquire()
+        self.adapter.reset_fsm()
+        return self.adapter.fsm
@@ -0,0 +1,221 @@
+from array import array
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from networkx import MultiDiGraph
+    from fsm_tester.components.compact_graph import CompactGraph
+
+
+# the nodes of a compact graph carry no attributes
+_NO_ATTRIBUTES = MappingProxyType(dict())
+
+
+class _Nodes(Mapping):
+    """The node mapping of a NetworkX view: every state name, mapped to
+    empty attributes."""
+
+    __slots__ = ('graph',)
+
+    def __init__(self, graph: 'CompactGraph'):
+        self.graph = graph
+
+    def __getitem__(self, name: str) -> Mapping:
+        if name not in self.graph.indices:
+            raise KeyError(name)
+        return _NO_ATTRIBUTES
+
+    def __contains__(self, name) -> bool:
+        return name in self.graph.indices
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.graph.names)
+
+    def __len__(self) -> int:
+        return len(self.graph.names)
+
+
+class _Edges(Mapping):
+    """The parallel edges between two states, keyed 0, 1, ... in declaration
+    order as NetworkX does, each with its `label`."""
+
+    __slots__ = ('labels',)
+
+    def __init__(self, labels: List[Optional[str]]):
+        self.labels = labels
+
+    def __getitem__(self, key: int) -> Mapping:
+        if not isinstance(key, int) or not 0 <= key < len(self.labels):
+            raise KeyError(key)
+        return MappingProxyType({'label': self.labels[key]})
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(len(self.labels)))
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+
+class _Neighbors(Mapping):
+    """The successors, or predecessors, of a state, read from the CSR arrays
+    when the view is asked for them."""
+
+    __slots__ = ('graph', 'labels')
+
+    def __init__(self, graph: 'CompactGraph', node: int, forward: bool):
+        self.graph = graph
+        self.labels: Dict[int, List[Optional[str]]] = dict()
+        if forward:
+            for pos in range(
+                graph.fwd_offsets[node],
+                graph.fwd_offsets[node + 1],
+            ):
+                self.labels.setdefault(graph.fwd_targets[pos], list()).append(
+                    graph.labels[pos],
+                )
+            return
+        for source in dict.fromkeys(graph.predecessor_ids(node)):
+            self.labels[source] = [
+                graph.labels[pos]
+                for pos in range(
+                    graph.fwd_offsets[source],
+                    graph.fwd_offsets[source + 1],
+                )
+                if graph.fwd_targets[pos] == node
+            ]
+
+    def __getitem__(self, name: str) -> _Edges:
+        node = self.graph.indices.get(name)
+        if node not in self.labels:
+            raise KeyError(name)
+        return _Edges(self.labels[node])
+
+    def __iter__(self) -> Iterator[str]:
+        return (self.graph.names[node] for node in self.labels)
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+
+class _Adjacency(Mapping):
+    """The successor, or predecessor, mapping of a NetworkX view."""
+
+    __slots__ = ('graph', 'forward')
+
+    def __init__(self, graph: 'CompactGraph', forward: bool):
+        self.graph = graph
+        self.forward = forward
+
+    def __getitem__(self, name: str) -> _Neighbors:
+        return _Neighbors(self.graph, self.graph.indices[name], self.forward)
+
+    def __contains__(self, name) -> bool:
+        return name in self.graph.indices
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.graph.names)
+
+    def __len__(self) -> int:
+        return len(self.graph.names)
+
+
+class NetworkXCompat:
+    """The NetworkX flavoured, state name based, part of the `CompactGraph`
+    API, and the conversions from and to NetworkX graphs."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_networkx(cls, graph: 'MultiDiGraph') -> 'CompactGraph':
+        """Build a compact graph from a NetworkX graph.
+
+        Args:
+            graph (MultiDiGraph): The graph to convert.
+
+        Returns:
+            CompactGraph: The compact representation of `graph`.
+        """
+        if isinstance(graph, cls):
+            return graph
+        return cls(
+            names=list(graph.nodes),
+            edges=(
+                (source, dest, data.get('label'))
+                for source, dest, data in graph.edges(data=True)
+            ),
+        )
+
+    def to_networkx(self) -> 'MultiDiGraph':
+        """Return a read-only NetworkX `MultiDiGraph` view of the graph. The
+        view reads the CSR arrays as it is traversed, nothing is copied.
+        Mutating it raises a `NetworkXError`; `copy()` it first if needed.
+
+        Returns:
+            MultiDiGraph: The frozen NetworkX view of the graph.
+        """
+        # networkx is only imported once a view is asked for
+        import networkx as nx  # noqa: PLC0415
+
+        view = nx.MultiDiGraph()
+        view._node = _Nodes(self)
+        view._adj = view._succ = _Adjacency(self, forward=True)
+        view._pred = _Adjacency(self, forward=False)
+        return nx.freeze(view)
+
+    @property
+    def nodes(self) -> List[str]:
+        return self.names
+
+    def number_of_edges(self) -> int:
+        return len(self.fwd_targets)
+
+    def edges(self) -> Iterator[Tuple[str, str, Optional[str]]]:
+        """Iterate over every edge as a (source, dest, label) tuple."""
+        for source in range(len(self.names)):
+            for pos in range(
+                self.fwd_offsets[source],
+                self.fwd_offsets[source + 1],
+            ):
+                yield (
+                    self.names[source],
+                    self.names[self.fwd_targets[pos]],
+                    self.labels[pos],
+                )
+
+    def out_degree(self, name: str) -> int:
+        """Return the number of edges leaving a state."""
+        node = self.indices[name]
+        return self.fwd_offsets[node + 1] - self.fwd_offsets[node]
+
+    def successors(self, name: str) -> List[str]:
+        """Return the distinct successors of a state, in insertion order."""
+        ids = dict.fromkeys(self.successor_ids(self.indices[name]))
+        return [self.names[idx] for idx in ids]
+
+    def predecessors(self, name: str) -> List[str]:
+        """Return the distinct predecessors of a state."""
+        ids = dict.fromkeys(self.predecessor_ids(self.indices[name]))
+        return [self.names[idx] for idx in ids]
+
+    @staticmethod
+    def _reached(names: List[str], parents: array) -> set:
+        return {
+            names[idx] for idx, parent in enumerate(parents) if parent != -1
+        }
+
+    def descendants(self, source: str) -> set:
+        """Return the states reachable from `source`, `source` included."""
+        return self._reached(self.names, self.bfs_tree(source))
+
+    def ancestors(self, target: str) -> set:
+        """Return the states that can reach `target`, `target` included."""
+        return self._reached(self.names, self.reverse_bfs_tree(target))
+
+    def has_path(self, source: str, target: str) -> bool:
+        return self.shortest_path(source, target) is not None
+
+    def shortest_path(self, source: str, target: str) -> Optional[List[str]]:
+        """Return a shortest path from `source` to `target`, or None if
+        `target` is unreachable."""
+        return self.tree_path(self.bfs_tree(source), target)
@@ -0,0 +1,249 @@
+import math
+import multiprocessing
+import os
+import pickle
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from fsm_tester.adapters import AdapterFactory
+from fsm_tester.components.machine_mocker import MachineMocker
+from fsm_tester.components.path_executor import PrefixSharingExecutor
+from fsm_tester.entities import CallbackReport
+from fsm_tester.typing import DIALECTS
+
+
+# (test name, kind, payload), as listed in the `specs` of a generated suite
+TestSpec = Tuple[str, str, List[str]]
+
+# below this many tests, starting the workers costs more than it saves
+MIN_POOLED_TESTS = 32
+
+
+@dataclass
+class SpecOutcome:
+    """The outcome of a generated test run by a worker. `status` is one of
+    `ok`, `fail` (an assertion failed) or `error` (anything else raised)."""
+
+    name: str
+    status: str
+    message: str = ''
+
+
+class _Worker:
+    """The state of a worker process: the mocker it runs the tests on, set
+    up once by `start`, the initializer of the pool."""
+
+    mocker: Optional[MachineMocker] = None
+
+    @classmethod
+    def start(
+        cls,
+        fsm_module: Any,
+        dialect: DIALECTS,
+        mocker_options: Dict[str, Any],
+        warm_up: Optional[Callable[[MachineMocker], None]],
+    ) -> None:
+        """Build the adapter, model and mocker of the worker process."""
+        adapter = AdapterFactory.create_adapter(fsm_module, dialect)
+        cls.mocker = MachineMocker(adapter=adapter, **mocker_options)
+        if warm_up is not None:
+            warm_up(cls.mocker)
+
+    @classmethod
+    def run_chunk(
+        cls,
+        chunk_id: int,
+        specs: List[TestSpec],
+    ) -> Tuple[List[SpecOutcome], CallbackReport]:
+        """Run a chunk of generated tests on the mocker of the worker, and
+        return their outcomes with the callbacks timed meanwhile."""
+        mocker = cls.mocker
+        callback_report = mocker.callback_recorder.start_report()
+        executor = None
+        paths = [payload for _, kind, payload in specs if kind == 'path']
+        if paths and mocker.share_prefixes:
+            executor = PrefixSharingExecutor(
+                adapter=mocker.adapter,
+                paths=paths,
+                snapshot_hook=mocker.snapshot_hook,
+                restore_hook=mocker.restore_hook,
+                reset=mocker.reset_model,
+            )
+        if mocker.compiled_executor is not None:
+            # cross-checks only depend on the chunk, not on the worker
+            mocker.compiled_executor.reseed(
+                f'{mocker.compiled_executor.seed}:{chunk_id}',
+            )
+        checks = {
+            'path': lambda path: mocker.check_path(path, executor=executor),
+            'loop': mocker.check_loop,
+            'inescapable_loop': mocker.check_inescapable_loop,
+        }
+        outcomes = list()
+        for name, kind, payload in specs:
+            try:
+                checks[kind](payload)
+            except AssertionError:
+                outcomes.append(
+                    SpecOutcome(name, 'fail', traceback.format_exc()),
+                )
+            except Exception:
+                outcomes.append(
+                    SpecOutcome(name, 'error', traceback.format_exc()),
+                )
+            else:
+                outcomes.append(SpecOutcome(name, 'ok'))
+        return outcomes, callback_report
+
+
+def _start_method() -> str:
+    """Workers are never forked from the process running the tester, which
+    may have started threads, including the manager thread of another
+    pool. They are started from a fork server where available, and spawned
+    otherwise."""
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return 'forkserver'
+    return 'spawn'
+
+
+class ParallelRunner:
+    """Runs the generated path and loop tests of a suite in a pool of
+    processes. Every worker builds its own adapter and model from the
+    machine class, which must therefore be importable, and its own
+    `MachineMocker` from `mocker_options`, whose hooks must be picklable.
+    Workers are started with the `forkserver` method, or `spawn` where it is
+    not available, never by forking the current process.
+
+    The tests are split in contiguous chunks, so that paths sharing a prefix
+    stay together, and the outcomes are merged back in suite order whatever
+    the order the chunks finish in.
+    """
+
+    def __init__(
+        self,
+        fsm_module: Any,
+        dialect: DIALECTS,
+        mocker_options: Dict[str, Any],
+        *,
+        workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        warm_up: Optional[Callable[[MachineMocker], None]] = None,
+    ):
+        """
+        Args:
+            fsm_module (Any): The importable machine class.
+            dialect (DIALECTS): The dialect of the machine.
+            mocker_options (Dict[str, Any]): The keyword arguments of the
+                `MachineMocker` of each worker, apart from the adapter.
+            workers (Optional[int]): The number of worker processes.
+                Defaults to the number of CPUs.
+            chunk_size (Optional[int]): The number of tests sent to a worker
+                at once. Defaults to about four chunks per worker.
+            warm_up (Optional[Callable[[MachineMocker], None]]): Called
+                once in every worker with its `MachineMocker`, before any
+                test runs.
+        """
+        self.fsm_module = fsm_module
+        self.dialect = dialect
+        self.mocker_options = mocker_options
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.warm_up = warm_up
+
+    @cached_property
+    def _initargs(self) -> tuple:
+        """The arguments every worker is started with."""
+        return (
+            self.fsm_module,
+            self.dialect,
+            self.mocker_options,
+            self.warm_up,
+        )
+
+    def can_pool(self, specs: List[TestSpec]) -> bool:
+        """Whether the given tests are worth running in a pool of worker
+        processes: there are enough of them, and the machine class and the
+        mocker options can be sent to the workers.
+
+        Args:
+            specs (List[TestSpec]): The tests, from the `specs` of a suite.
+
+        Returns:
+            bool: True if the tests can be run with `submit`.
+        """
+        if len(specs) < MIN_POOLED_TESTS:
+            return False
+        try:
+            pickle.dumps(self._initargs)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            return False
+        return True
+
+    def submit(
+        self,
+        specs: List[TestSpec],
+        callback_report: Optional[CallbackReport] = None,
+    ) -> Callable[[], Iterator[SpecOutcome]]:
+        """Start running the given tests in the background, in a new pool
+        of worker processes.
+
+        Args:
+            specs (List[TestSpec]): The tests, from the `specs` of a suite.
+            callback_report (Optional[CallbackReport]): The report the
+                callbacks timed by the workers are merged into, if any.
+
+        Returns:
+            Callable[[], Iterator[SpecOutcome]]: Iterates over the outcome
+                of every test, in the order of `specs`, as the chunks of
+                tests finish.
+        """
+        if not specs:
+            return lambda: iter(())
+        chunk_size = self.chunk_size or max(
+            1,
+            math.ceil(len(specs) / (self.workers * 4)),
+        )
+        chunks = [
+            specs[start : start + chunk_size]
+            for start in range(0, len(specs), chunk_size)
+        ]
+        context = multiprocessing.get_context(_start_method())
+        if context.get_start_method() == 'forkserver':
+            # the workers fork from a server with the tester already imported
+            context.set_forkserver_preload([__name__])
+        pool = ProcessPoolExecutor(
+            max_workers=min(self.workers, len(chunks)),
+            mp_context=context,
+            initializer=_Worker.start,
+            initargs=self._initargs,
+        )
+        results = pool.map(_Worker.run_chunk, range(len(chunks)), chunks)
+
+        def collect() -> Iterator[SpecOutcome]:
+            with pool:
+                for chunk_outcomes, chunk_report in results:
+                    if callback_report is not None:
+                        callback_report.merge(chunk_report)
+                    yield from chunk_outcomes
+
+        return collect
+
+    def run(
+        self,
+        specs: List[TestSpec],
+        callback_report: Optional[CallbackReport] = None,
+    ) -> List[SpecOutcome]:
+        """Run the given tests.
+
+        Args:
+            specs (List[TestSpec]): The tests, from the `specs` of a suite.
+            callback_report (Optional[CallbackReport]): The report the
+                callbacks timed by the workers are merged into, if any.
+
+        Returns:
+            List[SpecOutcome]: The outcome of every test, in the order of
+                `specs`.
+        """
+        return list(self.submit(specs, callback_report)())
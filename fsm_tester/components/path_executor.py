@@ -0,0 +1,141 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from fsm_tester.typing import Adapter
+
+
+class PrefixSharingExecutor:
+    """Executes paths that share common prefixes without replaying them. The
+    paths are arranged in a trie, and when they are run in depth first order
+    (that is, sorted), each path continues from where the previous one
+    diverged instead of resetting the machine and replaying from the initial
+    state. At every branching node of the trie the model is snapshotted, and
+    the snapshot is restored when a later path branches off there.
+
+    If a path is run out of order, or the machine was changed by something
+    else in between, the executor falls back to resetting and replaying.
+    """
+
+    def __init__(
+        self,
+        adapter: Adapter,
+        paths: Iterable[List[str]],
+        snapshot_hook: Optional[Callable[[Any], Any]] = None,
+        restore_hook: Optional[Callable[[Any, Any], None]] = None,
+        reset: Optional[Callable[[], Any]] = None,
+    ):
+        """
+        Args:
+            adapter (Adapter): The adapter for the FSM.
+            paths (Iterable[List[str]]): Every path that will be executed.
+            snapshot_hook (Optional[Callable[[Any], Any]]): Takes the model
+                and returns a snapshot of it. Defaults to the adapter's
+                `snapshot_fsm`, a deep copy of the model data attributes.
+            restore_hook (Optional[Callable[[Any, Any], None]]): Takes the
+                model and a snapshot, and restores the snapshot into the
+                model. Defaults to the adapter's `restore_fsm`.
+            reset (Optional[Callable[[], Any]]): Brings the machine back to
+                its initial state before replaying a path from scratch.
+                Defaults to the adapter's `reset_fsm`.
+        """
+        self.adapter = adapter
+        self.snapshot_hook = snapshot_hook
+        self.restore_hook = restore_hook
+        self.reset = reset or adapter.reset_fsm
+        self._model = adapter.fsm
+        self._trie = self._build_trie(paths)
+        self._current: List[str] = list()
+        self._snapshots: Dict[int, Any] = dict()
+        self.transitions_executed = 0
+
+    @staticmethod
+    def _build_trie(paths: Iterable[List[str]]) -> Dict[str, dict]:
+        """Build the trie of `paths` as nested dictionaries keyed by state."""
+        trie = dict()
+        for path in paths:
+            node = trie
+            for state in path:
+                node = node.setdefault(state, dict())
+        return trie
+
+    def _snapshot(self) -> Any:
+        if self.snapshot_hook is not None:
+            return self.snapshot_hook(self.adapter.fsm)
+        return self.adapter.snapshot_fsm()
+
+    def _restore(self, snapshot: Any) -> None:
+        if self.restore_hook is not None:
+            self.restore_hook(self.adapter.fsm, snapshot)
+        else:
+            self.adapter.restore_fsm(snapshot)
+
+    def _current_state(self) -> str:
+        return getattr(self.adapter.fsm, self.adapter.state_attr)
+
+    def _resume_point(self, path: List[str]) -> int:
+        """Bring the machine to the deepest reusable prefix of `path`.
+
+        Returns:
+            int: The number of states of `path` already executed.
+        """
+        if self.adapter.fsm is not self._model:
+            # snapshots only apply to the model they were taken from
+            self._model = self.adapter.fsm
+            self._current.clear()
+            self._snapshots.clear()
+        shared = 0
+        limit = min(len(path), len(self._current))
+        while shared < limit and path[shared] == self._current[shared]:
+            shared += 1
+        if (
+            shared > 0
+            and shared == len(self._current)
+            and self._current_state() == self._current[-1]
+        ):
+            return shared
+        while shared > 0 and shared - 1 not in self._snapshots:
+            shared -= 1
+        if shared > 0:
+            self._restore(self._snapshots[shared - 1])
+            return shared
+        self._snapshots.clear()
+        self.reset()
+        self._model = self.adapter.fsm
+        return 1
+
+    def run(
+        self,
+        path: List[str],
+        step: Callable[[str, str], Any],
+    ) -> List[Any]:
+        """Execute a path, reusing the longest prefix already executed.
+
+        Args:
+            path (List[str]): The states of the path, starting at the initial
+                state.
+            step (Callable[[str, str], Any]): Executes the transition between
+                two states, and checks its outcome.
+
+        Returns:
+            List[Any]: The results of `step` for the transitions executed
+                by this call.
+        """
+        start = self._resume_point(path)
+        del self._current[start:]
+        for depth in list(self._snapshots):
+            if depth >= start:
+                del self._snapshots[depth]
+        if not self._current:
+            self._current.append(path[0])
+        node = self._trie
+        for state in path[:start]:
+            node = node.get(state, dict())
+        results = list()
+        for depth in range(start - 1, len(path) - 1):
+            if len(node) > 1 and depth not in self._snapshots:
+                # later paths branch off here, keep the model to return to it
+                self._snapshots[depth] = self._snapshot()
+            source, dest = path[depth], path[depth + 1]
+            node = node.get(dest, dict())
+            results.append(step(source, dest))
+            self.transitions_executed += 1
+            self._current.append(dest)
+        return results
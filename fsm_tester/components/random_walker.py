@@ -0,0 +1,234 @@
+import random
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+from fsm_tester.components.compiled_executor import CompiledExecutor
+from fsm_tester.components.guard_forcer import GuardForcer
+from fsm_tester.entities import FSMTransition
+from fsm_tester.typing import Adapter, FUZZ_GUARDS
+
+
+class WalkStep(NamedTuple):
+    """A trigger that can be fired from a state. `candidates` are the
+    transitions of the trigger leaving the state, in declaration order, and
+    `allowed` the states the machine may be in once the trigger fired."""
+
+    trigger: str
+    candidates: Tuple[FSMTransition, ...]
+    allowed: FrozenSet[str]
+    guards: Tuple[str, ...]
+    predictable: bool
+
+
+def _guard_list(guards: Any) -> List[Any]:
+    if guards is None:
+        return list()
+    if isinstance(guards, str) or callable(guards):
+        # pytransitions accepts a single callback instead of a list
+        return [guards]
+    return list(guards)
+
+
+class RandomWalker:
+    """Fires random triggers on the model, starting from its initial state,
+    and checks after every step that the machine is in a state the trigger
+    may lead to. A walk is fully determined by its seed, so a failed walk is
+    replayed by walking again from the same seed.
+
+    With `real` guards the triggers evaluate the guards of the model. With
+    `random` guards every string guard of the fired trigger is forced to a
+    random value first, so the walker knows which transition must fire, and
+    can apply it through the compiled table when one is given.
+    """
+
+    def __init__(
+        self,
+        adapter: Adapter,
+        guard_forcer: GuardForcer,
+        reset: Callable[[], Any],
+        guards: FUZZ_GUARDS = 'real',
+        compiled_executor: Optional[CompiledExecutor] = None,
+    ):
+        """
+        Args:
+            adapter (Adapter): The adapter for the FSM.
+            guard_forcer (GuardForcer): Forces the guards in `random` mode.
+            reset (Callable[[], Any]): Brings a clean model to its initial
+                state, and returns it.
+            guards (FUZZ_GUARDS): Whether the walks evaluate the real guards
+                or random ones. Defaults to `real`.
+            compiled_executor (Optional[CompiledExecutor]): Applies the
+                transitions whose outcome is known in `random` mode.
+
+        Raises:
+            ValueError: For guard modes not recognized.
+        """
+        if guards not in {'real', 'random'}:
+            raise ValueError(f'Guard mode {guards} not recognized.')
+        self.adapter = adapter
+        self.guard_forcer = guard_forcer
+        self.reset = reset
+        self.guards = guards
+        self.compiled_executor = compiled_executor
+        self.table = self._compile()
+        self.trace: List[str] = list()
+
+    def _compile(self) -> Dict[str, Tuple[WalkStep, ...]]:
+        """Group the transitions of the source index by trigger."""
+        table = dict()
+        for source, transitions in self.adapter.get_source_index().items():
+            by_trigger: Dict[str, List[FSMTransition]] = dict()
+            for transition in transitions:
+                by_trigger.setdefault(transition.name, list()).append(
+                    transition,
+                )
+            steps = list()
+            for trigger, candidates in by_trigger.items():
+                guards = [
+                    guard
+                    for candidate in candidates
+                    for guard in (
+                        _guard_list(candidate.conditions)
+                        + _guard_list(candidate.unless)
+                    )
+                ]
+                steps.append(
+                    WalkStep(
+                        trigger=trigger,
+                        candidates=tuple(candidates),
+                        allowed=frozenset(
+                            [source]
+                            + [
+                                candidate.destination or source
+                                for candidate in candidates
+                            ],
+                        ),
+                        guards=tuple(
+                            dict.fromkeys(
+                                guard
+                                for guard in guards
+                                if isinstance(guard, str)
+                            )
+                        ),
+                        predictable=all(
+                            isinstance(guard, str) for guard in guards
+                        ),
+                    ),
+                )
+            table[source] = tuple(steps)
+        return table
+
+    @staticmethod
+    def _predict(
+        source: str,
+        step: WalkStep,
+        values: Dict[str, bool],
+    ) -> Tuple[Optional[FSMTransition], str]:
+        """Find the transition pytransitions fires for forced guard values,
+        the first one whose conditions hold and whose unless do not."""
+        for candidate in step.candidates:
+            if all(
+                values[guard] for guard in _guard_list(candidate.conditions)
+            ) and not any(
+                values[guard] for guard in _guard_list(candidate.unless)
+            ):
+                return candidate, candidate.destination or source
+        return None, source
+
+    def _is_compiled(
+        self,
+        source: str,
+        trigger: str,
+        fired: Optional[FSMTransition],
+    ) -> bool:
+        """Whether the transition fired by `trigger` can be applied through
+        the compiled table, instead of being cross-checked or being left to
+        the real trigger."""
+        if (
+            self.compiled_executor is None
+            or fired is None
+            or fired.destination is None
+        ):
+            return False
+        compiled_step = self.compiled_executor.table.get(
+            (source, fired.destination),
+        )
+        return (
+            compiled_step is not None
+            and compiled_step.name == trigger
+            and not self.compiled_executor.should_cross_check()
+        )
+
+    def walk(self, seed: int, length: int) -> int:
+        """Walk up to `length` random steps from the initial state. The walk
+        stops early in a state no trigger leaves. The triggers fired so far
+        are kept in `trace`.
+
+        Args:
+            seed (int): The seed of the walk.
+            length (int): The maximum number of steps.
+
+        Raises:
+            AssertionError: If the machine ends up in a state the fired
+                trigger cannot lead to. Exceptions raised by the callbacks
+                of the machine are propagated.
+
+        Returns:
+            int: The number of triggers fired.
+        """
+        rng = random.Random(seed)
+        self.trace = list()
+        model = self.reset()
+        self.guard_forcer.rebind(model)
+        trigger_functions = self.adapter.get_trigger_functions()
+        state_attr = self.adapter.state_attr
+        try:
+            for _ in range(length):
+                source = getattr(model, state_attr)
+                steps = self.table.get(source)
+                assert steps is not None, (
+                    f'Machine is in undeclared state {source} after '
+                    f'{self.trace}'
+                )
+                if not steps:
+                    break
+                step = rng.choice(steps)
+                self.trace.append(step.trigger)
+                expected = None
+                if self.guards == 'random':
+                    values = {
+                        guard: bool(rng.getrandbits(1))
+                        for guard in step.guards
+                    }
+                    for guard, value in values.items():
+                        self.guard_forcer.force(guard, value)
+                    if step.predictable:
+                        fired, expected = self._predict(source, step, values)
+                        if self._is_compiled(source, step.trigger, fired):
+                            self.compiled_executor.execute(source, expected)
+                            continue
+                result = trigger_functions[step.trigger]()
+                state = getattr(model, state_attr)
+                if expected is None:
+                    expected = source if result is False else None
+                if expected is not None:
+                    assert state == expected, (
+                        f'Machine should have been in state {expected}, '
+                        f'but is in state {state} after {self.trace}'
+                    )
+                else:
+                    assert state in step.allowed, (
+                        f'Machine should have been in one of '
+                        f'{sorted(step.allowed)}, but is in state {state} '
+                        f'after {self.trace}'
+                    )
+        finally:
+            self.guard_forcer.restore()
+        return len(self.trace)
@@ -0,0 +1,69 @@
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+
+class ReportWriter:
+    """Streams the report of a suite to an NDJSON file, one JSON object per
+    line, as the results are produced. The report starts with a `suite`
+    record, follows with a `test` record per test, and ends with a `summary`
+    record once the suite is done. Nothing is kept in memory, whatever the
+    size of the suite.
+    """
+
+    def __init__(self, path: Path, suite_name: str):
+        """
+        Args:
+            path (Path): The report file, overwritten if it exists.
+            suite_name (str): The name of the suite reported.
+        """
+        self.path = path
+        self.suite_name = suite_name
+        self.tests = 0
+        self.failures = 0
+        self._started = time.perf_counter()
+        self._file = open(path, 'w', encoding='utf-8')
+        self._write(event='suite', suite=suite_name)
+
+    def _write(self, **record: Any) -> None:
+        self._file.write(json.dumps(record))
+        self._file.write('\n')
+
+    def test(self, name: str, status: str, message: str = '') -> None:
+        """Append the outcome of a test.
+
+        Args:
+            name (str): The name of the test.
+            status (str): `ok`, `fail`, `error`, `skip`, `expected_failure`
+                or `unexpected_success`.
+            message (str): The traceback or reason of the outcome, if any.
+        """
+        self.tests += 1
+        if status in {'fail', 'error', 'unexpected_success'}:
+            self.failures += 1
+        record = dict(event='test', name=name, status=status)
+        if message:
+            record['message'] = message
+        self._write(**record)
+
+    def close(self, successful: bool, **reports: str) -> None:
+        """Append the summary of the suite and close the report.
+
+        Args:
+            successful (bool): Whether every test was successful.
+            **reports (str): The coverage, fuzzing or callback reports of the
+                suite, by name.
+        """
+        if self._file.closed:
+            return
+        self._write(
+            event='summary',
+            suite=self.suite_name,
+            tests=self.tests,
+            failures=self.failures,
+            successful=successful,
+            seconds=round(time.perf_counter() - self._started, 6),
+            **reports,
+        )
+        self._file.close()
@@ -0,0 +1,132 @@
+import io
+import time
+from unittest.result import TestResult
+from unittest.runner import TextTestResult
+from unittest.suite import TestSuite
+from typing import List, Optional, Tuple
+from fsm_tester.components.report_writer import ReportWriter
+
+
+class _Buffer(io.StringIO):
+    """An in-memory stream with the `writeln` of unittest streams."""
+
+    def writeln(self, arg: str = '') -> None:
+        if arg:
+            self.write(arg)
+        self.write('\n')
+
+
+class _StreamingResult(TextTestResult):
+    """A result that also appends the outcome of every test to a report."""
+
+    def __init__(self, stream, descriptions, verbosity, writer):
+        super().__init__(stream, descriptions, verbosity)
+        self.writer = writer
+
+    @staticmethod
+    def _name(test) -> str:
+        return getattr(test, 'name', None) or test.id()
+
+    def addSuccess(self, test):
+        super().addSuccess(test)
+        self.writer.test(self._name(test), 'ok')
+
+    def addFailure(self, test, err):
+        super().addFailure(test, err)
+        self.writer.test(self._name(test), 'fail', self.failures[-1][1])
+
+    def addError(self, test, err):
+        super().addError(test, err)
+        self.writer.test(self._name(test), 'error', self.errors[-1][1])
+
+    def addSkip(self, test, reason):
+        super().addSkip(test, reason)
+        self.writer.test(self._name(test), 'skip', reason)
+
+    def addExpectedFailure(self, test, err):
+        super().addExpectedFailure(test, err)
+        self.writer.test(self._name(test), 'expected_failure')
+
+    def addUnexpectedSuccess(self, test):
+        super().addUnexpectedSuccess(test)
+        self.writer.test(self._name(test), 'unexpected_success')
+
+
+class SuiteRunner:
+    """Runs every test of a suite into one aggregated result, instead of
+    running a `TextTestRunner` per test. The per-test lines and failures are
+    written to a buffer as the tests run, and the whole output is returned
+    once the suite is done, with a single summary.
+    """
+
+    def __init__(self, verbosity: int = 2):
+        """
+        Args:
+            verbosity (int): The unittest verbosity: 0 prints only the
+                failures and the summary, 1 a character per test and 2 a
+                line per test. Defaults to 2.
+        """
+        self.verbosity = verbosity
+
+    def run(
+        self,
+        test_suite: TestSuite,
+        writer: Optional[ReportWriter] = None,
+    ) -> Tuple[str, TestResult]:
+        """Run the tests of a suite.
+
+        Args:
+            test_suite (TestSuite): The suite.
+            writer (Optional[ReportWriter]): Streams the outcome of every
+                test to a report. The output then holds only the failures
+                and the summary, whatever the verbosity.
+
+        Returns:
+            Tuple[str, TestResult]: The output of the run, and its result.
+        """
+        stream = _Buffer()
+        if writer is None:
+            result = TextTestResult(
+                stream,
+                descriptions=True,
+                verbosity=self.verbosity,
+            )
+        else:
+            result = _StreamingResult(
+                stream,
+                descriptions=True,
+                verbosity=0,
+                writer=writer,
+            )
+        start = time.perf_counter()
+        # the tests are run one by one, without the class and module fixtures
+        # of `TestSuite.run`, which the generated tests do not use
+        for test in test_suite:
+            test(result)
+        elapsed = time.perf_counter() - start
+        result.printErrors()
+        stream.writeln(result.separator2)
+        stream.writeln(
+            f'Ran {result.testsRun} test'
+            f'{"" if result.testsRun == 1 else "s"} in {elapsed:.3f}s',
+        )
+        if result.wasSuccessful():
+            stream.writeln('OK')
+        else:
+            stream.writeln(
+                f'FAILED (failures={len(result.failures)}, '
+                f'errors={len(result.errors)})',
+            )
+        return stream.getvalue(), result
+
+    @staticmethod
+    def failed_tests(result: TestResult) -> List:
+        """The tests that failed, followed by those that raised an error.
+
+        Args:
+            result (TestResult): The result of a run.
+
+        Returns:
+            List: The failed tests.
+        """
+        return [test for test, _ in result.failures + result.errors]
@@ -1,6 +1,21 @@
+from fsm_tester.entities.callback_report import CallbackReport
+from fsm_tester.entities.coverage_report import CoverageReport
 from fsm_tester.entities.fsm_protocol import FSMProtocol
 from fsm_tester.entities.fsm_state import FSMState
 from fsm_tester.entities.fsm_transition import FSMTransition
+from fsm_tester.entities.fuzz_report import FuzzReport
+from fsm_tester.entities.mocker_options import MockerOptions
+from fsm_tester.entities.path_budget import PathBudget
 from fsm_tester.entities.testcase import TestCase
 
-__all__ = ['FSMProtocol', 'FSMState', 'FSMTransition', 'TestCase']
+__all__ = [
+    'CallbackReport',
+    'CoverageReport',
+    'FSMProtocol',
+    'FSMState',
+    'FSMTransition',
+    'FuzzReport',
+    'MockerOptions',
+    'PathBudget',
+    'TestCase',
+]
@@ -0,0 +1,67 @@
+import math
+from dataclasses import dataclass, field
+from typing import Dict, List, NamedTuple
+
+
+class CallbackTiming(NamedTuple):
+    """The summary of the recorded durations of a callback, in seconds."""
+
+    calls: int
+    p50: float
+    p95: float
+    max: float
+
+
+def _percentile(durations: List[float], fraction: float) -> float:
+    """The nearest-rank percentile of sorted durations."""
+    rank = max(1, math.ceil(fraction * len(durations)))
+    return durations[rank - 1]
+
+
+@dataclass
+class CallbackReport:
+    """The duration of every timed callback call, by callback name."""
+
+    durations: Dict[str, List[float]] = field(default_factory=dict)
+
+    def record(self, name: str, duration: float) -> None:
+        self.durations.setdefault(name, list()).append(duration)
+
+    def merge(self, other: 'CallbackReport') -> None:
+        """Add the durations recorded into another report, by another
+        process for instance."""
+        for name, durations in other.durations.items():
+            self.durations.setdefault(name, list()).extend(durations)
+
+    def summary(self) -> Dict[str, CallbackTiming]:
+        """Summarize the durations of each callback, slowest first.
+
+        Returns:
+            Dict[str, CallbackTiming]: The number of calls, median, 95th
+                percentile and maximum duration of each callback.
+        """
+        summary = dict()
+        for name, recorded in self.durations.items():
+            durations = sorted(recorded)
+            summary[name] = CallbackTiming(
+                calls=len(durations),
+                p50=_percentile(durations, 0.5),
+                p95=_percentile(durations, 0.95),
+                max=durations[-1],
+            )
+        return dict(
+            sorted(
+                summary.items(),
+                key=lambda item: item[1].max,
+                reverse=True,
+            ),
+        )
+
+    def __str__(self):
+        return '\n'.join(
+            f'{name}: {timing.calls} calls, '
+            f'p50 {timing.p50 * 1000:.3f}ms, '
+            f'p95 {timing.p95 * 1000:.3f}ms, '
+            f'max {timing.max * 1000:.3f}ms'
+            for name, timing in self.summary().items()
+        )
@@ -0,0 +1,31 @@
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass
+class CoverageReport:
+    """The states and transitions exercised by the paths or loops of a
+    suite, out of those it could have exercised."""
+
+    states_covered: int
+    states_total: int
+    transitions_covered: int
+    transitions_total: int
+    sampled_states: List[str] = field(default_factory=list)
+
+    @property
+    def complete(self) -> bool:
+        return (
+            self.states_covered == self.states_total
+            and self.transitions_covered == self.transitions_total
+        )
+
+    def __str__(self):
+        report = (
+            f'states {self.states_covered}/{self.states_total}, '
+            f'transitions {self.transitions_covered}/'
+            f'{self.transitions_total}'
+        )
+        if self.sampled_states:
+            report += f', sampled for {self.sampled_states}'
+        return report
@@ -1,6 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from fsm_tester.entities import FSMState
-from typing import Optional, List, Union
+from typing import Iterable, Optional, List, Union
 
 
 WILDCARD_ALL = '*'
@@ -24,6 +24,35 @@ class FSMTransition:
     def __repr__(self):
         return self.name
 
+    def expand(self, states: Iterable[str]) -> List['FSMTransition']:
+        """Expand the transition into one transition per concrete source
+        state. A `WILDCARD_ALL` source stands for every state, a list source
+        for each of its states, and a `WILDCARD_SAME` destination for the
+        source itself.
+
+        Args:
+            states (Iterable[str]): The names of every state in the FSM.
+
+        Returns:
+            List[FSMTransition]: The transitions, each with a single state
+                name as source.
+        """
+        sources = self.source
+        if sources == WILDCARD_ALL:
+            sources = states
+        elif not isinstance(sources, (list, tuple)):
+            sources = [sources]
+        expanded = list()
+        for source in sources:
+            state = getattr(source, 'name', source)
+            destination = getattr(self.destination, 'name', self.destination)
+            if destination == WILDCARD_SAME:
+                destination = state
+            expanded.append(
+                replace(self, source=state, destination=destination),
+            )
+        return expanded
+
     def __eq__(self, value):
         if isinstance(value, FSMTransition):
             return (self.name == value.name
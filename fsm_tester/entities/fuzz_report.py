@@ -0,0 +1,31 @@
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+
+@dataclass
+class FuzzReport:
+    """The walks run by a fuzz suite, the transitions they fired, and the
+    seeds of the walks that failed, each with its failure message. A failed
+    walk is replayed from its seed alone."""
+
+    walks: int = 0
+    transitions: int = 0
+    seconds: float = 0.0
+    failures: List[Tuple[int, str]] = field(default_factory=list)
+
+    @property
+    def transitions_per_second(self) -> float:
+        if self.seconds == 0.0:
+            return 0.0
+        return self.transitions / self.seconds
+
+    def __str__(self):
+        report = (
+            f'{self.walks} walks, {self.transitions} transitions in '
+            f'{self.seconds:.2f}s '
+            f'({self.transitions_per_second:.0f} transitions/s)'
+        )
+        if self.failures:
+            seeds = [seed for seed, _ in self.failures]
+            report += f', failed walk seeds {seeds}'
+        return report
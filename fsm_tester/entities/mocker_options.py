@@ -0,0 +1,106 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Optional, Union, get_args
+from fsm_tester.entities.path_budget import PathBudget
+from fsm_tester.typing import (
+    CALLBACK_KINDS,
+    CALLBACK_POLICIES,
+    COMPILED_CALLBACKS,
+    DEADLOCK_MODES,
+    EXECUTION_MODES,
+    MODEL_STRATEGIES,
+    PATH_STRATEGIES,
+)
+
+
+@dataclass(frozen=True)
+class MockerOptions:
+    """How the `MachineMocker` generates and runs the tests of the dynamic
+    suites. The options are validated once, when they are created, so
+    that a tester rejects them before its mocker is built.
+
+    Attributes:
+        expected_loops (int): The number of times each loop is executed.
+        deadlock_mode (DEADLOCK_MODES): How the deadlock suite finds loops.
+        path_strategy (PATH_STRATEGIES): How the execution suite finds
+            paths.
+        share_prefixes (bool): Whether paths sharing a prefix resume from a
+            snapshot of the model instead of replaying the prefix.
+        snapshot_hook (Optional[Callable[[Any], Any]]): Takes a snapshot of
+            a model, for prefix sharing.
+        restore_hook (Optional[Callable[[Any, Any], None]]): Restores a
+            model from a snapshot, for prefix sharing.
+        path_budget (Optional[PathBudget]): Limits on the paths and loops
+            generated. Defaults to no limit.
+        execution_mode (EXECUTION_MODES): Whether transitions are fired
+            through their trigger, or from a compiled table.
+        compiled_callbacks (Iterable[COMPILED_CALLBACKS]): The callbacks
+            run by compiled steps.
+        cross_check_ratio (float): The fraction of compiled steps
+            cross-checked through the real trigger, in [0, 1].
+        cross_check_seed (int): The seed of the cross-check sampling.
+        model_strategy (MODEL_STRATEGIES): How each test gets a clean model.
+        reset_hook (Optional[Callable[[Any], None]]): Resets the attributes
+            of a used model.
+        callback_policy (Union[CALLBACK_POLICIES, Dict[CALLBACK_KINDS,
+            CALLBACK_POLICIES]]): The policy of every callback, or of each
+            kind of callback, kinds left out being run.
+    """
+
+    expected_loops: int = 0
+    deadlock_mode: DEADLOCK_MODES = 'scc'
+    path_strategy: PATH_STRATEGIES = 'coverage'
+    share_prefixes: bool = True
+    snapshot_hook: Optional[Callable[[Any], Any]] = None
+    restore_hook: Optional[Callable[[Any, Any], None]] = None
+    path_budget: Optional[PathBudget] = None
+    execution_mode: EXECUTION_MODES = 'trigger'
+    compiled_callbacks: Iterable[COMPILED_CALLBACKS] = ()
+    cross_check_ratio: float = 0.05
+    cross_check_seed: int = 0
+    model_strategy: MODEL_STRATEGIES = 'reset'
+    reset_hook: Optional[Callable[[Any], None]] = None
+    callback_policy: Union[
+        CALLBACK_POLICIES,
+        Dict[CALLBACK_KINDS, CALLBACK_POLICIES],
+    ] = 'run'
+
+    def __post_init__(self):
+        """
+        Raises:
+            ValueError: For options not recognized, or a cross-check ratio
+                outside [0, 1].
+        """
+        # the options are frozen, so they are normalized through object
+        object.__setattr__(
+            self,
+            'compiled_callbacks',
+            tuple(self.compiled_callbacks),
+        )
+        object.__setattr__(
+            self,
+            'path_budget',
+            self.path_budget or PathBudget(),
+        )
+        choices = [
+            ('Deadlock mode', self.deadlock_mode, DEADLOCK_MODES),
+            ('Path strategy', self.path_strategy, PATH_STRATEGIES),
+            ('Execution mode', self.execution_mode, EXECUTION_MODES),
+            ('Model strategy', self.model_strategy, MODEL_STRATEGIES),
+        ]
+        choices.extend(
+            ('Callback', callback, COMPILED_CALLBACKS)
+            for callback in self.compiled_callbacks
+        )
+        policy = self.callback_policy
+        if isinstance(policy, str):
+            policy = {'prepare': policy}
+        for kind, kind_policy in policy.items():
+            choices.append(('Callback kind', kind, CALLBACK_KINDS))
+            choices.append(('Callback policy', kind_policy, CALLBACK_POLICIES))
+        for option, value, literal in choices:
+            if value not in get_args(literal):
+                raise ValueError(f'{option} {value} not recognized.')
+        if not 0.0 <= self.cross_check_ratio <= 1.0:
+            raise ValueError(
+                f'Cross-check ratio {self.cross_check_ratio} not in [0, 1].',
+            )
@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class PathBudget:
+    """Limits on the paths and loops generated for the execution and
+    deadlock suites. Once a limit is hit, the remaining paths are sampled
+    at random instead of enumerated, using `seed` so that runs can be
+    reproduced.
+
+    Attributes:
+        max_paths_per_state (Optional[int]): The most paths executed to
+            each target state.
+        max_path_length (Optional[int]): The most transitions in a path,
+            or states in a loop.
+        time_budget (Optional[float]): The seconds a suite may spend
+            enumerating paths before falling back to sampling.
+        seed (int): The seed of the sampling fallback.
+    """
+
+    max_paths_per_state: Optional[int] = None
+    max_path_length: Optional[int] = None
+    time_budget: Optional[float] = None
+    seed: int = 0
+
+    @property
+    def is_bounded(self) -> bool:
+        return (
+            self.max_paths_per_state is not None
+            or self.max_path_length is not None
+            or self.time_budget is not None
+        )
@@ -1,17 +1,55 @@
-from unittest.runner import TextTestRunner
-from unittest.case import TestCase
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields, replace
+from functools import cached_property, wraps
 from unittest.suite import TestSuite
 from pathlib import Path
-from rich import terminal_theme
-from rich.traceback import install
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+)
 from fsm_tester.adapters import (
     AdapterFactory,
 )
-from fsm_tester.entities import FSMProtocol
+from fsm_tester.entities import FSMProtocol, FuzzReport, MockerOptions
+from fsm_tester.components.analysis_cache import (
+    AnalysisCache,
+    MachineAnalyses,
+)
+from fsm_tester.components.compact_graph import CompactGraph
 from fsm_tester.components.graph_analyzer import GraphAnalyzer
 from fsm_tester.components.machine_mocker import MachineMocker
-from fsm_tester.components.rich_console import RichConsole as Console
-from fsm_tester.typing import DIALECTS
+from fsm_tester.components.report_writer import ReportWriter
+from fsm_tester.components.suite_runner import SuiteRunner
+from fsm_tester.typing import (
+    DIALECTS,
+    FUZZ_GUARDS,
+)
+
+if TYPE_CHECKING:
+    from networkx import MultiDiGraph
+
+
+def _memoized_suite(build: Callable[[Any], TestSuite]) -> property:
+    """Turn a suite builder of `FSMTester` into a property that builds the
+    suite on first access, and returns the same suite until the tester is
+    invalidated.
+    """
+    name = build.__name__
+
+    @wraps(build)
+    def suite(self) -> TestSuite:
+        self._refresh()
+        if name not in self._suites:
+            self._suites[name] = build(self)
+        return self._suites[name]
+
+    return property(suite)
 
 
 class FSMTester():
@@ -24,78 +62,219 @@ class FSMTester():
         'deadlock_states_suite',
     ]
 
+    # the suites run by `run_tests`
+    default_suites = [
+        'unreachable_states_suite',
+        'sink_states_suite',
+        'nondeterministic_transition_suite',
+        'machine_execution_suite',
+    ]
+
+    # the keyword arguments of the tester that are mocker options
+    mocker_fields = [field.name for field in fields(MockerOptions)]
+
     def __init__(
         self,
         fsm_module: FSMProtocol,
         final_state: str,
         dialect: DIALECTS = 'pytransitions',
-        expected_loops: int = 0,
+        expected_loops: Optional[int] = None,
         save_report: bool = False,
         report_dir: str = 'reports',
         verbosity=2,
         *args,
+        graph_from_dot: bool = False,
+        use_cache: bool = False,
+        cache_dir: Optional[str] = None,
+        options: Optional[MockerOptions] = None,
         **kwargs,
     ) -> None:
+        """
+        Args:
+            fsm_module (FSMProtocol): The machine class.
+            final_state (str): The state every path should end in.
+            dialect (DIALECTS): The FSM library of the machine. Defaults to
+                `pytransitions`.
+            expected_loops (Optional[int]): The number of times each loop
+                is executed, overriding `options`.
+            save_report (bool): Whether to stream the report of every suite
+                to a file. Defaults to False.
+            report_dir (str): Where reports are saved. Defaults to
+                `reports`.
+            verbosity (int): The verbosity of the test runner. Defaults to
+                2.
+            graph_from_dot (bool): Whether the graph is built from the DOT
+                export of the machine. Defaults to False.
+            use_cache (bool): Whether analyses are cached on disk. Defaults
+                to False.
+            cache_dir (Optional[str]): Where the cache lives. Defaults to
+                `<report_dir>/.fsm_cache`.
+            options (Optional[MockerOptions]): The options of the mocker.
+            **kwargs: Fields of `MockerOptions`, overriding `options`.
+                Other keyword arguments are ignored.
+
+        Raises:
+            TypeError: If the machine does not implement the FSMProtocol.
+            ValueError: For mocker options not recognized.
+        """
         if not isinstance(fsm_module, FSMProtocol):
             raise TypeError(
                 'The FSM Module must implement the FSMProtocol.'
             )
+        if expected_loops is not None:
+            kwargs['expected_loops'] = expected_loops
+        self.options = replace(
+            options or MockerOptions(),
+            **{
+                name: kwargs[name]
+                for name in FSMTester.mocker_fields
+                if name in kwargs
+            },
+        )
         self.adapter = AdapterFactory.create_adapter(fsm_module, dialect)
+        self.fsm_module = fsm_module
+        self.dialect = dialect
         self.final_state = final_state
-        self.graph = self.adapter.get_graph()
-        self.console = Console(
-            record=save_report,
+        self.graph_from_dot = graph_from_dot
+        self._cache = None
+        if use_cache:
+            self._cache = AnalysisCache(
+                cache_dir or Path(report_dir) / '.fsm_cache',
+            )
+        self._declared = self._declaration()
+        self.analyses = self._open_analyses()
+        # rich is only imported once a tester exists
+        from fsm_tester.components.rich_console import (  # noqa: PLC0415
+            RichConsole as Console,
         )
+
+        self.console = Console()
         self.save_report = save_report
+        # created on demand, when a report is saved
         self.reports_path = Path(report_dir)
-        self.reports_path.mkdir(exist_ok=True)
-        self.test_runner = TextTestRunner(
-            verbosity=verbosity,
-            stream=self.console,
+        self._traceback_installed = False
+        self.suite_runner = SuiteRunner(verbosity=verbosity)
+        # the graph, mocker and suites are built on first access
+        self._suites: Dict[str, TestSuite] = dict()
+        self.exit = True
+
+    def _declaration(self) -> Tuple[int, int, int, int]:
+        """A cheap fingerprint of the `states` and `transitions` declared on
+        the machine class: the identity and length of each."""
+        states = self.fsm_module.states
+        transitions = self.fsm_module.transitions
+        return (id(states), len(states), id(transitions), len(transitions))
+
+    def _open_analyses(self) -> MachineAnalyses:
+        """Open the memoized analyses of the machine, from the cache if the
+        tester uses one."""
+        if self._cache is None:
+            return MachineAnalyses()
+        return self._cache.analyses(
+            states=self.fsm_module.states,
+            transitions=self.fsm_module.transitions,
+            initial_state=self.adapter.initial_state,
         )
-        self.graph_analyzer = GraphAnalyzer(
-            graph=self.graph,
+
+    def invalidate(self) -> None:
+        """Drop the suites, the graph, the mocker and the analyses built so
+        far, and rebuild the adapter from the machine class. Called
+        automatically when a suite is requested after `states` or
+        `transitions` were reassigned on the machine class, or had entries
+        added or removed. Call it after editing an entry in place.
+        """
+        self.adapter = AdapterFactory.create_adapter(
+            self.fsm_module,
+            self.dialect,
+        )
+        self._declared = self._declaration()
+        self.analyses.flush()
+        self.analyses = self._open_analyses()
+        for name in [
+            'compact_graph',
+            'graph_analyzer',
+            'mocker_options',
+            'machine_mocker',
+        ]:
+            self.__dict__.pop(name, None)
+        self._suites.clear()
+
+    def _refresh(self) -> None:
+        """Invalidate the tester if the machine declaration changed."""
+        if self._declaration() != self._declared:
+            self.invalidate()
+
+    @cached_property
+    def compact_graph(self) -> CompactGraph:
+        """The graph of the machine, built on first access."""
+        return self.analyses.get_or_compute(
+            f'graph:dot={self.graph_from_dot}',
+            lambda: self.adapter.get_compact_graph(
+                from_dot=self.graph_from_dot,
+            ),
+        )
+
+    @cached_property
+    def graph_analyzer(self) -> GraphAnalyzer:
+        """The analyzer of the static suites, built on first access."""
+        return GraphAnalyzer(
+            graph=self.compact_graph,
             initial_state=self.adapter.initial_state,
             final_state=self.final_state,
+            analyses=self.analyses,
         )
-        self.machine_mocker = MachineMocker(
-            adapter=self.adapter,
-            expected_loops=expected_loops,
-            final_state=final_state,
-        )
-        self.suites = list()
-        self.suites.append(self.graph_analyzer.unreachable_states_suite())
-        self.suites.append(self.graph_analyzer.sink_states_suite())
-        self.suites.append(
-            self.graph_analyzer.nondeterministic_transition_suite(
-                transitions=self.adapter.get_transitions(),
-            )
+
+    @cached_property
+    def mocker_options(self) -> Dict[str, Any]:
+        """Everything a worker process needs to rebuild the mocker."""
+        return dict(
+            final_state=self.final_state,
+            options=self.options,
+            graph=self.compact_graph,
         )
-        # maybe this part should be executed only if the graph tests pass
-        self.suites.append(
-            self.machine_mocker.unreachable_states_suite(),
+
+    @cached_property
+    def machine_mocker(self) -> MachineMocker:
+        """The mocker of the dynamic suites, built on first access."""
+        return MachineMocker(
+            adapter=self.adapter,
+            analyses=self.analyses,
+            **self.mocker_options,
         )
-        self.exit = True
 
     @property
+    def suites(self) -> List[TestSuite]:
+        """The suites run by `run_tests`, built on first access. The analyses
+        computed to build them are written to the cache once, afterwards."""
+        suites = [self[name] for name in FSMTester.default_suites]
+        self.analyses.flush()
+        return suites
+
+    @property
+    def graph(self) -> 'MultiDiGraph':
+        """A read-only NetworkX view of the machine graph. `copy()` it to get
+        a graph that can be modified."""
+        return self.compact_graph.to_networkx()
+
+    @_memoized_suite
     def unreachable_states_suite(self) -> TestSuite:
         return self.graph_analyzer.unreachable_states_suite()
 
-    @property
+    @_memoized_suite
     def sink_states_suite(self) -> TestSuite:
         return self.graph_analyzer.sink_states_suite()
 
-    @property
+    @_memoized_suite
     def nondeterministic_transition_suite(self) -> TestSuite:
         return self.graph_analyzer.nondeterministic_transition_suite(
-            transitions=self.adapter.get_transitions(),
+            transitions=self.adapter.get_source_index(),
         )
 
-    @property
+    @_memoized_suite
     def machine_execution_suite(self) -> TestSuite:
         return self.machine_mocker.unreachable_states_suite()
 
-    @property
+    @_memoized_suite
     def deadlock_states_suite(self) -> TestSuite:
         return self.machine_mocker.dead_lock_suite()
 
@@ -122,16 +301,32 @@ class FSMTester():
             summary_info += str(failure)
         return summary_info
 
-    def run(self, test_suite: TestSuite):
-        """Runs a test suite.
+    def _start_suite(self, test_suite: TestSuite) -> None:
+        """Prepares a test suite to run, installing the rich traceback
+        handler on the first run. Suites run by the mocker get a new
+        `callback_report` for the callbacks timed while they run.
 
         Args:
-            test_suite (TestSuite): A test suite to be run.
+            test_suite (TestSuite): The test suite about to run.
+        """
+        if not self._traceback_installed:
+            from rich.traceback import install  # noqa: PLC0415
+
+            install(
+                console=self.console,
+                show_locals=True,
+            )
+            self._traceback_installed = True
+        recorder = getattr(test_suite, 'callback_recorder', None)
+        if recorder is not None:
+            setattr(test_suite, 'callback_report', recorder.start_report())
+
+    def _print_banner(self, test_suite: TestSuite) -> None:
+        """Prints the banner of a test suite.
+
+        Args:
+            test_suite (TestSuite): The test suite whose output follows.
         """
-        install(
-            console=self.console,
-            show_locals=True,
-        )
         self.console.print(
             f'FSMTester: Running {test_suite.suite_name}...',
             justify='center',
@@ -141,37 +336,350 @@ class FSMTester():
             '-----------------------------------\n\n',
             justify='center',
         )
-        suite_results = list()
+
+    def run(self, test_suite: TestSuite):
+        """Runs a test suite.
+
+        Args:
+            test_suite (TestSuite): A test suite to be run.
+        """
+        self._start_suite(test_suite)
+        self._print_banner(test_suite)
+        try:
+            output, successful, failures = self._collect_suite(test_suite)
+            self.console.print(output, markup=False, highlight=False)
+            self._finish_suite(test_suite, successful, failures)
+        finally:
+            self._close_report(test_suite)
+
+    def run_parallel(
+        self,
+        test_suite: TestSuite,
+        workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        warm_up: Optional[Callable[[MachineMocker], None]] = None,
+    ):
+        """Runs the generated tests of a suite in a pool of processes. Each
+        worker builds its own adapter and model from the machine class, so
+        the class, and the snapshot and restore hooks if any, must be
+        importable. Outcomes are reported in suite order. Suites without
+        generated tests are run serially with `run`.
+
+        Args:
+            test_suite (TestSuite): A test suite to be run.
+            workers (Optional[int]): The number of worker processes.
+                Defaults to the number of CPUs.
+            chunk_size (Optional[int]): The number of tests sent to a worker
+                at once. Defaults to about four chunks per worker.
+            warm_up (Optional[Callable[[MachineMocker], None]]): Called once
+                in every worker with its `MachineMocker`, before any test
+                runs. Must be importable.
+        """
+        specs = getattr(test_suite, 'specs', None)
+        if specs is None:
+            self.run(test_suite)
+            return
+        # multiprocessing is only imported for parallel runs
+        from fsm_tester.components.parallel_runner import (  # noqa: PLC0415
+            ParallelRunner,
+        )
+
+        runner = ParallelRunner(
+            fsm_module=self.fsm_module,
+            dialect=self.dialect,
+            mocker_options=self.mocker_options,
+            workers=workers,
+            chunk_size=chunk_size,
+            warm_up=warm_up,
+        )
+        self._start_suite(test_suite)
+        self._print_banner(test_suite)
+        try:
+            self._open_report(test_suite)
+            output, successful, failures = self._collect_outcomes(
+                test_suite,
+                runner.submit(
+                    specs,
+                    getattr(test_suite, 'callback_report', None),
+                )(),
+            )
+            self.console.print(output, markup=False, highlight=False)
+            self._finish_suite(test_suite, successful, failures)
+        finally:
+            self._close_report(test_suite)
+
+    def _open_report(self, test_suite: TestSuite) -> Optional[ReportWriter]:
+        """Opens the streamed report of a suite, if reports are saved, and
+        attaches it to the suite as its `report`.
+
+        Args:
+            test_suite (TestSuite): The test suite about to run.
+
+        Returns:
+            Optional[ReportWriter]: The report, or None.
+        """
+        writer = None
+        if self.save_report:
+            self.reports_path.mkdir(parents=True, exist_ok=True)
+            writer = ReportWriter(
+                self.reports_path / f'report_{test_suite.suite_name}.ndjson',
+                test_suite.suite_name,
+            )
+        setattr(test_suite, 'report', writer)
+        return writer
+
+    @staticmethod
+    def _close_report(test_suite: TestSuite) -> None:
+        """Closes the streamed report of a suite, if it is still open: the
+        run was interrupted before the suite was reported.
+
+        Args:
+            test_suite (TestSuite): The test suite that ran.
+        """
+        report = getattr(test_suite, 'report', None)
+        if report is not None:
+            report.close(successful=False)
+
+    @staticmethod
+    def _collect_outcomes(
+        test_suite: TestSuite,
+        outcomes: Iterable,
+    ) -> Tuple[str, bool, list]:
+        """Formats the outcomes of tests run by worker processes. When
+        reports are saved, every outcome is written to the report opened
+        with `_open_report` as soon as it arrives, and the output holds only
+        the failures and a summary.
+
+        Args:
+            test_suite (TestSuite): The test suite that runs.
+            outcomes (Iterable): The `SpecOutcome` of every test, in suite
+                order.
+
+        Returns:
+            Tuple[str, bool, list]: The output of the tests, whether every
+                test was successful, and the failed tests.
+        """
+        writer = getattr(test_suite, 'report', None)
+        lines = list()
         failures = list()
-        for test in test_suite:
-            test: TestCase
-            self.test = test
-            result = self.test_runner.run(test)
-            is_successful = result.wasSuccessful()
-            if not is_successful:
-                failures.append(test)
-            suite_results.append(is_successful)
-        errors_report = self._report_errors(test_suite.fail_msg, failures)
-        if not all(suite_results) and self.save_report:
-            self.console.save_html(
-                f'{self.reports_path.resolve()}/report_{test_suite.suite_name}.html',  # noqa
-                theme=terminal_theme.MONOKAI,
+        tests = 0
+        for outcome in outcomes:
+            tests += 1
+            if writer is not None:
+                writer.test(outcome.name, outcome.status, outcome.message)
+            if writer is None or outcome.status != 'ok':
+                lines.append(f'{outcome.name} ... {outcome.status}')
+            if outcome.status != 'ok':
+                lines.append(outcome.message)
+                failures.append(outcome.name)
+        if writer is not None:
+            lines.append(f'Ran {tests} tests, {len(failures)} failed')
+        return '\n'.join(lines), not failures, failures
+
+    def _collect_suite(self, test_suite: TestSuite) -> Tuple[str, bool, list]:
+        """Runs the tests of a suite into one result with `suite_runner`,
+        collecting their output instead of printing it.
+
+        Args:
+            test_suite (TestSuite): A test suite to be run.
+
+        Returns:
+            Tuple[str, bool, list]: The output of the tests, whether every
+                test was successful, and the failed tests.
+        """
+        output, result = self.suite_runner.run(
+            test_suite,
+            self._open_report(test_suite),
+        )
+        return (
+            output,
+            result.wasSuccessful(),
+            self.suite_runner.failed_tests(result),
+        )
+
+    def fuzz(
+        self,
+        walks: int = 100,
+        walk_length: int = 100,
+        seed: int = 0,
+        guards: FUZZ_GUARDS = 'real',
+        batch_size: int = 50,
+    ) -> FuzzReport:
+        """Runs seeded random walks over the machine, with the `fuzz_suite`
+        of the mocker, and prints their throughput. A failed walk is replayed
+        with `machine_mocker.random_walk` and the seed it was reported with.
+
+        Args:
+            walks (int): The number of walks. Defaults to 100.
+            walk_length (int): The maximum number of triggers fired per
+                walk. Defaults to 100.
+            seed (int): The seed the walk seeds are drawn from. Defaults to
+                0.
+            guards (FUZZ_GUARDS): Whether the triggers evaluate the real
+                guards, or guards forced to random values. Defaults to
+                `real`.
+            batch_size (int): The number of walks per test case. Defaults to
+                50.
+
+        Returns:
+            FuzzReport: The walks, transitions and throughput of the run.
+        """
+        test_suite = self.machine_mocker.fuzz_suite(
+            walks=walks,
+            walk_length=walk_length,
+            seed=seed,
+            guards=guards,
+            batch_size=batch_size,
+        )
+        self.run(test_suite)
+        return test_suite.fuzz_report
+
+    def _report_suite(
+        self,
+        test_suite: TestSuite,
+        successful: bool,
+        failures: list,
+    ) -> str:
+        """Prints the coverage, fuzzing and callback reports of a finished
+        test suite, and closes its streamed report with them, if any.
+
+        Args:
+            test_suite (TestSuite): The test suite that ran.
+            successful (bool): Whether every test was successful.
+            failures (list): The failed tests.
+
+        Returns:
+            str: A summary of the errors found during the test run.
+        """
+        coverage = getattr(test_suite, 'coverage', None)
+        if coverage is not None:
+            self.console.print(
+                f'Coverage: {coverage}',
+                style='bold' if coverage.complete else 'bold yellow',
+            )
+        fuzz_report = getattr(test_suite, 'fuzz_report', None)
+        if fuzz_report is not None:
+            self.console.print(
+                f'Fuzzing: {fuzz_report}',
+                style='bold yellow' if fuzz_report.failures else 'bold',
             )
+        callback_report = getattr(test_suite, 'callback_report', None)
+        if callback_report is not None and callback_report.durations:
+            self.console.print('Callbacks:', style='bold')
+            self.console.print(str(callback_report))
+        report = getattr(test_suite, 'report', None)
+        if report is not None:
+            reports = dict()
+            if coverage is not None:
+                reports['coverage'] = str(coverage)
+            if fuzz_report is not None:
+                reports['fuzzing'] = str(fuzz_report)
+            if callback_report is not None and callback_report.durations:
+                reports['callbacks'] = str(callback_report)
+            report.close(successful, **reports)
+        return self._report_errors(test_suite.fail_msg, failures)
+
+    def _finish_suite(
+        self,
+        test_suite: TestSuite,
+        successful: bool,
+        failures: list,
+    ) -> None:
+        """Reports a finished test suite with `_report_suite`, writes the
+        analyses computed for it to the cache, and asserts that every test
+        passed.
+
+        Args:
+            test_suite (TestSuite): The test suite that ran.
+            successful (bool): Whether every test was successful.
+            failures (list): The failed tests.
+        """
+        errors_report = self._report_suite(test_suite, successful, failures)
+        self.analyses.flush()
+        self.console.end_capture()
+        assert successful, errors_report
+
+    def run_tests(self, workers: Optional[int] = None):
+        """Run all the test suites generated by the FSMTester concurrently.
+        The generated tests of the dynamic suites run in pools of processes,
+        as with `run_parallel`, while the static graph suites run in a pool
+        of threads. Dynamic suites too small to be worth a pool, or whose
+        machine class or hooks cannot be sent to worker processes, run
+        serially. The output of every suite is collected and printed in
+        suite order once all of them are done, followed by a single summary.
+
+        Args:
+            workers (Optional[int]): The number of worker processes of each
+                dynamic suite. Defaults to the number of CPUs.
+        """
+        from fsm_tester.components.parallel_runner import (  # noqa: PLC0415
+            ParallelRunner,
+        )
+
+        runner = ParallelRunner(
+            fsm_module=self.fsm_module,
+            dialect=self.dialect,
+            mocker_options=self.mocker_options,
+            workers=workers,
+        )
+        suites = self.suites
+        try:
+            pooled = dict()
+            serial = list()
+            for idx, suite in enumerate(suites):
+                specs = getattr(suite, 'specs', None)
+                if specs is not None and runner.can_pool(specs):
+                    self._start_suite(suite)
+                    self._open_report(suite)
+                    # the process pools are started before any thread
+                    pooled[idx] = runner.submit(
+                        specs,
+                        getattr(suite, 'callback_report', None),
+                    )
+                elif specs is not None:
+                    serial.append(idx)
+            collected = dict()
+            with ThreadPoolExecutor() as threads:
+                static = dict()
+                for idx, suite in enumerate(suites):
+                    if idx not in pooled and idx not in serial:
+                        self._start_suite(suite)
+                        static[idx] = threads.submit(
+                            self._collect_suite,
+                            suite,
+                        )
+                # the mocker runs one suite at a time, in this thread
+                for idx in serial:
+                    self._start_suite(suites[idx])
+                    collected[idx] = self._collect_suite(suites[idx])
+                for idx, collect in pooled.items():
+                    collected[idx] = self._collect_outcomes(
+                        suites[idx],
+                        collect(),
+                    )
+                for idx, future in static.items():
+                    collected[idx] = future.result()
+            errors_reports = list()
+            for idx, suite in enumerate(suites):
+                output, successful, failures = collected[idx]
+                self._print_banner(suite)
+                self.console.print(output, markup=False, highlight=False)
+                errors_report = self._report_suite(
+                    suite,
+                    successful,
+                    failures,
+                )
+                if not successful:
+                    errors_reports.append(errors_report)
+        finally:
+            for suite in suites:
+                self._close_report(suite)
+        passed = len(suites) - len(errors_reports)
+        self.console.print(
+            f'FSMTester: {passed}/{len(suites)} suites passed',
+            justify='center',
+            style='bold black on green' if not errors_reports
+            else 'bold white on red',
+        )
         self.console.end_capture()
-        assert all(suite_results), errors_report
-
-    def run_tests(self):
-        """Run all the test suites generated by the FSMTester."""
-        for suite in self.suites:
-            suite_results = list()
-            failures = list()
-            for test in suite:
-                test: TestCase
-                self.test = test
-                result = self.test_runner.run(test)
-                is_successful = result.wasSuccessful()
-                if not is_successful:
-                    failures.append(test)
-                suite_results.append(is_successful)
-            errors_report = self._report_errors(suite.fail_msg, failures)
-            assert all(suite_results), errors_report
+        assert not errors_reports, '\n'.join(errors_reports)
@@ -1,6 +1,25 @@
 from fsm_tester.typing.types import (
     Adapter,
+    CALLBACK_KINDS,
+    CALLBACK_POLICIES,
+    COMPILED_CALLBACKS,
+    DEADLOCK_MODES,
     DIALECTS,
+    EXECUTION_MODES,
+    FUZZ_GUARDS,
+    MODEL_STRATEGIES,
+    PATH_STRATEGIES,
 )
 
-__all__ = ['Adapter', 'DIALECTS']
+__all__ = [
+    'Adapter',
+    'CALLBACK_KINDS',
+    'CALLBACK_POLICIES',
+    'COMPILED_CALLBACKS',
+    'DEADLOCK_MODES',
+    'DIALECTS',
+    'EXECUTION_MODES',
+    'FUZZ_GUARDS',
+    'MODEL_STRATEGIES',
+    'PATH_STRATEGIES',
+]
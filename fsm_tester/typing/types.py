@@ -1,6 +1,17 @@
-from fsm_tester.adapters import BaseAdapter
-from typing import Literal, TypeVar
+from typing import Literal, TypeVar, TYPE_CHECKING
 
+if TYPE_CHECKING:
+    # the adapters import these literals, so they are not imported at runtime
+    from fsm_tester.adapters import BaseAdapter
 
-Adapter = TypeVar('Adapter', bound=BaseAdapter)
+
+Adapter = TypeVar('Adapter', bound='BaseAdapter')
 DIALECTS = Literal['pytransitions', 'python-statemachine']
+DEADLOCK_MODES = Literal['scc', 'cycles']
+PATH_STRATEGIES = Literal['coverage', 'exhaustive']
+MODEL_STRATEGIES = Literal['reset', 'factory', 'clone']
+EXECUTION_MODES = Literal['trigger', 'compiled']
+COMPILED_CALLBACKS = Literal['before', 'on_exit', 'on_enter', 'after']
+FUZZ_GUARDS = Literal['real', 'random']
+CALLBACK_KINDS = Literal['prepare', 'before', 'on_exit', 'on_enter', 'after']
+CALLBACK_POLICIES = Literal['run', 'skip', 'timed']
@@ -0,0 +1,22 @@
+from transitions.extensions import GraphMachine
+
+
+class WildcardMachine:
+    states = ['Idle', 'Running', 'Paused', 'Finish']
+
+    transitions = [
+        {'trigger': 'start', 'source': 'Idle', 'dest': 'Running'},
+        {'trigger': 'pause', 'source': 'Running', 'dest': 'Paused'},
+        {'trigger': 'resume', 'source': 'Paused', 'dest': 'Running'},
+        {'trigger': 'finish', 'source': ['Running', 'Paused'], 'dest': 'Finish'},  # noqa
+        {'trigger': 'refresh', 'source': 'Paused', 'dest': '='},
+        {'trigger': 'reset', 'source': '*', 'dest': 'Idle'},
+    ]
+
+    def __init__(self):
+        self.machine = GraphMachine(
+            model=self,
+            states=WildcardMachine.states,
+            transitions=WildcardMachine.transitions,
+            initial='Idle',
+        )
@@ -0,0 +1,65 @@
+import pytest  # noqa
+from machines.assembly_line_impl.main import AssemblyLine
+from machines.simple.wildcard_machine import WildcardMachine
+from fsm_tester.adapters import TransitionsAdapter
+
+
+@pytest.fixture
+def adapter():
+    return TransitionsAdapter(AssemblyLine)
+
+
+def test_native_graph_matches_dot_graph(adapter):
+    native = adapter.get_graph()
+    dot = adapter.get_graph(from_dot=True)
+    assert set(native.nodes) == set(dot.nodes)
+    assert sorted(native.edges(data='label')) == sorted(
+        dot.edges(data='label')
+    )
+
+
+def test_source_index_expands_wildcards_and_lists():
+    adapter = TransitionsAdapter(WildcardMachine)
+    source_index = adapter.get_source_index()
+    for state in WildcardMachine.states:
+        assert 'reset' in [tr.name for tr in source_index[state]]
+    assert adapter.get_transition('Paused', 'Finish').name == 'finish'
+    assert adapter.get_transition('Paused', 'Paused').name == 'refresh'
+    assert adapter.get_graph().has_edge('Finish', 'Idle')
+
+
+def test_test_cases_expand_wildcards_and_lists():
+    adapter = TransitionsAdapter(WildcardMachine)
+    names = [test_case.name for test_case in adapter.get_test_cases()]
+    assert len(names) == sum(
+        len(trs) for trs in adapter.get_source_index().values()
+    )
+    assert 'Paused -> Finish by finish' in names
+    assert 'Paused -> Paused by refresh' in names
+    for state in WildcardMachine.states:
+        assert f'{state} -> Idle by reset' in names
+
+
+def test_transition_index_groups_by_state_pair(adapter):
+    transition_index = adapter.get_transition_index()
+    assert sum(len(trs) for trs in transition_index.values()) == len(
+        AssemblyLine.transitions,
+    )
+    inspected = adapter.get_transitions_between(
+        'InspectComponent',
+        'DiscardComponent',
+    )
+    assert [tr.name for tr in inspected] == ['inspected_component']
+    assert adapter.get_transitions_between('Finish', 'Initial') == []
+    assert adapter.get_transition('Finish', 'Initial') is None
+
+
+def test_trigger_functions_are_resolved_once(adapter):
+    trigger_functions = adapter.get_trigger_functions()
+    assert set(trigger_functions) == {
+        tr['trigger'] for tr in AssemblyLine.transitions
+    }
+    transition = adapter.get_transition('Initial', 'WaitOp')
+    t_func = adapter.get_transition_function(transition)
+    assert t_func is trigger_functions['initializing']
+    assert adapter.get_transition_function(transition) is t_func
@@ -0,0 +1,72 @@
+import zlib
+import pytest  # noqa
+from machines.assembly_line_impl.main import AssemblyLine
+from fsm_tester.components.analysis_cache import AnalysisCache, machine_key
+from fsm_tester.fsm_tester import FSMTester
+
+# the pickle of `missing.X`, from a module that no longer exists
+STALE_PICKLE = (
+    b'\x80\x04\x95\x0f\x00\x00\x00\x00\x00\x00\x00'
+    b'\x8c\x07missing\x94\x8c\x01X\x94\x93\x94.'
+)
+
+
+def test_analyses_are_reused_between_testers(tmp_path):
+    FSMTester(
+        AssemblyLine,
+        final_state='Finish',
+        use_cache=True,
+        cache_dir=tmp_path,
+    ).suites
+    cache = AnalysisCache(tmp_path)
+    key = machine_key(
+        AssemblyLine.states,
+        AssemblyLine.transitions,
+        'Initial',
+    )
+    entries = cache.load(key)
+    assert 'reachable' in entries
+    assert 'paths:coverage' in entries
+
+    fsm_tester = FSMTester(
+        AssemblyLine,
+        final_state='Finish',
+        use_cache=True,
+        cache_dir=tmp_path,
+    )
+    assert fsm_tester.analyses.entries.keys() == entries.keys()
+    fsm_tester.run(fsm_tester.machine_execution_suite)
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = AnalysisCache(tmp_path, max_entries=2)
+    for key in ('a', 'b', 'c'):
+        cache.store(key, {'value': key})
+    assert cache.load('a') == dict()
+    assert cache.load('c') == {'value': 'c'}
+
+
+def test_unreadable_entries_are_dropped(tmp_path):
+    cache = AnalysisCache(tmp_path)
+    cache.store('stale', {'value': 'stale'})
+    path = cache._path('stale')
+    path.write_bytes(zlib.compress(STALE_PICKLE))
+    assert cache.load('stale') == dict()
+    assert not path.exists()
+
+
+def test_results_are_written_once_per_flush(tmp_path, monkeypatch):
+    cache = AnalysisCache(tmp_path)
+    stores = list()
+    monkeypatch.setattr(
+        cache,
+        'store',
+        lambda key, entries: stores.append(dict(entries)),
+    )
+    analyses = cache.analyses(['A'], list(), 'A')
+    analyses.get_or_compute('first', lambda: 1)
+    analyses.get_or_compute('second', lambda: 2)
+    assert not stores
+    analyses.flush()
+    analyses.flush()
+    assert stores == [{'first': 1, 'second': 2}]
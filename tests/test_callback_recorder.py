@@ -0,0 +1,67 @@
+import pytest
+from machines.assembly_line_impl.main import AssemblyLine
+from fsm_tester.entities import CallbackReport
+from fsm_tester.fsm_tester import FSMTester
+
+
+DISCARD_PATH = [
+    'Initial',
+    'WaitOp',
+    'PickComponent',
+    'InspectComponent',
+    'DiscardComponent',
+]
+ENTERED_STATES = len(DISCARD_PATH) - 1
+DURATIONS = [0.004, 0.001, 0.003, 0.002]
+MEDIAN = 0.002
+SLOWEST = 0.004
+
+
+def discard(**kwargs):
+    fsm_tester = FSMTester(AssemblyLine, final_state='Finish', **kwargs)
+    mocker = fsm_tester.machine_mocker
+    report = mocker.callback_recorder.start_report()
+    mocker.check_path(DISCARD_PATH)
+    return fsm_tester, report
+
+
+@pytest.mark.parametrize(
+    'options',
+    [
+        dict(),
+        dict(model_strategy='clone'),
+        dict(execution_mode='compiled', compiled_callbacks=['on_enter']),
+    ],
+)
+def test_timed_callbacks_are_recorded(options):
+    fsm_tester, report = discard(callback_policy='timed', **options)
+    assert len(report.durations['print_state']) == ENTERED_STATES
+    assert len(report.durations['count_discarded_components']) == 1
+    assert fsm_tester.adapter.fsm.defective_components_count == 1
+
+
+def test_skipped_callbacks_do_not_run():
+    fsm_tester, report = discard(callback_policy={'on_enter': 'skip'})
+    assert fsm_tester.adapter.fsm.defective_components_count == 0
+    assert not report.durations
+
+
+def test_recycled_models_are_wrapped_once():
+    fsm_tester, report = discard(callback_policy='timed')
+    fsm_tester.machine_mocker.check_path(DISCARD_PATH)
+    assert len(report.durations['print_state']) == 2 * ENTERED_STATES
+
+
+def test_summary_percentiles():
+    report = CallbackReport()
+    for duration in DURATIONS:
+        report.record('on_enter_slow', duration)
+    timing = report.summary()['on_enter_slow']
+    assert timing.calls == len(DURATIONS)
+    assert timing.p50 == MEDIAN
+    assert timing.max == SLOWEST
+
+
+def test_unknown_policy():
+    with pytest.raises(ValueError, match='not recognized'):
+        FSMTester(AssemblyLine, final_state='Finish', callback_policy='lazy')
@@ -0,0 +1,61 @@
+import networkx as nx
+import pytest  # noqa
+from machines.assembly_line_impl.main import AssemblyLine
+from fsm_tester.adapters import TransitionsAdapter
+from fsm_tester.components.compact_graph import CompactGraph
+
+
+@pytest.fixture
+def graph():
+    return TransitionsAdapter(AssemblyLine).get_graph()
+
+
+@pytest.fixture
+def compact(graph):
+    return CompactGraph.from_networkx(graph)
+
+
+def test_round_trip_keeps_edges(graph, compact):
+    assert sorted(compact.to_networkx().edges(data='label')) == sorted(
+        graph.edges(data='label')
+    )
+
+
+def test_reachability_matches_networkx(graph, compact):
+    for state in graph.nodes:
+        assert compact.ancestors(state) == nx.ancestors(graph, state) | {state}
+        assert compact.descendants(state) == nx.descendants(graph, state) | {
+            state
+        }
+
+
+def test_simple_paths_and_cycles_match_networkx(graph, compact):
+    simple_graph = nx.DiGraph(graph)
+    for state in graph.nodes:
+        if state == 'Initial':
+            continue
+        assert sorted(compact.all_simple_paths('Initial', state)) == sorted(
+            nx.all_simple_paths(simple_graph, 'Initial', state)
+        )
+    assert len(list(compact.simple_cycles())) == len(
+        list(nx.simple_cycles(simple_graph))
+    )
+
+
+def test_networkx_view_reads_the_arrays(graph, compact):
+    view = compact.to_networkx()
+    assert nx.is_frozen(view)
+    with pytest.raises(nx.NetworkXError):
+        view.add_edge('Initial', 'Finish')
+    assert view.number_of_edges() == graph.number_of_edges()
+    for state in graph.nodes:
+        assert sorted(view.successors(state)) == sorted(
+            graph.successors(state)
+        )
+        assert sorted(view.in_edges(state, data='label')) == sorted(
+            graph.in_edges(state, data='label')
+        )
+        assert nx.descendants(view, state) == nx.descendants(graph, state)
+    source, dest, label = next(iter(graph.edges(data='label')))
+    assert view[source][dest][0]['label'] == label
+    assert nx.utils.graphs_equal(view.copy(), graph)
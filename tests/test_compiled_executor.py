@@ -0,0 +1,58 @@
+import pytest
+from machines.assembly_line_impl.main import AssemblyLine
+from fsm_tester.fsm_tester import FSMTester
+
+
+def create_tester(**kwargs):
+    return FSMTester(
+        AssemblyLine,
+        final_state='Finish',
+        expected_loops=3,
+        execution_mode='compiled',
+        **kwargs,
+    )
+
+
+def test_compiled_suites_pass():
+    fsm_tester = create_tester(
+        path_strategy='exhaustive',
+        deadlock_mode='cycles',
+        cross_check_ratio=0.0,
+    )
+    executor = fsm_tester.machine_mocker.compiled_executor
+    fsm_tester.run(fsm_tester.machine_execution_suite)
+    fsm_tester.run(fsm_tester.deadlock_states_suite)
+    assert executor.compiled_steps > 0
+    assert executor.cross_checks == 0
+
+
+def test_selected_callbacks_run():
+    fsm_tester = create_tester(
+        compiled_callbacks=['on_enter'],
+        cross_check_ratio=0.0,
+    )
+    model = fsm_tester.adapter.fsm
+    fsm_tester.machine_mocker.execute_transition(
+        'InspectComponent',
+        'DiscardComponent',
+    )
+    assert model.state == 'DiscardComponent'
+    assert model.defective_components_count == 1
+
+
+def test_cross_checks_are_seeded():
+    counts = list()
+    for _ in range(2):
+        fsm_tester = create_tester(cross_check_ratio=0.5, cross_check_seed=1)
+        fsm_tester.run(fsm_tester.machine_execution_suite)
+        executor = fsm_tester.machine_mocker.compiled_executor
+        assert executor.cross_checks > 0
+        counts.append((executor.cross_checks, executor.compiled_steps))
+    assert counts[0] == counts[1]
+
+
+def test_invalid_options_are_rejected():
+    with pytest.raises(ValueError, match='not recognized'):
+        create_tester(compiled_callbacks=['prepare'])
+    with pytest.raises(ValueError, match='not recognized'):
+        FSMTester(AssemblyLine, final_state='Finish', execution_mode='fast')
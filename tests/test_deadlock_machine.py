@@ -13,9 +13,10 @@ def fsm_tester():
     )
 
 
-@pytest.mark.xfail
 def test_deadlock_states_suite(fsm_tester):
     suite = fsm_tester.deadlock_states_suite
+    # the C, D, E loop is escapable once its is_defective guard is mocked
+    assert suite.countTestCases() == 1
     fsm_tester.run(suite)
 
 
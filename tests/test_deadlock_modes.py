@@ -0,0 +1,33 @@
+import pytest
+from machines.assembly_line_impl.main import AssemblyLine
+from machines.defective.sink import SinkStateMachine
+from fsm_tester.fsm_tester import FSMTester
+
+
+# the A..G loop escapes to G, the F self loop cannot
+SINK_MACHINE_LOOPING_COMPONENTS = 2
+
+
+def test_scc_mode_reports_inescapable_loops():
+    fsm_tester = FSMTester(
+        SinkStateMachine,
+        final_state='G',
+        expected_loops=1,
+    )
+    suite = fsm_tester.deadlock_states_suite
+    assert suite.countTestCases() == SINK_MACHINE_LOOPING_COMPONENTS
+    with pytest.raises(AssertionError, match='Deadlock Detected'):
+        fsm_tester.run(suite)
+
+
+def test_cycles_mode_executes_every_loop():
+    fsm_tester = FSMTester(
+        AssemblyLine,
+        final_state='Finish',
+        expected_loops=3,
+        deadlock_mode='cycles',
+    )
+    suite = fsm_tester.deadlock_states_suite
+    loops = fsm_tester.machine_mocker._find_loops()
+    assert suite.countTestCases() == len(loops)
+    fsm_tester.run(suite)
@@ -0,0 +1,112 @@
+import unittest
+import pytest
+from transitions import Machine
+from machines.assembly_line_impl.main import AssemblyLine
+from fsm_tester.fsm_tester import FSMTester
+
+
+WALKS = 40
+WALK_LENGTH = 30
+BATCH_SIZE = 16
+BATCHES = 3
+
+
+class CorruptingMachine:
+    """Jumping to C is never allowed by its guard, and its callback puts the
+    machine back in A, which a trigger leading to C cannot do."""
+
+    states = ['A', 'B', 'C']
+
+    transitions = [
+        {'trigger': 'forth', 'source': 'A', 'dest': 'B'},
+        {'trigger': 'back', 'source': 'B', 'dest': 'A'},
+        {
+            'trigger': 'jump',
+            'source': 'B',
+            'dest': 'C',
+            'conditions': 'may_jump',
+            'after': 'corrupt',
+        },
+        {'trigger': 'back', 'source': 'C', 'dest': 'A'},
+    ]
+
+    def __init__(self):
+        self.machine = Machine(
+            model=self,
+            states=CorruptingMachine.states,
+            transitions=CorruptingMachine.transitions,
+            initial='A',
+        )
+        self.jump_allowed = False
+
+    def may_jump(self):
+        return self.jump_allowed
+
+    def corrupt(self):
+        self.state = 'A'
+
+
+def run_fuzz_suite(fsm_tester, **kwargs):
+    suite = fsm_tester.machine_mocker.fuzz_suite(
+        walks=WALKS,
+        walk_length=WALK_LENGTH,
+        batch_size=BATCH_SIZE,
+        **kwargs,
+    )
+    result = unittest.TestResult()
+    for test in suite:
+        test.run(result)
+    return suite, result
+
+
+def test_real_guards_never_corrupt_the_state():
+    fsm_tester = FSMTester(CorruptingMachine, final_state='C')
+    suite, result = run_fuzz_suite(fsm_tester, guards='real')
+    assert result.wasSuccessful()
+    assert suite.countTestCases() == BATCHES
+    assert suite.fuzz_report.walks == WALKS
+    assert suite.fuzz_report.transitions == WALKS * WALK_LENGTH
+
+
+def test_random_guards_report_replayable_seeds():
+    fsm_tester = FSMTester(CorruptingMachine, final_state='C')
+    suite, result = run_fuzz_suite(fsm_tester, guards='random', seed=3)
+    assert not result.wasSuccessful()
+    walk_seed, message = suite.fuzz_report.failures[0]
+    assert 'jump' in message
+    with pytest.raises(AssertionError, match='is in state A'):
+        fsm_tester.machine_mocker.random_walk(
+            walk_seed,
+            WALK_LENGTH,
+            guards='random',
+        )
+
+
+def test_compiled_walks_match_triggered_walks():
+    reports = [
+        run_fuzz_suite(
+            FSMTester(
+                AssemblyLine,
+                final_state='Finish',
+                execution_mode=execution_mode,
+                cross_check_ratio=0.5,
+            ),
+            guards='random',
+        )[0].fuzz_report
+        for execution_mode in ['trigger', 'compiled']
+    ]
+    assert reports[0].transitions == reports[1].transitions
+    assert not reports[1].failures
+
+
+def test_unknown_guard_mode():
+    fsm_tester = FSMTester(CorruptingMachine, final_state='C')
+    with pytest.raises(ValueError, match='not recognized'):
+        fsm_tester.machine_mocker.fuzz_suite(guards='forced')
+
+
+def test_fuzz_runs_and_reports(capsys):
+    fsm_tester = FSMTester(AssemblyLine, final_state='Finish')
+    report = fsm_tester.fuzz(walks=WALKS, walk_length=WALK_LENGTH)
+    assert report.walks == WALKS
+    assert 'Fuzzing: ' in capsys.readouterr().out
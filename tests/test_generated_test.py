@@ -0,0 +1,41 @@
+import gc
+import unittest
+import weakref
+from machines.assembly_line_impl.main import AssemblyLine
+from fsm_tester.components.generated_test import GeneratedTest
+from fsm_tester.fsm_tester import FSMTester
+
+
+def every_suite(fsm_tester):
+    return [fsm_tester[name] for name in FSMTester.test_suites]
+
+
+def test_suites_leave_test_case_untouched():
+    before = set(vars(unittest.TestCase))
+    fsm_tester = FSMTester(AssemblyLine, final_state='Finish')
+    for suite in every_suite(fsm_tester):
+        for test in suite:
+            assert isinstance(test, GeneratedTest)
+    assert set(vars(unittest.TestCase)) == before
+
+
+def test_tests_are_released_with_their_suite():
+    fsm_tester = FSMTester(AssemblyLine, final_state='Finish')
+    suite = fsm_tester.machine_execution_suite
+    tests = [weakref.ref(test) for test in suite]
+    # the tester memoizes its suites until invalidated
+    fsm_tester.invalidate()
+    del suite
+    gc.collect()
+    assert all(test() is None for test in tests)
+
+
+def test_generated_tests_report_their_name():
+    passing = GeneratedTest('test_passing', lambda: None)
+    failing = GeneratedTest('test_failing', lambda: None)
+    assert passing != failing
+    assert str(passing).startswith('test_passing (')
+    assert passing.id().endswith('.test_passing')
+    result = unittest.TestResult()
+    passing(result)
+    assert result.wasSuccessful()
@@ -0,0 +1,160 @@
+import time
+from transitions import Machine
+from machines.assembly_line_impl.main import AssemblyLine
+from fsm_tester.adapters import TransitionsAdapter
+from fsm_tester.components.guard_explorer import GuardExplorer
+from fsm_tester.fsm_tester import FSMTester
+
+
+BAD = ('is_bad_component', True)
+GOOD = ('is_bad_component', False)
+MAX_ATTEMPTS = ('max_attempts', True)
+BUDGET = 3
+FAN_OUT = 40
+# the assignments preempting a transition, through is_ready or is_open
+PREEMPTIONS = 2
+TIME_LIMIT = 1.0
+
+
+class ContradictoryMachine:
+    """C is only reached with `ready` both true and false, and D only if
+    the unguarded `skip` back to A does not fire first."""
+
+    states = ['A', 'B', 'C', 'D']
+
+    transitions = [
+        {'trigger': 'go', 'source': 'A', 'dest': 'B', 'conditions': 'ready'},
+        {'trigger': 'go', 'source': 'B', 'dest': 'C', 'unless': 'ready'},
+        {'trigger': 'skip', 'source': 'A', 'dest': 'A'},
+        {'trigger': 'skip', 'source': 'A', 'dest': 'D'},
+    ]
+
+    def __init__(self):
+        self.machine = Machine(
+            model=self,
+            states=ContradictoryMachine.states,
+            transitions=ContradictoryMachine.transitions,
+            initial='A',
+        )
+        self.is_ready = True
+
+    def ready(self):
+        return self.is_ready
+
+
+class FanOutMachine:
+    """`go` leads from A to one of many states, each transition guarded by
+    its own condition and one of two shared ones, so that every transition
+    is preempted by all the ones declared before it."""
+
+    states = ['A', *(f'S{idx}' for idx in range(FAN_OUT))]
+
+    transitions = [
+        {
+            'trigger': 'go',
+            'source': 'A',
+            'dest': f'S{idx}',
+            'conditions': [f'is_open_{idx}', f'is_ready_{idx % 2}'],
+        }
+        for idx in range(FAN_OUT)
+    ]
+
+    def __init__(self):
+        self.machine = Machine(
+            model=self,
+            states=FanOutMachine.states,
+            transitions=FanOutMachine.transitions,
+            initial='A',
+            auto_transitions=False,
+        )
+
+
+def test_assignments_stay_consistent_along_paths():
+    explorer = GuardExplorer(TransitionsAdapter(AssemblyLine))
+    exploration = explorer.explore()
+    assert exploration.complete
+    assert exploration.reachable['PlaceComponent'] == [(GOOD,)]
+    assert exploration.reachable['PerformCalibration'] == [
+        (BAD, MAX_ATTEMPTS),
+    ]
+    assert sorted(exploration.reachable['Finish']) == [
+        (GOOD,),
+        (BAD, MAX_ATTEMPTS),
+    ]
+
+
+def test_path_assignment():
+    explorer = GuardExplorer(TransitionsAdapter(AssemblyLine))
+    assert explorer.path_assignment(
+        ['InspectComponent', 'DiscardComponent', 'ReturnToHome', 'WaitOp'],
+    ) == {'is_bad_component': True, 'max_attempts': False}
+    assert (
+        explorer.path_assignment(
+            [
+                'InspectComponent',
+                'DiscardComponent',
+                'ReturnToHome',
+                'WaitOp',
+                'PickComponent',
+                'InspectComponent',
+                'PlaceComponent',
+            ],
+        )
+        is None
+    )
+
+
+def test_infeasible_states():
+    mocker = FSMTester(ContradictoryMachine, final_state='C').machine_mocker
+    assert mocker.infeasible_states() == ['C', 'D']
+
+
+def test_budget_leaves_exploration_incomplete():
+    mocker = FSMTester(AssemblyLine, final_state='Finish').machine_mocker
+    exploration = mocker.explore_guards(max_assignments=BUDGET)
+    assert exploration.explored == BUDGET
+    assert not exploration.complete
+    assert mocker.infeasible_states(max_assignments=BUDGET) == []
+
+
+def test_guards_accept_single_names():
+    adapter = TransitionsAdapter(ContradictoryMachine)
+    assert adapter.get_guards() == {'ready'}
+    assert adapter.get_methods() == {'ready'}
+
+
+def test_shared_triggers_do_not_enumerate_the_product():
+    start = time.monotonic()
+    explorer = GuardExplorer(TransitionsAdapter(FanOutMachine))
+    # S1 is preempted by is_ready_1 on its own, S0 only by is_open_0
+    assert explorer.edges['A'][2].requirements == (
+        (
+            ('is_open_0', False),
+            ('is_open_1', False),
+            ('is_open_2', True),
+            ('is_ready_0', True),
+        ),
+        (
+            ('is_open_0', False),
+            ('is_open_2', True),
+            ('is_ready_0', True),
+            ('is_ready_1', False),
+        ),
+    )
+    assert all(
+        len(edge.requirements) <= PREEMPTIONS for edge in explorer.edges['A']
+    )
+    exploration = explorer.explore()
+    assert time.monotonic() - start < TIME_LIMIT
+    assert exploration.complete
+    assert len(exploration.reachable) == 1 + FAN_OUT
+
+
+def test_budget_caps_the_requirements_of_shared_triggers():
+    explorer = GuardExplorer(
+        TransitionsAdapter(FanOutMachine),
+        max_assignments=1,
+    )
+    assert all(len(edge.requirements) == 1 for edge in explorer.edges['A'])
+    assert explorer.truncated
+    assert not explorer.explore().complete
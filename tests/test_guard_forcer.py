@@ -0,0 +1,54 @@
+from machines.assembly_line_impl.main import AssemblyLine
+from fsm_tester.components.guard_forcer import GuardForcer, constant_stub
+from fsm_tester.fsm_tester import FSMTester
+
+
+class Model:
+    def __init__(self):
+        self.ready = False
+
+    def is_ready(self):
+        return self.ready
+
+
+def test_stubs_are_cached_per_guard_and_value():
+    assert constant_stub('is_ready', True) is constant_stub('is_ready', True)
+    assert constant_stub('is_ready', True) is not constant_stub(
+        'is_ready',
+        False,
+    )
+    assert constant_stub('is_ready', True)(1, key=2) is True
+
+
+def test_guards_are_patched_once_and_restored():
+    model = Model()
+    model.is_busy = lambda: True
+    is_busy = model.is_busy
+    forcer = GuardForcer(model)
+    forcer.force_all('is_ready', True)
+    stub = model.is_ready
+    forcer.force_all(['is_ready', 'is_busy'], True)
+    assert model.is_ready is stub
+    assert model.is_ready()
+    assert model.is_busy()
+    forcer.force('is_busy', False)
+    assert not model.is_busy()
+    forcer.restore()
+    assert 'is_ready' not in vars(model)
+    assert not model.is_ready()
+    assert model.is_busy is is_busy
+
+
+def test_execution_leaves_the_guards_untouched():
+    fsm_tester = FSMTester(
+        AssemblyLine,
+        final_state='Finish',
+        expected_loops=3,
+        path_strategy='exhaustive',
+    )
+    model = fsm_tester.adapter.fsm
+    before = dict(vars(model))
+    fsm_tester.run(fsm_tester.machine_execution_suite)
+    fsm_tester.run(fsm_tester.deadlock_states_suite)
+    for guard in ('is_bad_component', 'max_attempts'):
+        assert vars(model).get(guard) is before.get(guard)
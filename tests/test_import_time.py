@@ -0,0 +1,70 @@
+import json
+import os
+import pkgutil
+import subprocess
+import sys
+
+import pytest  # noqa
+import fsm_tester
+
+
+IMPORT_BUDGET = float(os.environ.get('FSM_TESTER_IMPORT_BUDGET', '0.5'))
+HEAVY_MODULES = [
+    'networkx',
+    'pydot',
+    'rich',
+    'rich.traceback',
+    'transitions',
+    'unittest.mock',
+]
+PROBE = f"""
+import json, sys, time
+start = time.perf_counter()
+import fsm_tester
+from fsm_tester import FSMTester
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    'elapsed': elapsed,
+    'loaded': [m for m in {HEAVY_MODULES!r} if m in sys.modules],
+}}))
+"""
+
+
+SUBMODULES = [
+    module.name
+    for module in pkgutil.walk_packages(fsm_tester.__path__, 'fsm_tester.')
+]
+
+
+@pytest.fixture(scope='module')
+def cold_import():
+    output = subprocess.run(
+        [sys.executable, '-c', PROBE],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_import_does_not_load_heavy_modules(cold_import):
+    assert cold_import['loaded'] == []
+
+
+def test_cold_import_within_budget(cold_import):
+    assert cold_import['elapsed'] < IMPORT_BUDGET, (
+        f'import fsm_tester took {cold_import["elapsed"]:.3f}s, '
+        f'budget is {IMPORT_BUDGET:.3f}s'
+    )
+
+
+@pytest.mark.parametrize('module', SUBMODULES)
+def test_submodule_imports_first(module):
+    """Every module can be the first one imported, without import cycles."""
+    result = subprocess.run(
+        [sys.executable, '-c', f'import {module}'],
+        capture_output=True,
+        check=False,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,66 @@
+from transitions import Machine
+from machines.assembly_line_impl.main import AssemblyLine
+from fsm_tester.components.suite_runner import SuiteRunner
+from fsm_tester.fsm_tester import FSMTester
+
+
+class GrowingMachine:
+    states = ['A', 'B', 'C']
+
+    transitions = [
+        {'trigger': 'go', 'source': 'A', 'dest': 'B'},
+        {'trigger': 'back', 'source': 'B', 'dest': 'A'},
+    ]
+
+    def __init__(self):
+        self.machine = Machine(
+            model=self,
+            states=GrowingMachine.states,
+            transitions=GrowingMachine.transitions,
+            initial='A',
+        )
+
+
+def passes(suite):
+    _, result = SuiteRunner(verbosity=0).run(suite)
+    return result.wasSuccessful()
+
+
+def test_construction_builds_nothing():
+    fsm_tester = FSMTester(AssemblyLine, final_state='Finish')
+    built = vars(fsm_tester)
+    assert 'compact_graph' not in built
+    assert 'machine_mocker' not in built
+    assert not fsm_tester._suites
+
+
+def test_suites_are_memoized():
+    fsm_tester = FSMTester(AssemblyLine, final_state='Finish')
+    suite = fsm_tester.machine_execution_suite
+    assert fsm_tester.machine_execution_suite is suite
+    assert 'machine_mocker' in vars(fsm_tester)
+    assert 'sink_states_suite' not in fsm_tester._suites
+    fsm_tester.invalidate()
+    assert fsm_tester.machine_execution_suite is not suite
+
+
+def test_changed_machine_rebuilds_the_suites():
+    fsm_tester = FSMTester(GrowingMachine, final_state='A')
+    unreachable = fsm_tester.unreachable_states_suite
+    assert not passes(unreachable)
+    GrowingMachine.transitions.append(
+        {'trigger': 'skip', 'source': 'A', 'dest': 'C'},
+    )
+    try:
+        suite = fsm_tester.unreachable_states_suite
+        assert suite is not unreachable
+        assert passes(suite)
+    finally:
+        GrowingMachine.transitions.pop()
+
+
+def test_static_suites_do_not_build_the_mocker():
+    fsm_tester = FSMTester(AssemblyLine, final_state='Finish')
+    fsm_tester.run(fsm_tester.sink_states_suite)
+    assert 'machine_mocker' not in vars(fsm_tester)
+    assert not hasattr(fsm_tester.sink_states_suite, 'callback_report')
@@ -0,0 +1,81 @@
+import unittest
+import pytest
+from transitions import Machine
+from machines.assembly_line_impl.main import AssemblyLine
+from machines.simple.wildcard_machine import WildcardMachine
+from fsm_tester.components.compact_graph import CompactGraph
+from fsm_tester.fsm_tester import FSMTester
+
+
+# one tree from the initial state, one reverse tree towards the final state
+SHARED_TRAVERSALS = 2
+
+
+class IsolatedLoopMachine:
+    """A and B loop into each other and lead to Finish, but are never
+    reached from Initial."""
+
+    states = ['Initial', 'A', 'B', 'Finish']
+
+    transitions = [
+        {'trigger': 'finish', 'source': 'Initial', 'dest': 'Finish'},
+        {'trigger': 'to_B', 'source': 'A', 'dest': 'B'},
+        {'trigger': 'to_A', 'source': 'B', 'dest': 'A'},
+        {'trigger': 'finish', 'source': 'A', 'dest': 'Finish'},
+    ]
+
+    def __init__(self):
+        self.machine = Machine(
+            model=self,
+            states=IsolatedLoopMachine.states,
+            transitions=IsolatedLoopMachine.transitions,
+            initial='Initial',
+        )
+
+
+def test_loop_tests_share_two_traversals(monkeypatch):
+    fsm_tester = FSMTester(
+        WildcardMachine,
+        final_state='Finish',
+        expected_loops=1,
+        deadlock_mode='cycles',
+    )
+    traversals = list()
+    bfs = CompactGraph._bfs
+
+    def counting_bfs(self, *args):
+        traversals.append(args[0])
+        return bfs(self, *args)
+
+    monkeypatch.setattr(CompactGraph, '_bfs', counting_bfs)
+    suite = fsm_tester.deadlock_states_suite
+    result = unittest.TestResult()
+    for test in suite:
+        test.run(result)
+    assert result.testsRun > SHARED_TRAVERSALS
+    assert len(traversals) == SHARED_TRAVERSALS
+
+
+def test_loop_trees_give_shortest_paths():
+    fsm_tester = FSMTester(AssemblyLine, final_state='Finish')
+    mocker = fsm_tester.machine_mocker
+    graph = mocker.graph
+    to_loop_tree, escape_tree = mocker._loop_trees()
+    for state in graph.nodes:
+        path_to_loop = graph.tree_path(to_loop_tree, state)
+        shortest = graph.shortest_path('Initial', state)
+        assert len(path_to_loop) == len(shortest)
+        escape_path = graph.tree_path(escape_tree, state, reverse=True)
+        assert escape_path[0] == state
+        assert escape_path[-1] == 'Finish'
+        assert len(escape_path) == len(graph.shortest_path(state, 'Finish'))
+
+
+def test_unreachable_loops_fail_cleanly():
+    fsm_tester = FSMTester(
+        IsolatedLoopMachine,
+        final_state='Finish',
+        expected_loops=1,
+    )
+    with pytest.raises(AssertionError, match='unreachable'):
+        fsm_tester.machine_mocker.check_loop(['A', 'B'])
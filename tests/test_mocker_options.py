@@ -0,0 +1,33 @@
+import pytest
+from machines.assembly_line_impl.main import AssemblyLine
+from fsm_tester.entities import MockerOptions, PathBudget
+from fsm_tester.fsm_tester import FSMTester
+
+
+def test_keywords_override_the_options():
+    options = MockerOptions(expected_loops=2, path_strategy='exhaustive')
+    fsm_tester = FSMTester(
+        AssemblyLine,
+        'Finish',
+        options=options,
+        deadlock_mode='cycles',
+    )
+    assert fsm_tester.options == MockerOptions(
+        expected_loops=2,
+        path_strategy='exhaustive',
+        deadlock_mode='cycles',
+    )
+    assert fsm_tester.options.path_budget == PathBudget()
+    mocker = fsm_tester.machine_mocker
+    assert mocker.options is fsm_tester.options
+    assert mocker.deadlock_mode == 'cycles'
+
+
+def test_options_are_validated_once():
+    with pytest.raises(ValueError, match='not recognized'):
+        MockerOptions(model_strategy='copy')
+    with pytest.raises(ValueError, match='not in'):
+        MockerOptions(cross_check_ratio=2.0)
+    # as before the options were grouped, other keywords are ignored
+    fsm_tester = FSMTester(AssemblyLine, 'Finish', execution='compiled')
+    assert fsm_tester.options == MockerOptions()
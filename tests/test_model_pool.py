@@ -0,0 +1,143 @@
+import pytest
+from transitions import Machine
+from machines.assembly_line_impl.main import AssemblyLine
+from fsm_tester.fsm_tester import FSMTester
+
+
+DISCARD_PATH = [
+    'Initial',
+    'WaitOp',
+    'PickComponent',
+    'InspectComponent',
+    'DiscardComponent',
+]
+
+
+class HistoryMachine:
+    """Records every state it enters in a list attribute."""
+
+    states = ['A', 'B', 'C', 'D', 'Finish']
+
+    transitions = [
+        {'trigger': 'start', 'source': 'A', 'dest': 'B'},
+        {'trigger': 'left', 'source': 'B', 'dest': 'C'},
+        {'trigger': 'right', 'source': 'B', 'dest': 'D'},
+        {'trigger': 'finish', 'source': 'C', 'dest': 'Finish'},
+        {'trigger': 'finish', 'source': 'D', 'dest': 'Finish'},
+    ]
+
+    def __init__(self):
+        self.history = list()
+        self.machine = Machine(
+            model=self,
+            states=HistoryMachine.states,
+            transitions=HistoryMachine.transitions,
+            initial='A',
+            after_state_change='record',
+        )
+
+    def record(self):
+        self.history.append(self.state)
+
+
+def clear_history(model):
+    model.history = list()
+
+
+def reset_counters(model):
+    model.defective_components_count = 0
+
+
+def discarded_after_two_tests(**kwargs):
+    fsm_tester = FSMTester(AssemblyLine, final_state='Finish', **kwargs)
+    mocker = fsm_tester.machine_mocker
+    mocker.check_path(DISCARD_PATH)
+    first = fsm_tester.adapter.fsm
+    mocker.reset_model()
+    return fsm_tester, first
+
+
+def test_reset_strategy_shares_the_model():
+    fsm_tester, first = discarded_after_two_tests()
+    assert fsm_tester.adapter.fsm is first
+    assert first.defective_components_count == 1
+
+
+def test_clone_strategy_recycles_a_clean_model():
+    fsm_tester, first = discarded_after_two_tests(model_strategy='clone')
+    model = fsm_tester.adapter.fsm
+    assert model is first
+    assert model.defective_components_count == 0
+    assert model.state == 'Initial'
+    assert fsm_tester.machine_mocker.model_pool.instances_created == 0
+
+
+def test_clones_are_independent():
+    fsm_tester = FSMTester(
+        AssemblyLine,
+        final_state='Finish',
+        model_strategy='clone',
+    )
+    pool = fsm_tester.machine_mocker.model_pool
+    clone = pool.acquire()
+    assert clone is not fsm_tester.adapter.fsm
+    assert clone.machine.models == [clone]
+    clone.initializing()
+    assert clone.state == 'WaitOp'
+    assert fsm_tester.adapter.fsm.state == 'Initial'
+
+
+@pytest.mark.parametrize(
+    ('reset_hook', 'recycled'),
+    [(None, False), (reset_counters, True)],
+)
+def test_factory_strategy(reset_hook, recycled):
+    fsm_tester, first = discarded_after_two_tests(
+        model_strategy='factory',
+        reset_hook=reset_hook,
+    )
+    model = fsm_tester.adapter.fsm
+    assert (model is first) == recycled
+    assert model.defective_components_count == 0
+    fsm_tester.machine_mocker.check_path(DISCARD_PATH)
+    assert fsm_tester.adapter.fsm.defective_components_count == 1
+
+
+def test_suites_pass_with_isolated_models():
+    fsm_tester = FSMTester(
+        AssemblyLine,
+        final_state='Finish',
+        expected_loops=3,
+        path_strategy='exhaustive',
+        deadlock_mode='cycles',
+        model_strategy='factory',
+    )
+    fsm_tester.run(fsm_tester.machine_execution_suite)
+    fsm_tester.run(fsm_tester.deadlock_states_suite)
+
+
+@pytest.mark.parametrize(
+    'options',
+    [
+        dict(reset_hook=clear_history),
+        dict(model_strategy='factory'),
+        dict(model_strategy='clone'),
+    ],
+)
+def test_shared_prefixes_do_not_leak_attributes(options):
+    fsm_tester = FSMTester(
+        HistoryMachine,
+        final_state='Finish',
+        path_strategy='exhaustive',
+        **options,
+    )
+    suite = fsm_tester.machine_execution_suite
+    mocker = fsm_tester.machine_mocker
+    paths = [path for _, _, path in suite.specs]
+    assert suite.executor is not None
+    for path in paths:
+        mocker.check_path(path, executor=suite.executor)
+        assert fsm_tester.adapter.fsm.history == path[1:]
+    assert suite.executor.transitions_executed < sum(
+        len(path) - 1 for path in paths
+    )
@@ -1,5 +1,6 @@
 import pytest  # noqa
 from machines.defective.nondeterministic import NondeterministicMachine
+from fsm_tester.entities import FSMTransition
 from fsm_tester.fsm_tester import FSMTester
 
 
@@ -36,3 +37,29 @@ def test_nondeterministic_transition_suite(fsm_tester):
 def test_machine_execution_suite(fsm_tester):
     suite = fsm_tester.machine_execution_suite
     fsm_tester.run(suite)
+
+
+def test_guard_signature_ignores_triggers(fsm_tester):
+    analyzer = fsm_tester.graph_analyzer
+    transitions = [
+        # distinct triggers sharing their callbacks conflict
+        FSMTransition('go_to_F', 'E', 'F', None, None, None, None),
+        FSMTransition('end_operation', 'E', 'Finish', None, None, None, None),
+        # the same transition declared twice does not
+        FSMTransition('go_to_E', 'D', 'E', None, None, None, None),
+        FSMTransition('go_to_E', ['C', 'D'], 'E', None, None, None, None),
+        # distinct guards do not either
+        FSMTransition('go_to_B', 'A', 'B', 'ready', None, None, None),
+        FSMTransition('go_to_C', 'A', 'C', None, 'ready', None, None),
+    ]
+    assert analyzer.guard_signature(
+        transitions[0],
+    ) == analyzer.guard_signature(transitions[1])
+    suite = analyzer.nondeterministic_transition_suite(transitions)
+    failed = list()
+    for test in suite:
+        try:
+            test.function()
+        except AssertionError:
+            failed.append(test.name)
+    assert failed == ['test_nondeterministic_E']
@@ -0,0 +1,150 @@
+import pytest
+from machines.assembly_line_impl.main import AssemblyLine
+from machines.defective.sink import SinkStateMachine
+from fsm_tester.components import parallel_runner
+from fsm_tester.components.parallel_runner import ParallelRunner
+from fsm_tester.fsm_tester import FSMTester
+
+
+def unbounded_loops(mocker):
+    mocker.expected_loops = 0
+
+
+@pytest.fixture
+def fsm_tester():
+    return FSMTester(
+        AssemblyLine,
+        final_state='Finish',
+        expected_loops=3,
+        path_strategy='exhaustive',
+        deadlock_mode='cycles',
+    )
+
+
+def test_outcomes_follow_suite_order(fsm_tester):
+    suite = fsm_tester.machine_execution_suite
+    runner = ParallelRunner(
+        fsm_module=fsm_tester.fsm_module,
+        dialect=fsm_tester.dialect,
+        mocker_options=fsm_tester.mocker_options,
+        workers=2,
+        chunk_size=3,
+        warm_up=unbounded_loops,
+    )
+    outcomes = runner.run(suite.specs)
+    assert [outcome.name for outcome in outcomes] == [
+        name for name, _, _ in suite.specs
+    ]
+    assert all(outcome.status == 'ok' for outcome in outcomes)
+
+
+def test_workers_are_not_forked(fsm_tester):
+    assert parallel_runner._start_method() in {'forkserver', 'spawn'}
+    fsm_tester.run_parallel(fsm_tester.machine_execution_suite, workers=2)
+    # the mocker of the workers only lives in the worker processes
+    assert parallel_runner._Worker.mocker is None
+
+
+def test_parallel_suites_pass(fsm_tester):
+    fsm_tester.run_parallel(fsm_tester.machine_execution_suite, workers=2)
+    fsm_tester.run_parallel(fsm_tester.deadlock_states_suite, workers=2)
+
+
+def test_parallel_failures_are_reported():
+    fsm_tester = FSMTester(
+        SinkStateMachine,
+        final_state='G',
+        expected_loops=1,
+    )
+    with pytest.raises(AssertionError, match='Deadlock Detected'):
+        fsm_tester.run_parallel(fsm_tester.deadlock_states_suite, workers=2)
+
+
+def test_static_suites_run_serially(fsm_tester):
+    fsm_tester.run_parallel(fsm_tester.unreachable_states_suite, workers=2)
+
+
+def test_run_tests_runs_every_suite(fsm_tester, capsys):
+    fsm_tester.run_tests(workers=2)
+    output = capsys.readouterr().out
+    total = len(fsm_tester.suites)
+    assert output.count('FSMTester: Running') == total
+    assert f'{total}/{total} suites passed' in output
+
+
+def test_run_tests_reports_every_failed_suite():
+    fsm_tester = FSMTester(
+        SinkStateMachine,
+        final_state='Complete',
+        expected_loops=1,
+    )
+    with pytest.raises(AssertionError, match='Sink States Detected'):
+        fsm_tester.run_tests(workers=2)
+
+
+@pytest.mark.parametrize(
+    'min_pooled_tests',
+    [0, parallel_runner.MIN_POOLED_TESTS],
+)
+def test_run_tests_reports_callback_timings(
+    monkeypatch,
+    capsys,
+    min_pooled_tests,
+):
+    monkeypatch.setattr(parallel_runner, 'MIN_POOLED_TESTS', min_pooled_tests)
+    fsm_tester = FSMTester(
+        AssemblyLine,
+        final_state='Finish',
+        callback_policy='timed',
+    )
+    fsm_tester.run_tests(workers=2)
+    assert 'print_state: ' in capsys.readouterr().out
+    assert fsm_tester.machine_execution_suite.callback_report.durations
+
+
+def test_unpicklable_machines_run_serially(monkeypatch):
+    monkeypatch.setattr(parallel_runner, 'MIN_POOLED_TESTS', 0)
+
+    class LocalAssemblyLine(AssemblyLine):
+        pass
+
+    fsm_tester = FSMTester(LocalAssemblyLine, final_state='Finish')
+    runner = ParallelRunner(
+        fsm_module=fsm_tester.fsm_module,
+        dialect=fsm_tester.dialect,
+        mocker_options=fsm_tester.mocker_options,
+    )
+    assert not runner.can_pool(fsm_tester.machine_execution_suite.specs)
+    fsm_tester.run_tests(workers=2)
+
+
+def test_pooled_outcomes_are_streamed(tmp_path, monkeypatch):
+    fsm_tester = FSMTester(
+        AssemblyLine,
+        final_state='Finish',
+        path_strategy='exhaustive',
+        save_report=True,
+        report_dir=tmp_path,
+    )
+    suite = fsm_tester.machine_execution_suite
+    path = tmp_path / f'report_{suite.suite_name}.ndjson'
+    submit = ParallelRunner.submit
+    written = list()
+
+    def watch(self, specs, callback_report=None):
+        # the report is open before the first test is sent to a worker
+        assert path.exists()
+        collect = submit(self, specs, callback_report)
+
+        def stream():
+            for outcome in collect():
+                suite.report._file.flush()
+                written.append(len(path.read_text().splitlines()))
+                yield outcome
+
+        return stream
+
+    monkeypatch.setattr(ParallelRunner, 'submit', watch)
+    fsm_tester.run_parallel(suite, workers=2, chunk_size=1)
+    # the suite record, then every outcome before the next one arrives
+    assert written == list(range(1, len(suite.specs) + 1))
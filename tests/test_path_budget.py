@@ -0,0 +1,150 @@
+import random
+import time
+from transitions import Machine
+from machines.assembly_line_impl.main import AssemblyLine
+from machines.defective.sink import SinkStateMachine
+from fsm_tester.entities import PathBudget
+from fsm_tester.fsm_tester import FSMTester
+
+
+CLIQUE = [f'S{idx}' for idx in range(10)]
+TIME_BUDGET = 0.1
+# the enumeration may overrun its budget by a sampling pass per state
+TIME_LIMIT = 1.0
+MAX_PATHS = 3
+
+
+class CliqueMachine:
+    """Every state of a 10-clique leads to every other one, and Island is
+    never reached."""
+
+    states = [*CLIQUE, 'Island']
+
+    transitions = [
+        {'trigger': f'to_{dest}', 'source': source, 'dest': dest}
+        for source in CLIQUE
+        for dest in CLIQUE
+        if source != dest
+    ]
+
+    def __init__(self):
+        self.machine = Machine(
+            model=self,
+            states=CliqueMachine.states,
+            transitions=CliqueMachine.transitions,
+            initial='S0',
+        )
+
+
+def create_tester(budget, **kwargs):
+    return FSMTester(
+        AssemblyLine,
+        final_state='Finish',
+        expected_loops=3,
+        path_strategy='exhaustive',
+        path_budget=budget,
+        **kwargs,
+    )
+
+
+def test_paths_over_budget_are_sampled():
+    budget = PathBudget(max_paths_per_state=1, seed=7)
+    fsm_tester = create_tester(budget)
+    paths, sampled_states = fsm_tester.machine_mocker._find_budgeted_paths()
+    assert all(len(state_paths) <= 1 for state_paths in paths.values())
+    # Finish is reached through packaging or through calibration
+    assert 'Finish' in sampled_states
+    suite = fsm_tester.machine_execution_suite
+    assert suite.coverage.sampled_states == sampled_states
+    assert not suite.coverage.complete
+    fsm_tester.run(suite)
+
+
+def test_sampling_is_reproducible():
+    budget = PathBudget(max_paths_per_state=1, time_budget=0.0, seed=3)
+    first = create_tester(budget).machine_mocker._find_budgeted_paths()
+    second = create_tester(budget).machine_mocker._find_budgeted_paths()
+    assert first == second
+
+
+def test_max_path_length_is_honoured():
+    budget = PathBudget(max_path_length=3)
+    fsm_tester = create_tester(budget)
+    paths, _ = fsm_tester.machine_mocker._find_budgeted_paths()
+    planned = [path for state_paths in paths.values() for path in state_paths]
+    assert planned
+    assert all(len(path) - 1 <= budget.max_path_length for path in planned)
+    coverage = fsm_tester.machine_execution_suite.coverage
+    assert coverage.states_covered < coverage.states_total
+
+
+def test_unbounded_suites_report_coverage():
+    fsm_tester = create_tester(None, deadlock_mode='cycles')
+    coverage = fsm_tester.machine_execution_suite.coverage
+    # ReturnToHome -> WaitOp closes a loop, so no simple path takes it
+    assert coverage.states_covered == coverage.states_total
+    assert coverage.transitions_covered == coverage.transitions_total - 1
+    planned = fsm_tester.machine_mocker.unreachable_states_suite('coverage')
+    assert planned.coverage.complete
+    assert fsm_tester.deadlock_states_suite.coverage.complete
+
+
+def test_loops_fall_back_to_component_witnesses():
+    fsm_tester = FSMTester(
+        SinkStateMachine,
+        final_state='G',
+        deadlock_mode='cycles',
+        path_budget=PathBudget(time_budget=0.0),
+    )
+    loops, sampled_states = fsm_tester.machine_mocker._find_budgeted_loops()
+    components = fsm_tester.machine_mocker._find_deadlock_components()
+    assert len(loops) == len(components)
+    assert sampled_states
+    assert fsm_tester.deadlock_states_suite.coverage.states_covered > 0
+
+
+def test_time_budget_bounds_the_enumeration():
+    fsm_tester = FSMTester(
+        CliqueMachine,
+        final_state='S9',
+        path_strategy='exhaustive',
+        path_budget=PathBudget(time_budget=TIME_BUDGET),
+    )
+    mocker = fsm_tester.machine_mocker
+    start = time.monotonic()
+    paths, sampled_states = mocker._find_budgeted_paths()
+    assert time.monotonic() - start < TIME_LIMIT
+    assert paths['Island'] == []
+    # the paths enumerated before the deadline are kept, not resampled
+    assert 'S1' in sampled_states
+    assert len(paths['S1']) > len(CLIQUE) ** 2
+    assert len({tuple(path) for path in paths['S1']}) == len(paths['S1'])
+
+
+def test_exhausted_time_budget_keeps_shortest_paths():
+    fsm_tester = FSMTester(
+        CliqueMachine,
+        final_state='S9',
+        path_strategy='exhaustive',
+        path_budget=PathBudget(time_budget=0),
+    )
+    paths, sampled_states = fsm_tester.machine_mocker._find_budgeted_paths()
+    assert paths['S0'] == []
+    assert paths['Island'] == []
+    for state in CLIQUE[1:]:
+        assert state in sampled_states
+        assert paths[state] == [['S0', state]]
+
+
+def test_sampling_tops_up_found_paths():
+    fsm_tester = create_tester(PathBudget(max_paths_per_state=MAX_PATHS))
+    mocker = fsm_tester.machine_mocker
+    found = [mocker.graph.shortest_path('Initial', 'Finish')]
+    paths = mocker._sample_paths(
+        'Finish',
+        count=MAX_PATHS,
+        rng=random.Random(0),
+        found=found,
+    )
+    assert paths[0] == found[0]
+    assert len(paths) <= len({tuple(path) for path in paths}) <= MAX_PATHS
@@ -0,0 +1,50 @@
+import pytest  # noqa
+from machines.assembly_line_impl.main import AssemblyLine
+from fsm_tester.fsm_tester import FSMTester
+
+
+@pytest.fixture
+def fsm_tester():
+    return FSMTester(
+        AssemblyLine,
+        final_state='Finish',
+        expected_loops=3,
+    )
+
+
+def test_shared_prefixes_are_executed_once(fsm_tester):
+    suite = fsm_tester.machine_mocker.unreachable_states_suite(
+        strategy='exhaustive',
+    )
+    paths = [
+        path
+        for state_paths in fsm_tester.machine_mocker._find_paths().values()
+        for path in state_paths
+    ]
+    trie_edges = {
+        tuple(path[: depth + 1])
+        for path in paths
+        for depth in range(1, len(path))
+    }
+    fsm_tester.run(suite)
+    assert suite.executor.transitions_executed == len(trie_edges)
+    assert len(trie_edges) < sum(len(path) - 1 for path in paths)
+
+
+def test_snapshot_hooks_are_used(fsm_tester):
+    calls = list()
+
+    def snapshot(fsm):
+        calls.append('snapshot')
+        return dict(vars(fsm))
+
+    def restore(fsm, snapshot):
+        calls.append('restore')
+        vars(fsm).clear()
+        vars(fsm).update(snapshot)
+
+    fsm_tester.machine_mocker.snapshot_hook = snapshot
+    fsm_tester.machine_mocker.restore_hook = restore
+    fsm_tester.run(fsm_tester.machine_execution_suite)
+    assert 'snapshot' in calls
+    assert 'restore' in calls
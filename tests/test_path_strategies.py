@@ -0,0 +1,38 @@
+import pytest
+from machines.assembly_line_impl.main import AssemblyLine
+from fsm_tester.fsm_tester import FSMTester
+
+
+@pytest.fixture
+def fsm_tester():
+    return FSMTester(
+        AssemblyLine,
+        final_state='Finish',
+        expected_loops=3,
+    )
+
+
+def test_coverage_paths_cover_every_transition(fsm_tester):
+    paths = fsm_tester.machine_mocker._find_coverage_paths()
+    covered = {
+        (source, dest)
+        for state_paths in paths.values()
+        for path in state_paths
+        for source, dest in zip(path, path[1:])
+    }
+    expected = {(tr['source'], tr['dest']) for tr in AssemblyLine.transitions}
+    assert covered == expected
+
+
+def test_exhaustive_strategy_is_opt_in(fsm_tester):
+    coverage = fsm_tester.machine_mocker.unreachable_states_suite()
+    exhaustive = fsm_tester.machine_mocker.unreachable_states_suite(
+        strategy='exhaustive',
+    )
+    assert coverage.countTestCases() < exhaustive.countTestCases()
+    fsm_tester.run(exhaustive)
+
+
+def test_unknown_strategy_is_rejected(fsm_tester):
+    with pytest.raises(ValueError, match='not recognized'):
+        fsm_tester.machine_mocker.unreachable_states_suite(strategy='all')
@@ -0,0 +1,87 @@
+import json
+import pytest
+from machines.defective.sink import SinkStateMachine
+from fsm_tester.components.report_writer import ReportWriter
+from fsm_tester.fsm_tester import FSMTester
+
+SUITE_NAME = 'sink_states_suite'
+
+
+def read_report(path):
+    with open(path, encoding='utf-8') as report:
+        return [json.loads(line) for line in report]
+
+
+def test_records_are_streamed(tmp_path):
+    path = tmp_path / 'report.ndjson'
+    writer = ReportWriter(path, SUITE_NAME)
+    writer.test('test_passing', 'ok')
+    writer.test('test_failing', 'fail', 'AssertionError')
+    # the tests are on disk before the suite is done
+    writer._file.flush()
+    assert len(read_report(path)) == 1 + writer.tests
+    writer.close(successful=False, coverage='states 1/1')
+    suite, *tests, summary = read_report(path)
+    assert suite == {'event': 'suite', 'suite': SUITE_NAME}
+    assert [test['status'] for test in tests] == ['ok', 'fail']
+    assert tests[1]['message'] == 'AssertionError'
+    assert summary['failures'] == 1
+    assert not summary['successful']
+    assert summary['coverage'] == 'states 1/1'
+
+
+def test_console_shows_only_failures(tmp_path, capsys):
+    fsm_tester = FSMTester(
+        SinkStateMachine,
+        final_state='Complete',
+        save_report=True,
+        report_dir=tmp_path,
+    )
+    suite = fsm_tester.sink_states_suite
+    with pytest.raises(AssertionError):
+        fsm_tester.run(suite)
+    output = capsys.readouterr().out
+    assert ' ... ok' not in output
+    assert 'Ran ' in output
+    _, *tests, summary = read_report(tmp_path / f'report_{SUITE_NAME}.ndjson')
+    assert len(tests) == suite.countTestCases()
+    failed = [test['name'] for test in tests if test['status'] != 'ok']
+    assert failed
+    assert all(name in output for name in failed)
+    assert summary['failures'] == len(failed)
+
+
+def test_every_suite_has_its_own_report(tmp_path):
+    fsm_tester = FSMTester(
+        SinkStateMachine,
+        final_state='Complete',
+        save_report=True,
+        report_dir=tmp_path,
+    )
+    with pytest.raises(AssertionError):
+        fsm_tester.run_tests(workers=2)
+    for name in FSMTester.default_suites:
+        records = read_report(tmp_path / f'report_{name}.ndjson')
+        assert records[0] == {'event': 'suite', 'suite': name}
+        assert records[-1]['event'] == 'summary'
+
+
+def test_interrupted_runs_close_the_report(tmp_path, monkeypatch):
+    fsm_tester = FSMTester(
+        SinkStateMachine,
+        final_state='Complete',
+        save_report=True,
+        report_dir=tmp_path,
+    )
+
+    def interrupt(*args):
+        raise KeyboardInterrupt
+
+    suite = fsm_tester.sink_states_suite
+    monkeypatch.setattr(fsm_tester, '_report_suite', interrupt)
+    with pytest.raises(KeyboardInterrupt):
+        fsm_tester.run(suite)
+    assert suite.report._file.closed
+    summary = read_report(tmp_path / f'report_{SUITE_NAME}.ndjson')[-1]
+    assert summary['event'] == 'summary'
+    assert not summary['successful']
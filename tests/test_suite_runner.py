@@ -0,0 +1,31 @@
+import pytest
+from machines.assembly_line_impl.main import AssemblyLine
+from machines.defective.sink import SinkStateMachine
+from fsm_tester.components.suite_runner import SuiteRunner
+from fsm_tester.fsm_tester import FSMTester
+
+
+def test_one_result_per_suite():
+    fsm_tester = FSMTester(SinkStateMachine, final_state='Complete')
+    suite = fsm_tester.sink_states_suite
+    output, result = SuiteRunner(verbosity=2).run(suite)
+    assert result.testsRun == suite.countTestCases()
+    assert not result.wasSuccessful()
+    assert output.count('Ran ') == 1
+    assert output.count(' ... ') == suite.countTestCases()
+    failed = SuiteRunner.failed_tests(result)
+    assert [test.id() for test in failed] == [
+        test.id() for test, _ in result.failures
+    ]
+
+
+def test_run_prints_a_single_summary(capsys):
+    fsm_tester = FSMTester(AssemblyLine, final_state='Finish')
+    fsm_tester.run(fsm_tester.machine_execution_suite)
+    assert capsys.readouterr().out.count('Ran ') == 1
+
+
+def test_run_still_fails_the_suite():
+    fsm_tester = FSMTester(SinkStateMachine, final_state='Complete')
+    with pytest.raises(AssertionError, match='Sink States Detected'):
+        fsm_tester.run(fsm_tester.sink_states_suite)